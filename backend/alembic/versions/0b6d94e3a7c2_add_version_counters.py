@@ -0,0 +1,30 @@
+"""add_version_counters
+
+Revision ID: 0b6d94e3a7c2
+Revises: f7c3a19d2b64
+Create Date: 2026-10-17 11:04:18.529734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6d94e3a7c2'
+down_revision: Union[str, Sequence[str], None] = 'f7c3a19d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('households', sa.Column('tags_version', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('shopping_lists', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('shopping_lists', 'version')
+    op.drop_column('households', 'tags_version')
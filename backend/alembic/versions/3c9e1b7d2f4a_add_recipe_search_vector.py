@@ -0,0 +1,51 @@
+"""add_recipe_search_vector
+
+Revision ID: 3c9e1b7d2f4a
+Revises: 1411f7138911
+Create Date: 2026-10-16 09:12:41.208315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9e1b7d2f4a'
+down_revision: Union[str, Sequence[str], None] = '1411f7138911'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Mirrors app.services.search.search_document(); kept inline so the migration
+# doesn't change if the application expression does.
+BACKFILL = """
+UPDATE recipes r SET search_vector =
+    setweight(to_tsvector('english', coalesce(r.title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce((
+        SELECT string_agg(t.name, ' ') FROM tags t
+        JOIN recipe_tags rt ON rt.tag_id = t.id WHERE rt.recipe_id = r.id
+    ), '')), 'B') ||
+    setweight(to_tsvector('english', coalesce((
+        SELECT string_agg(i.name, ' ') FROM ingredients i WHERE i.recipe_id = r.id
+    ), '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(r.description, '')), 'C') ||
+    setweight(to_tsvector('english', coalesce((
+        SELECT string_agg(concat_ws(' ', s.title, s.description), ' ') FROM steps s WHERE s.recipe_id = r.id
+    ), '')), 'D')
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('recipes', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute(BACKFILL)
+    op.create_index('ix_recipes_search_vector', 'recipes', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recipes_search_vector', table_name='recipes', postgresql_using='gin')
+    op.drop_column('recipes', 'search_vector')
@@ -0,0 +1,36 @@
+"""add_category_overrides
+
+Revision ID: 5e8b2d4f7a91
+Revises: 0b6d94e3a7c2
+Create Date: 2026-10-17 14:22:05.318402
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e8b2d4f7a91'
+down_revision: Union[str, Sequence[str], None] = '0b6d94e3a7c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('category_overrides',
+    sa.Column('household_id', sa.String(), nullable=False),
+    sa.Column('term', sa.String(length=500), nullable=False),
+    sa.Column('category', sa.String(length=100), nullable=False),
+    sa.ForeignKeyConstraint(['household_id'], ['households.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('household_id', 'term')
+    )
+    op.add_column('households', sa.Column('category_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('households', 'category_version')
+    op.drop_table('category_overrides')
@@ -0,0 +1,32 @@
+"""add_trigram_search_indexes
+
+Revision ID: 7d4a2e9c1b86
+Revises: 3c9e1b7d2f4a
+Create Date: 2026-10-16 11:03:27.640192
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d4a2e9c1b86'
+down_revision: Union[str, Sequence[str], None] = '3c9e1b7d2f4a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index('ix_recipes_title_trgm', 'recipes', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_ingredients_name_trgm', 'ingredients', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The pg_trgm extension is left installed; other objects may depend on it.
+    op.drop_index('ix_ingredients_name_trgm', table_name='ingredients', postgresql_using='gin')
+    op.drop_index('ix_recipes_title_trgm', table_name='recipes', postgresql_using='gin')
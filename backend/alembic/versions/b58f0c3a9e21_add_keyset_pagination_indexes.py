@@ -0,0 +1,30 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: b58f0c3a9e21
+Revises: 7d4a2e9c1b86
+Create Date: 2026-10-16 13:47:09.115873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b58f0c3a9e21'
+down_revision: Union[str, Sequence[str], None] = '7d4a2e9c1b86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_recipes_household_id_created_at_id', 'recipes', ['household_id', sa.text('created_at DESC'), 'id'], unique=False)
+    op.create_index('ix_shopping_lists_household_id_created_at_id', 'shopping_lists', ['household_id', sa.text('created_at DESC'), 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_shopping_lists_household_id_created_at_id', table_name='shopping_lists')
+    op.drop_index('ix_recipes_household_id_created_at_id', table_name='recipes')
@@ -0,0 +1,42 @@
+"""add_shopping_changefeed
+
+Revision ID: c81f4e2a9d37
+Revises: 5e8b2d4f7a91
+Create Date: 2026-10-17 16:48:31.027415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f4e2a9d37'
+down_revision: Union[str, Sequence[str], None] = '5e8b2d4f7a91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('shopping_items', sa.Column('seq', sa.Integer(), server_default='0', nullable=False))
+    op.create_index('ix_shopping_items_list_id_seq', 'shopping_items', ['list_id', 'seq'], unique=False)
+    op.drop_index('ix_shopping_items_list_id', table_name='shopping_items')
+    op.create_table('shopping_item_tombstones',
+    sa.Column('list_id', sa.String(), nullable=False),
+    sa.Column('item_id', sa.String(), nullable=False),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['list_id'], ['shopping_lists.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('list_id', 'item_id')
+    )
+    op.create_index('ix_shopping_item_tombstones_list_id_seq', 'shopping_item_tombstones', ['list_id', 'seq'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_shopping_item_tombstones_list_id_seq', table_name='shopping_item_tombstones')
+    op.drop_table('shopping_item_tombstones')
+    op.create_index('ix_shopping_items_list_id', 'shopping_items', ['list_id'], unique=False)
+    op.drop_index('ix_shopping_items_list_id_seq', table_name='shopping_items')
+    op.drop_column('shopping_items', 'seq')
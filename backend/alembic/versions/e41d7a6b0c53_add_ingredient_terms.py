@@ -0,0 +1,82 @@
+"""add_ingredient_terms
+
+Revision ID: e41d7a6b0c53
+Revises: b58f0c3a9e21
+Create Date: 2026-10-16 15:22:54.930417
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41d7a6b0c53'
+down_revision: Union[str, Sequence[str], None] = 'b58f0c3a9e21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors app.utils.terms.ingredient_term() as of this revision; kept inline so the
+# migration doesn't change if the application's normalizer does.
+_PARENTHETICAL = re.compile(r"\([^)]*\)")
+_NON_WORD = re.compile(r"[^a-z\s-]+")
+_DESCRIPTORS = frozenset({
+    "fresh", "freshly", "large", "medium", "small", "extra", "chopped", "minced",
+    "diced", "sliced", "grated", "shredded", "crushed", "peeled", "softened",
+    "melted", "divided", "finely", "roughly", "thinly", "optional", "to", "taste",
+    "for", "serving", "garnish", "about", "whole", "organic", "and", "or",
+})
+_KEEP_S = frozenset({"asparagus", "hummus", "couscous", "molasses", "swiss", "citrus", "grits"})
+
+
+def _singular(word: str) -> str:
+    if word in _KEEP_S or len(word) <= 3 or word.endswith("ss"):
+        return word
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith("oes"):
+        return word[:-2]
+    if word.endswith("s"):
+        return word[:-1]
+    return word
+
+
+def ingredient_term(name: str | None) -> str | None:
+    if not name:
+        return None
+    text = _PARENTHETICAL.sub(" ", name.lower()).split(",")[0]
+    words = [_singular(w) for w in _NON_WORD.sub(" ", text).split() if w not in _DESCRIPTORS]
+    return " ".join(words) or None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    ingredient_terms = op.create_table('ingredient_terms',
+    sa.Column('household_id', sa.String(), nullable=False),
+    sa.Column('term', sa.String(length=500), nullable=False),
+    sa.Column('recipe_id', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['household_id'], ['households.id'], name=op.f('fk_ingredient_terms_household_id_households')),
+    sa.ForeignKeyConstraint(['recipe_id'], ['recipes.id'], name=op.f('fk_ingredient_terms_recipe_id_recipes'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('household_id', 'term', 'recipe_id', name=op.f('pk_ingredient_terms'))
+    )
+    op.create_index(op.f('ix_ingredient_terms_recipe_id'), 'ingredient_terms', ['recipe_id'], unique=False)
+
+    # Backfill — terms are normalized in Python, so this can't be a single INSERT ... SELECT
+    rows = op.get_bind().execute(sa.text(
+        "SELECT r.household_id, i.recipe_id, i.name FROM ingredients i JOIN recipes r ON r.id = i.recipe_id"
+    ))
+    terms = {
+        (household_id, term, recipe_id)
+        for household_id, recipe_id, name in rows
+        if (term := ingredient_term(name))
+    }
+    if terms:
+        op.bulk_insert(ingredient_terms, [{'household_id': h, 'term': t, 'recipe_id': r} for h, t, r in terms])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_ingredient_terms_recipe_id'), table_name='ingredient_terms')
+    op.drop_table('ingredient_terms')
@@ -0,0 +1,45 @@
+"""add_foreign_key_indexes
+
+Revision ID: f7c3a19d2b64
+Revises: e41d7a6b0c53
+Create Date: 2026-10-17 09:12:40.381527
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c3a19d2b64'
+down_revision: Union[str, Sequence[str], None] = 'e41d7a6b0c53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# recipes.household_id is already served by ix_recipes_household_id_created_at_id.
+INDEXES = [
+    ('ix_ingredients_recipe_id', 'ingredients', ['recipe_id']),
+    ('ix_steps_recipe_id', 'steps', ['recipe_id']),
+    ('ix_recipe_tags_tag_id', 'recipe_tags', ['tag_id']),
+    ('ix_shopping_items_list_id', 'shopping_items', ['list_id']),
+    ('ix_shopping_items_recipe_id', 'shopping_items', ['recipe_id']),
+    ('ix_tags_household_id_name', 'tags', ['household_id', 'name']),
+    ('ix_users_household_id', 'users', ['household_id']),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY can't run inside a transaction; building this way doesn't block
+    # writes to the tables while the indexes are created.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(op.f(name), table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(op.f(name), table_name=table, postgresql_concurrently=True, if_exists=True)
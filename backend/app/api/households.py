@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from pydantic import BaseModel
 from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.deps import get_current_admin, get_current_user
 from app.core.config import settings
 from app.models import User, HouseholdInvite
+from app.services.backup import MEDIA_TYPES, ExportFormat, export_household, restore_household
 
 router = APIRouter(prefix="/api/households", tags=["households"])
 
@@ -20,6 +23,17 @@ class InviteInfo(BaseModel):
     token: str
 
 
+class RestoreResult(BaseModel):
+    tags: int
+    recipes: int
+    ingredients: int
+    steps: int
+    recipe_tags: int
+    shopping_lists: int
+    shopping_items: int
+    remapped_ids: int
+
+
 @router.post("/invite", response_model=InviteOut)
 async def get_or_create_invite(
     db: AsyncSession = Depends(get_db),
@@ -69,3 +83,33 @@ async def get_invite_info(token: str, db: AsyncSession = Depends(get_db)):
 
     await db.refresh(invite, ["household"])
     return InviteInfo(household_name=invite.household.name, token=token)
+
+
+@router.get("/export")
+async def export(
+    format: ExportFormat = Query("ndjson", description="ndjson: full backup records; jsonld: schema.org Recipe graph"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Stream every recipe in the household with its ingredients, steps and tags."""
+    return StreamingResponse(
+        export_household(db.bind, current_user.household_id, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="recipes-{date.today()}.{format}"'},
+    )
+
+
+@router.post("/restore", response_model=RestoreResult)
+async def restore(
+    archive: UploadFile = File(..., description="An NDJSON file from GET /api/households/export"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_admin),
+):
+    """Load an export into this household in one transaction; nothing is written if any part fails."""
+    try:
+        result = await restore_household(db, current_user.household_id, archive.file)
+    except ValueError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    await db.commit()
+    return result
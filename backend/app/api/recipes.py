@@ -1,11 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import json
+from typing import AsyncIterator
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import ValidationError
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, delete
+from sqlalchemy import Select, Text, case, cast, select, distinct, func, insert, literal_column, not_, or_, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.orm import selectinload
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.deps import get_current_user
-from app.models import User, Recipe, Ingredient, Step, Tag, RecipeTag
-from app.schemas.recipe import RecipeIn, RecipeOut, RecipeListItem
+from app.core.etag import is_fresh, make_etag, not_modified
+from app.core.serialization import ORJSONResponse, dumps, json_datetime
+from app.core.pagination import KeysetKey, NEXT_CURSOR_HEADER, keyset_page, split_page
+from app.models import User, Recipe, Ingredient, IngredientTerm, Step, Tag, RecipeTag, ShoppingList, ShoppingItem
+from app.schemas.recipe import (
+    RecipeIn, RecipeOut, RecipeListItem, TagFacet, PantryQuery, PantryMatch, BulkItemResult, BulkImportResult,
+    RECIPE_OUT,
+)
+from app.services.cache.base import recipe_key
+from app.services.cache.factory import get_cache
+from app.services.realtime import publish
+from app.services.search import (
+    search_query, search_rank, matches_search, matches_title_substring,
+    set_similarity_threshold, matches_fuzzy, fuzzy_rank, reindex_recipes,
+)
+from app.utils.terms import ingredient_term
+from app.utils.combine import convert_quantities
+from app.utils.units import UnitSystem, scale_servings, servings_count
+from datetime import datetime, UTC
 import uuid
 
 router = APIRouter(prefix="/api/recipes", tags=["recipes"])
@@ -18,42 +42,192 @@ def _recipe_with_relations():
         selectinload(Recipe.created_by),
     )
 
+class RecipeFilters:
+    """Search and filter query parameters shared by list_recipes and tag_facets."""
+
+    def __init__(
+        self,
+        q: str | None = Query(None),
+        fuzzy: bool = Query(False, description="Typo-tolerant trigram matching on titles and ingredient names"),
+        min_similarity: float = Query(0.5, ge=0.0, le=1.0, description="Word-similarity cutoff for fuzzy search"),
+        tag_ids: list[str] = Query(default=[]),
+        tag_names: list[str] = Query(default=[]),
+        cuisine: str | None = Query(None),
+        created_by_id: str | None = Query(None),
+    ):
+        self.q = q
+        self.fuzzy = fuzzy
+        self.min_similarity = min_similarity
+        self.tag_ids = set(tag_ids)
+        self.tag_names = set(tag_names)
+        self.cuisine = cuisine
+        self.created_by_id = created_by_id
+
+    async def apply(self, db: AsyncSession, stmt: Select, household_id: str) -> tuple[Select, ColumnElement | None]:
+        """Restrict ``stmt`` (selecting from recipes) to matches; also returns the relevance expression, if searching."""
+        stmt = stmt.where(Recipe.household_id == household_id)
+        rank = None
+        if self.q and self.fuzzy:
+            await set_similarity_threshold(db, self.min_similarity)
+            stmt = stmt.where(matches_fuzzy(self.q))
+            rank = fuzzy_rank(self.q)
+        elif self.q:
+            tsquery = search_query(self.q)
+            stmt = stmt.where(or_(matches_search(tsquery), matches_title_substring(self.q)))
+            rank = search_rank(tsquery)
+        if self.cuisine:
+            stmt = stmt.where(Recipe.cuisine.ilike(f"%{self.cuisine}%"))
+        if self.created_by_id:
+            stmt = stmt.where(Recipe.created_by_id == self.created_by_id)
+        if self.tag_ids or self.tag_names:
+            stmt = stmt.where(Recipe.id.in_(self._with_all_tags(household_id)))
+        return stmt, rank
+
+    def _with_all_tags(self, household_id: str) -> Select:
+        """Recipes carrying every requested tag, in one grouped pass over recipe_tags.
+
+        Ids and names are counted separately so a tag requested both ways isn't double-counted.
+        """
+        having = []
+        if self.tag_ids:
+            having.append(func.count(distinct(Tag.id)).filter(Tag.id.in_(self.tag_ids)) == len(self.tag_ids))
+        if self.tag_names:
+            having.append(func.count(distinct(Tag.name)).filter(Tag.name.in_(self.tag_names)) == len(self.tag_names))
+        return (
+            select(RecipeTag.recipe_id)
+            .join(Tag, Tag.id == RecipeTag.tag_id)
+            .where(Tag.household_id == household_id, or_(Tag.id.in_(self.tag_ids), Tag.name.in_(self.tag_names)))
+            .group_by(RecipeTag.recipe_id)
+            .having(*having)
+        )
+
+def _list_item_document():
+    """A RecipeListItem rendered as JSON text entirely in Postgres.
+
+    Selects only the list columns and folds tags (json_agg) and creator into the same
+    row, so listing never builds ORM objects or runs Pydantic per recipe.
+    """
+    tags = (
+        select(func.coalesce(
+            func.json_agg(aggregate_order_by(
+                func.json_build_object("id", Tag.id, "name", Tag.name, "category", Tag.category, "color", Tag.color),
+                Tag.category, Tag.name,
+            )),
+            literal_column("'[]'::json"),
+        ))
+        .join(RecipeTag, RecipeTag.tag_id == Tag.id)
+        .where(RecipeTag.recipe_id == Recipe.id)
+        .correlate(Recipe)
+        .scalar_subquery()
+    )
+    creator = case((User.id.is_(None), None), else_=func.json_build_object("id", User.id, "name", User.name))
+    return cast(func.json_build_object(
+        "id", Recipe.id,
+        "title", Recipe.title,
+        "description", Recipe.description,
+        "image_url", Recipe.image_url,
+        "cuisine", Recipe.cuisine,
+        "total_time", Recipe.total_time,
+        "servings", Recipe.servings,
+        "tags", tags,
+        "created_at", json_datetime(Recipe.created_at),
+        "created_by", creator,
+    ), Text)
+
 @router.get("", response_model=list[RecipeListItem])
 async def list_recipes(
-    q: str | None = Query(None),
-    tag_names: list[str] = Query(default=[]),
-    cuisine: str | None = Query(None),
-    created_by_id: str | None = Query(None),
+    request: Request,
+    filters: RecipeFilters = Depends(),
+    limit: int | None = Query(None, ge=1, le=200, description="Page size; omit to return every match"),
+    cursor: str | None = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} response header"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    # Any add, edit or delete moves the household's (count, latest updated_at)
+    count, latest = (await db.execute(
+        select(func.count(), func.max(Recipe.updated_at)).where(Recipe.household_id == current_user.household_id)
+    )).one()
+    etag = make_etag("recipes", current_user.household_id, count, latest, request.url.query)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+
+    stmt = select(_list_item_document()).select_from(Recipe).outerjoin(User, User.id == Recipe.created_by_id)
+    stmt, rank = await filters.apply(db, stmt, current_user.household_id)
+    # Newest first; searches rank by relevance first. (created_at, id) makes the order total.
+    keys: list[KeysetKey] = [(Recipe.created_at, True), (Recipe.id, False)]
+    if rank is not None:
+        keys.insert(0, (rank, True))
+
+    result = await db.execute(keyset_page(stmt, keys, limit=limit, cursor=cursor))
+    documents, next_cursor = split_page(result.all(), keys, limit)
+    headers = {"ETag": etag}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    return Response(content="[" + ",".join(documents) + "]", media_type="application/json", headers=headers)
+
+@router.get("/facets", response_model=list[TagFacet])
+async def tag_facets(
+    filters: RecipeFilters = Depends(),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """For the current filter, how many matching recipes carry each not-yet-selected tag."""
+    matching, _ = await filters.apply(db, select(Recipe.id), current_user.household_id)
+    recipe_count = func.count(RecipeTag.recipe_id).label("recipe_count")
     stmt = (
-        select(Recipe)
-        .options(selectinload(Recipe.tags), selectinload(Recipe.created_by))
-        .where(Recipe.household_id == current_user.household_id)
-        .order_by(Recipe.created_at.desc())
-    )
-    if q:
-        stmt = stmt.where(or_(Recipe.title.ilike(f"%{q}%"), Recipe.description.ilike(f"%{q}%")))
-    if cuisine:
-        stmt = stmt.where(Recipe.cuisine.ilike(f"%{cuisine}%"))
-    if created_by_id:
-        stmt = stmt.where(Recipe.created_by_id == created_by_id)
-    # AND filter: each selected tag name must match a tag on the recipe
-    for name in tag_names:
-        tag_alias = Tag.__table__.alias()
-        recipe_tag_alias = RecipeTag.__table__.alias()
-        stmt = stmt.where(
-            Recipe.id.in_(
-                select(recipe_tag_alias.c.recipe_id)
-                .join(tag_alias, tag_alias.c.id == recipe_tag_alias.c.tag_id)
-                .where(tag_alias.c.name == name)
-                .scalar_subquery()
-            )
+        select(Tag.id, Tag.name, Tag.category, Tag.color, recipe_count)
+        .join(RecipeTag, RecipeTag.tag_id == Tag.id)
+        .where(
+            Tag.household_id == current_user.household_id,
+            RecipeTag.recipe_id.in_(matching),
+            Tag.id.not_in(filters.tag_ids),
+            Tag.name.not_in(filters.tag_names),
         )
+        .group_by(Tag.id)
+        .order_by(recipe_count.desc(), Tag.name)
+    )
+    result = await db.execute(stmt)
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
+@router.post("/pantry", response_model=list[PantryMatch])
+async def cook_with_pantry(
+    body: PantryQuery,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Recipes using the given ingredients, best coverage first, with what's still missing."""
+    pantry = {term for term in map(ingredient_term, body.ingredients) if term}
+    if not pantry:
+        return []
+    # Like density_for, a term also matches by its trailing words: "butter" covers
+    # "unsalted butter" and "garlic" covers "clove garlic"
+    have = or_(IngredientTerm.term.in_(pantry), *(IngredientTerm.term.endswith(f" {term}") for term in pantry))
+    matched_count = func.count().filter(have)
+    # Only recipes sharing at least one term, found within the household's range of the terms index
+    candidates = select(IngredientTerm.recipe_id).where(
+        IngredientTerm.household_id == current_user.household_id, have,
+    )
+    stmt = (
+        select(
+            Recipe.id,
+            Recipe.title,
+            Recipe.image_url,
+            func.count().label("ingredient_count"),
+            func.coalesce(func.array_agg(IngredientTerm.term).filter(have), []).label("matched"),
+            func.coalesce(func.array_agg(IngredientTerm.term).filter(not_(have)), []).label("missing"),
+        )
+        .join(IngredientTerm, IngredientTerm.recipe_id == Recipe.id)
+        .where(Recipe.household_id == current_user.household_id, Recipe.id.in_(candidates))
+        .group_by(Recipe.id)
+        .order_by(
+            (matched_count * 1.0 / func.count()).desc(),
+            matched_count.desc(),
+            Recipe.title,
+        )
+        .limit(body.limit)
+    )
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return ORJSONResponse([dict(row) for row in result.mappings()])
 
 @router.post("", response_model=RecipeOut, status_code=201)
 async def create_recipe(
@@ -71,32 +245,224 @@ async def create_recipe(
     await db.flush()
 
     for i, ing in enumerate(body.ingredients):
-        db.add(Ingredient(id=str(uuid.uuid4()), recipe_id=recipe.id, **ing.model_dump(exclude={"order"}), order=i))
+        db.add(Ingredient(id=str(uuid.uuid4()), recipe_id=recipe.id, **ing.model_dump(exclude={"id", "order"}), order=i))
     for i, step in enumerate(body.steps):
-        db.add(Step(id=str(uuid.uuid4()), recipe_id=recipe.id, **step.model_dump(exclude={"order"}), order=i))
+        db.add(Step(id=str(uuid.uuid4()), recipe_id=recipe.id, **step.model_dump(exclude={"id", "order"}), order=i))
 
     if body.tag_ids:
         for tag_id in body.tag_ids:
             db.add(RecipeTag(recipe_id=recipe.id, tag_id=tag_id))
 
+    await reindex_recipes(db, [recipe.id])
     await db.commit()
 
     result = await db.execute(_recipe_with_relations().where(Recipe.id == recipe.id))
-    return result.scalar_one()
+    return RECIPE_OUT.response(result.scalar_one(), status_code=201)
+
+# ---- Bulk import ----
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+async def _bulk_payload(request: Request) -> AsyncIterator[bytes | object]:
+    """Raw recipes from a JSON array body, or one per line of an NDJSON stream as it arrives."""
+    if request.headers.get("content-type", "").startswith(NDJSON_MEDIA_TYPE):
+        buffer = b""
+        async for chunk in request.stream():
+            *lines, buffer = (buffer + chunk).split(b"\n")
+            for line in lines:
+                if line.strip():
+                    yield line
+        if buffer.strip():
+            yield buffer
+        return
+    try:
+        items = json.loads(await request.body())
+    except ValueError:
+        items = None
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array of recipes or an NDJSON stream")
+    for item in items:
+        yield item
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, e['loc'])) or 'recipe'}: {e['msg']}" for e in exc.errors())
+
+# SQLSTATE -> what to tell the client; the driver's own text names tables and constraints
+_DATABASE_MESSAGES = {
+    "22001": "recipe: a value is too long",
+    "22003": "recipe: a number is out of range",
+    "23502": "recipe: a required value is missing",
+    "23505": "recipe: conflicts with an existing record",
+}
+
+def _database_message(exc: DBAPIError) -> str:
+    return _DATABASE_MESSAGES.get(getattr(exc.orig, "sqlstate", None), "recipe: rejected by the database")
+
+def _bulk_rows(body: RecipeIn, current_user: User, tag_ids: set[str]) -> dict[type, list[dict]]:
+    """Row dicts for one imported recipe, keyed by model, ready for multi-row inserts."""
+    recipe_id = str(uuid.uuid4())
+    now = datetime.now(UTC)
+    return {
+        Recipe: [{
+            "id": recipe_id, "household_id": current_user.household_id, "created_by_id": current_user.id,
+            "created_at": now, "updated_at": now,
+            **body.model_dump(exclude={"tag_ids", "ingredients", "steps"}),
+        }],
+        Ingredient: [
+            {"id": str(uuid.uuid4()), "recipe_id": recipe_id, **ing.model_dump(exclude={"id", "order"}), "order": i}
+            for i, ing in enumerate(body.ingredients)
+        ],
+        Step: [
+            {"id": str(uuid.uuid4()), "recipe_id": recipe_id, **step.model_dump(exclude={"id", "order"}), "order": i}
+            for i, step in enumerate(body.steps)
+        ],
+        # Unknown or other households' tags are dropped, as in update_recipe
+        RecipeTag: [
+            {"recipe_id": recipe_id, "tag_id": tag_id}
+            for tag_id in dict.fromkeys(body.tag_ids) if tag_id in tag_ids
+        ],
+    }
+
+async def _import_batch(
+    db: AsyncSession, batch: list[tuple[int, dict[type, list[dict]]]],
+) -> list[BulkItemResult]:
+    """Write a batch with one multi-row INSERT per table inside a savepoint.
+
+    If the batch is rejected (e.g. a value too long for its column) it is retried one
+    recipe at a time, so a single bad item doesn't fail the rest.
+    """
+    recipe_ids = [rows[Recipe][0]["id"] for _, rows in batch]
+    try:
+        async with db.begin_nested():
+            for model in (Recipe, Ingredient, Step, RecipeTag):
+                values = [row for _, rows in batch for row in rows[model]]
+                if values:
+                    await db.execute(insert(model), values)
+            await reindex_recipes(db, recipe_ids)
+    except DBAPIError as exc:
+        if len(batch) == 1:
+            return [BulkItemResult(index=batch[0][0], error=_database_message(exc))]
+        return [result for item in batch for result in await _import_batch(db, [item])]
+    return [BulkItemResult(index=index, id=recipe_id) for (index, _), recipe_id in zip(batch, recipe_ids)]
+
+@router.post("/bulk", response_model=BulkImportResult)
+async def bulk_import_recipes(
+    request: Request,
+    batch_size: int = Query(settings.bulk_import_batch_size, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Import many recipes at once from a JSON array of RecipeIn or an NDJSON stream.
+
+    Items are validated individually and written ``batch_size`` at a time; the result
+    lists each item's new id or the reason it was rejected.
+    """
+    tag_ids = set((await db.execute(
+        select(Tag.id).where(Tag.household_id == current_user.household_id)
+    )).scalars())
+    results: list[BulkItemResult] = []
+    batch: list[tuple[int, dict[type, list[dict]]]] = []
+    index = 0
+    async for raw in _bulk_payload(request):
+        try:
+            body = RecipeIn.model_validate_json(raw) if isinstance(raw, bytes) else RecipeIn.model_validate(raw)
+        except ValidationError as exc:
+            results.append(BulkItemResult(index=index, error=_validation_message(exc)))
+        else:
+            batch.append((index, _bulk_rows(body, current_user, tag_ids)))
+        index += 1
+        if len(batch) >= batch_size:
+            results += await _import_batch(db, batch)
+            batch = []
+    if batch:
+        results += await _import_batch(db, batch)
+    await db.commit()
+
+    results.sort(key=lambda r: r.index)
+    created = sum(r.id is not None for r in results)
+    return BulkImportResult(created=created, failed=len(results) - created, results=results)
+
+def _scaled(recipe: dict, factor: float, system: UnitSystem | None) -> dict:
+    """Apply a scale factor and unit system to a serialized recipe's ingredients in one batch."""
+    ingredients = recipe["ingredients"]
+    converted = convert_quantities(((i["quantity"], i["unit"]) for i in ingredients), factor, system)
+    for ingredient, (quantity, unit) in zip(ingredients, converted):
+        ingredient["quantity"] = None if quantity is None else round(quantity, 3)
+        ingredient["unit"] = unit
+    recipe["servings"] = scale_servings(recipe["servings"], factor)
+    return recipe
 
 @router.get("/{recipe_id}", response_model=RecipeOut)
 async def get_recipe(
     recipe_id: str,
+    request: Request,
+    scale: float | None = Query(None, gt=0, le=100, description="Multiply every ingredient quantity"),
+    servings: float | None = Query(None, gt=0, le=1000, description="Scale to this many servings"),
+    system: UnitSystem | None = Query(None, description="Convert volumes and weights to metric or US units"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        _recipe_with_relations().where(Recipe.id == recipe_id, Recipe.household_id == current_user.household_id)
-    )
-    recipe = result.scalar_one_or_none()
-    if not recipe:
+    if scale is not None and servings is not None:
+        raise HTTPException(status_code=400, detail="Pass either scale or servings, not both")
+    # Scaled/converted views are cached and validated separately from the plain recipe
+    variant = f"scale={scale}&servings={servings}&system={system}" if scale or servings or system else ""
+    # One indexed lookup decides between 304, a cached body and the full relation load
+    updated_at = (await db.execute(
+        select(Recipe.updated_at).where(Recipe.id == recipe_id, Recipe.household_id == current_user.household_id)
+    )).scalar_one_or_none()
+    if updated_at is None:
         raise HTTPException(status_code=404, detail="Recipe not found")
-    return recipe
+    etag = make_etag("recipe", recipe_id, updated_at.isoformat(), variant)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+    cache = get_cache()
+    body = await cache.get(recipe_key(current_user.household_id, recipe_id, updated_at, variant))
+    if body is None:
+        result = await db.execute(
+            _recipe_with_relations().where(Recipe.id == recipe_id, Recipe.household_id == current_user.household_id)
+        )
+        recipe = result.scalar_one_or_none()
+        if not recipe:
+            raise HTTPException(status_code=404, detail="Recipe not found")
+        if variant:
+            factor = scale or 1.0
+            if servings is not None:
+                count = servings_count(recipe.servings)
+                if not count:
+                    raise HTTPException(status_code=400, detail="Recipe has no serving count to scale from")
+                factor = servings / count
+            body = dumps(_scaled(RECIPE_OUT.plain(recipe), factor, system))
+        else:
+            body = RECIPE_OUT.dump(recipe)
+        # Keyed by the version just loaded: an edit committed in between gets a new key
+        await cache.set(recipe_key(current_user.household_id, recipe_id, recipe.updated_at, variant), body)
+        etag = make_etag("recipe", recipe_id, recipe.updated_at.isoformat(), variant)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+def _merge_children(existing: list, incoming: list, model: type, recipe_id: str) -> list:
+    """Reconcile a recipe's ingredients or steps with the submitted list.
+
+    Submitted rows match existing ones by id, then any left over by position; matched
+    rows are updated in place (only changed fields), the rest inserted. Existing rows
+    that end up unmatched drop out of the collection and are deleted as orphans.
+    """
+    unclaimed = {row.id: row for row in existing}
+    matched = [unclaimed.pop(item.id, None) if item.id else None for item in incoming]
+    for i, item in enumerate(incoming):
+        if matched[i] is None and not item.id and i < len(existing) and existing[i].id in unclaimed:
+            matched[i] = unclaimed.pop(existing[i].id)
+
+    merged = []
+    for i, (item, row) in enumerate(zip(incoming, matched)):
+        values = item.model_dump(exclude={"id", "order"}) | {"order": i}
+        if row is None:
+            row = model(id=str(uuid.uuid4()), recipe_id=recipe_id, **values)
+        else:
+            for key, value in values.items():
+                if getattr(row, key) != value:
+                    setattr(row, key, value)
+        merged.append(row)
+    return merged
 
 @router.put("/{recipe_id}", response_model=RecipeOut)
 async def update_recipe(
@@ -111,29 +477,27 @@ async def update_recipe(
     recipe = result.scalar_one_or_none()
     if not recipe:
         raise HTTPException(status_code=404, detail="Recipe not found")
+    cached = recipe_key(current_user.household_id, recipe.id, recipe.updated_at)
 
     for key, value in body.model_dump(exclude={"tag_ids", "ingredients", "steps"}).items():
-        setattr(recipe, key, value)
-
-    for ing in list(recipe.ingredients):
-        await db.delete(ing)
-    for step in list(recipe.steps):
-        await db.delete(step)
-    await db.flush()
-
-    for i, ing in enumerate(body.ingredients):
-        db.add(Ingredient(id=str(uuid.uuid4()), recipe_id=recipe.id, **ing.model_dump(exclude={"order"}), order=i))
-    for i, step in enumerate(body.steps):
-        db.add(Step(id=str(uuid.uuid4()), recipe_id=recipe.id, **step.model_dump(exclude={"order"}), order=i))
-
-    if body.tag_ids is not None:
-        await db.execute(delete(RecipeTag).where(RecipeTag.recipe_id == recipe_id))
-        for tag_id in body.tag_ids:
-            db.add(RecipeTag(recipe_id=recipe.id, tag_id=tag_id))
+        if getattr(recipe, key) != value:
+            setattr(recipe, key, value)
+    recipe.ingredients = _merge_children(recipe.ingredients, body.ingredients, Ingredient, recipe.id)
+    recipe.steps = _merge_children(recipe.steps, body.steps, Step, recipe.id)
+    if {t.id for t in recipe.tags} != set(body.tag_ids):
+        tags = await db.execute(
+            select(Tag).where(Tag.id.in_(body.tag_ids), Tag.household_id == current_user.household_id)
+        )
+        recipe.tags = list(tags.scalars().all())
 
-    await db.commit()
-    result = await db.execute(_recipe_with_relations().where(Recipe.id == recipe_id))
-    return result.scalar_one()
+    # The unit of work then writes only what changed, batching each kind of statement.
+    if db.new or db.deleted or any(db.is_modified(obj) for obj in db.dirty):
+        recipe.updated_at = datetime.now(UTC)
+        await reindex_recipes(db, [recipe.id])
+        await db.commit()
+        await get_cache().delete(cached)
+    # Everything RecipeOut needs is already loaded in the session
+    return RECIPE_OUT.response(recipe)
 
 @router.delete("/{recipe_id}", status_code=204)
 async def delete_recipe(
@@ -147,5 +511,25 @@ async def delete_recipe(
     recipe = result.scalar_one_or_none()
     if not recipe:
         raise HTTPException(status_code=404, detail="Recipe not found")
+    cached = recipe_key(current_user.household_id, recipe.id, recipe.updated_at)
+    # Unlink shopping items here rather than leave it to the foreign key's SET NULL,
+    # so each list's version moves and its changefeed and subscribers see the change
+    lists = (await db.execute(
+        update(ShoppingList)
+        .where(ShoppingList.id.in_(select(ShoppingItem.list_id).where(ShoppingItem.recipe_id == recipe.id)))
+        .values(version=ShoppingList.version + 1)
+        .returning(ShoppingList.id, ShoppingList.version)
+        .execution_options(synchronize_session=False)
+    )).all()
+    for list_id, version in lists:
+        items = await db.scalars(
+            update(ShoppingItem)
+            .where(ShoppingItem.list_id == list_id, ShoppingItem.recipe_id == recipe.id)
+            .values(recipe_id=None, seq=version)
+            .returning(ShoppingItem)
+            .execution_options(synchronize_session=False)
+        )
+        await publish(db, list_id, "items_changed", version, list(items))
     await db.delete(recipe)
     await db.commit()
+    await get_cache().delete(cached)
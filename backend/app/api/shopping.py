@@ -1,13 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal, Sequence
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import Text, cast, select, delete, func, true, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 from app.core.database import get_db
 from app.core.deps import get_current_user
-from app.models import User, ShoppingList, ShoppingItem, Ingredient
-from app.schemas.shopping import ShoppingListIn, ShoppingListOut, ShoppingItemIn, AddFromRecipeRequest
-from app.utils.units import try_combine
-from app.utils.categorize import categorize_ingredient
+from app.core.etag import is_fresh, make_etag, not_modified
+from app.core.serialization import dumps, json_datetime
+from app.core.pagination import KeysetKey, NEXT_CURSOR_HEADER, keyset_page, split_page
+from app.models import User, Recipe, ShoppingList, ShoppingItem, ShoppingItemTombstone, Ingredient
+from app.schemas.shopping import (
+    ShoppingListIn, ShoppingListOut, ShoppingListSummary, ShoppingListDelta, ShoppingItemIn, ItemCategoryIn,
+    AddFromRecipeRequest, AddFromRecipesRequest, ShoppingOpsBatch, AddItemOp, CheckItemOp,
+    SHOPPING_LIST_OUT, SHOPPING_LISTS_OUT, SHOPPING_LIST_DELTA,
+)
+from app.services.categories import categorize_for_household, record_override
+from app.services.realtime import ListBroker, get_broker, publish
+from app.utils.combine import combine_many
+from app.utils.density import density_for
 import uuid
 
 router = APIRouter(prefix="/api/shopping", tags=["shopping"])
@@ -17,21 +29,107 @@ async def _get_list_with_items(db: AsyncSession, list_id: str, household_id: str
         select(ShoppingList)
         .options(selectinload(ShoppingList.items))
         .where(ShoppingList.id == list_id, ShoppingList.household_id == household_id)
+        # Writers hold on to the list they loaded; reload its items after their commit
+        .execution_options(populate_existing=True)
     )
     sl = result.scalar_one_or_none()
     if not sl:
         raise HTTPException(status_code=404, detail="List not found")
     return sl
 
-@router.get("", response_model=list[ShoppingListOut])
-async def list_shopping_lists(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    result = await db.execute(
-        select(ShoppingList)
-        .options(selectinload(ShoppingList.items))
-        .where(ShoppingList.household_id == current_user.household_id)
-        .order_by(ShoppingList.created_at.desc())
+async def _claim_version(db: AsyncSession, list_id: str, household_id: str) -> int:
+    """Check the list belongs to the household and take its next version, in one primary-key UPDATE.
+
+    Incremented in SQL so concurrent writers can't both claim the same version; the
+    row lock it takes also serializes writers of one list until they commit. Call it
+    before changing any items: a 404 raised later rolls the bump back with the rest.
+    """
+    version = await db.scalar(
+        update(ShoppingList)
+        .where(ShoppingList.id == list_id, ShoppingList.household_id == household_id)
+        .values(version=ShoppingList.version + 1)
+        .returning(ShoppingList.version)
+        .execution_options(synchronize_session=False)
+    )
+    if version is None:
+        raise HTTPException(status_code=404, detail="List not found")
+    return version
+
+async def _mutation_response(
+    db: AsyncSession,
+    list_id: str,
+    household_id: str,
+    version: int,
+    changed: list[ShoppingItem],
+    delta: bool,
+    status_code: int = 200,
+    deleted: Sequence[str] = (),
+) -> Response:
+    """The whole list after a committed change, or with ``delta`` only the changed and deleted items.
+
+    Either way the ETag is the one GET /{list_id} now answers with, so a client
+    applying deltas can keep revalidating its copy.
+    """
+    headers = {"ETag": make_etag("shopping_list", list_id, version)}
+    if delta:
+        body = ShoppingListDelta(id=list_id, version=version, items=changed, deleted=list(deleted))
+        return SHOPPING_LIST_DELTA.response(body, status_code=status_code, headers=headers)
+    sl = await _get_list_with_items(db, list_id, household_id)
+    return SHOPPING_LIST_OUT.response(sl, status_code=status_code, headers=headers)
+
+def _summary_document():
+    """One list's ShoppingListSummary as JSON text, its counts from one aggregate over its items."""
+    counts = (
+        select(
+            func.count().label("item_count"),
+            func.count().filter(ShoppingItem.checked).label("checked_count"),
+        )
+        .where(ShoppingItem.list_id == ShoppingList.id)
+        .lateral("counts")
     )
-    return result.scalars().all()
+    document = cast(func.json_build_object(
+        "id", ShoppingList.id,
+        "name", ShoppingList.name,
+        "created_at", json_datetime(ShoppingList.created_at),
+        "version", ShoppingList.version,
+        "item_count", counts.c.item_count,
+        "checked_count", counts.c.checked_count,
+    ), Text)
+    return select(document).select_from(ShoppingList).join(counts, true())
+
+@router.get("", response_model=list[ShoppingListOut] | list[ShoppingListSummary])
+async def list_shopping_lists(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=200),
+    cursor: str | None = Query(None),
+    view: Literal["full", "summary"] = Query(
+        "full", description="summary: item and checked counts instead of the items, for the index page",
+    ),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    fingerprint = (await db.execute(
+        select(func.count(), func.sum(ShoppingList.version), func.max(ShoppingList.created_at))
+        .where(ShoppingList.household_id == current_user.household_id)
+    )).one()
+    etag = make_etag("shopping_lists", current_user.household_id, *fingerprint, request.url.query)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+
+    keys: list[KeysetKey] = [(ShoppingList.created_at, True), (ShoppingList.id, False)]
+    if view == "summary":
+        stmt = _summary_document()
+    else:
+        stmt = select(ShoppingList).options(selectinload(ShoppingList.items))
+    stmt = stmt.where(ShoppingList.household_id == current_user.household_id)
+    result = await db.execute(keyset_page(stmt, keys, limit=limit, cursor=cursor))
+    lists, next_cursor = split_page(result.all(), keys, limit)
+    headers = {"ETag": etag}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    if view == "summary":
+        return Response(content="[" + ",".join(lists) + "]", media_type="application/json", headers=headers)
+    return SHOPPING_LISTS_OUT.response(lists, headers=headers)
 
 @router.post("", response_model=ShoppingListOut, status_code=201)
 async def create_list(body: ShoppingListIn, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
@@ -41,87 +139,381 @@ async def create_list(body: ShoppingListIn, db: AsyncSession = Depends(get_db),
     result = await db.execute(
         select(ShoppingList).options(selectinload(ShoppingList.items)).where(ShoppingList.id == sl.id)
     )
-    return result.scalar_one()
+    return SHOPPING_LIST_OUT.response(result.scalar_one(), status_code=201)
 
 @router.get("/{list_id}", response_model=ShoppingListOut)
-async def get_list(list_id: str, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return await _get_list_with_items(db, list_id, current_user.household_id)
+async def get_list(
+    list_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    version = await db.scalar(
+        select(ShoppingList.version).where(ShoppingList.id == list_id, ShoppingList.household_id == current_user.household_id)
+    )
+    if version is None:
+        raise HTTPException(status_code=404, detail="List not found")
+    etag = make_etag("shopping_list", list_id, version)
+    if is_fresh(request, etag):
+        return not_modified(etag)
+    sl = await _get_list_with_items(db, list_id, current_user.household_id)
+    return SHOPPING_LIST_OUT.response(sl, headers={"ETag": etag})
 
-@router.post("/{list_id}/items", response_model=ShoppingListOut, status_code=201)
-async def add_item(list_id: str, body: ShoppingItemIn, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    await _get_list_with_items(db, list_id, current_user.household_id)  # verify ownership
+@router.post("/{list_id}/items", response_model=ShoppingListOut | ShoppingListDelta, status_code=201)
+async def add_item(
+    list_id: str,
+    body: ShoppingItemIn,
+    delta: bool = Query(False, description="Return only the new item and the list's version"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    version = await _claim_version(db, list_id, current_user.household_id)
+    [category] = await categorize_for_household(db, current_user.household_id, [body.ingredient_name])
     item = ShoppingItem(
         id=str(uuid.uuid4()),
         list_id=list_id,
-        category=categorize_ingredient(body.ingredient_name),
+        category=category,
+        seq=version,
         **body.model_dump(),
     )
     db.add(item)
+    await db.flush()
+    await publish(db, list_id, "item_added", version, [item])
     await db.commit()
-    return await _get_list_with_items(db, list_id, current_user.household_id)
+    return await _mutation_response(db, list_id, current_user.household_id, version, [item], delta, status_code=201)
+
+async def _add_recipes(
+    db: AsyncSession, list_id: str, household_id: str, entries: list[AddFromRecipeRequest],
+) -> tuple[int, list[ShoppingItem]]:
+    """Add recipes' ingredients to a list in one transaction, without committing.
+
+    Ingredients come from one query and are combined with the list's items in a
+    single pass; each new ingredient joins the latest existing item of the same
+    name where the units allow. Changed and new items go out in one upsert.
+    Returns the list's new version and the changed and new items.
+    """
+    version = await _claim_version(db, list_id, household_id)
+
+    # Outer join so a recipe without ingredients still shows up as found
+    recipe_ids = {entry.recipe_id for entry in entries}
+    rows = await db.execute(
+        select(Recipe.id.label("recipe_id"), Ingredient.id, Ingredient.name, Ingredient.quantity, Ingredient.unit)
+        .outerjoin(Ingredient, Ingredient.recipe_id == Recipe.id)
+        .where(Recipe.id.in_(recipe_ids), Recipe.household_id == household_id)
+        .order_by(Recipe.id, Ingredient.order)
+    )
+    by_recipe: dict[str, list] = {}
+    for row in rows:
+        ingredients = by_recipe.setdefault(row.recipe_id, [])
+        if row.id is not None:
+            ingredients.append(row)
+    if len(by_recipe) < len(recipe_ids):
+        raise HTTPException(status_code=404, detail="Recipe not found")
+
+    existing_result = await db.execute(select(ShoppingItem).where(ShoppingItem.list_id == list_id))
+    existing = list({item.ingredient_name.lower(): item for item in existing_result.scalars()}.values())
+    names = [item.ingredient_name for item in existing]
+    quantities = [item.quantity for item in existing]
+    units = [item.unit for item in existing]
+    sources = [item.recipe_id for item in existing]
+    for entry in entries:
+        wanted = None if entry.ingredient_ids is None else set(entry.ingredient_ids)
+        for ing in by_recipe[entry.recipe_id]:
+            if wanted is None or ing.id in wanted:
+                names.append(ing.name)
+                quantities.append(None if ing.quantity is None else ing.quantity * entry.scale)
+                units.append(ing.unit)
+                sources.append(entry.recipe_id)
+    combined = combine_many([name.lower() for name in names], quantities, units, density=density_for)
+
+    upserts, new_lines = [], []
+    for first, size, quantity, unit in zip(combined.first, combined.sizes, combined.quantities, combined.units):
+        if first >= len(existing):
+            new_lines.append({
+                "id": str(uuid.uuid4()), "list_id": list_id, "recipe_id": sources[first],
+                "ingredient_name": names[first], "quantity": quantity, "unit": unit, "checked": False,
+                "seq": version,
+            })
+        elif size > 1:
+            item = existing[first]
+            upserts.append({
+                "id": item.id, "list_id": list_id, "recipe_id": item.recipe_id, "ingredient_name": item.ingredient_name,
+                "quantity": quantity, "unit": unit, "checked": item.checked, "category": item.category,
+                "seq": version,
+            })
+    categories = await categorize_for_household(db, household_id, [line["ingredient_name"] for line in new_lines])
+    for line, category in zip(new_lines, categories):
+        line["category"] = category
+    if not (upserts or new_lines):
+        return version, []
+    # Rows go as parameters rather than one VALUES clause: SQLAlchemy pages them into
+    # multi-row statements that stay under the driver's bind-parameter limit
+    stmt = pg_insert(ShoppingItem)
+    changed = await db.scalars(
+        stmt.on_conflict_do_update(
+            index_elements=[ShoppingItem.id],
+            set_={"quantity": stmt.excluded.quantity, "unit": stmt.excluded.unit, "seq": stmt.excluded.seq},
+        )
+        .returning(ShoppingItem)
+        .execution_options(populate_existing=True),
+        upserts + new_lines,
+    )
+    return version, list(changed)
 
-@router.post("/{list_id}/add-from-recipe", response_model=ShoppingListOut)
+@router.post("/{list_id}/add-from-recipe", response_model=ShoppingListOut | ShoppingListDelta)
 async def add_from_recipe(
     list_id: str,
     body: AddFromRecipeRequest,
+    delta: bool = Query(False, description="Return only the changed and new items and the list's version"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    await _get_list_with_items(db, list_id, current_user.household_id)  # verify ownership
+    version, changed = await _add_recipes(db, list_id, current_user.household_id, [body])
+    await publish(db, list_id, "items_added", version, changed)
+    await db.commit()
+    return await _mutation_response(db, list_id, current_user.household_id, version, changed, delta)
 
-    # Fetch ingredients — all or selected
-    if body.ingredient_ids is None:
-        result = await db.execute(
-            select(Ingredient).where(Ingredient.recipe_id == body.recipe_id)
-        )
-    else:
-        result = await db.execute(
-            select(Ingredient).where(
-                Ingredient.id.in_(body.ingredient_ids),
-                Ingredient.recipe_id == body.recipe_id,
-            )
-        )
-    ingredients = result.scalars().all()
+@router.post("/{list_id}/add-from-recipes", response_model=ShoppingListOut | ShoppingListDelta)
+async def add_from_recipes(
+    list_id: str,
+    body: AddFromRecipesRequest,
+    delta: bool = Query(False, description="Return only the changed and new items and the list's version"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Add a whole meal plan (several recipes, each optionally scaled) in one round trip."""
+    version, changed = await _add_recipes(db, list_id, current_user.household_id, body.recipes)
+    await publish(db, list_id, "items_added", version, changed)
+    await db.commit()
+    return await _mutation_response(db, list_id, current_user.household_id, version, changed, delta)
 
-    # Fetch existing items in the list for combining
-    existing_result = await db.execute(
-        select(ShoppingItem).where(ShoppingItem.list_id == list_id)
+async def _update_item(db: AsyncSession, list_id: str, version: int, item_id: str, **values) -> ShoppingItem:
+    item = await db.scalar(
+        update(ShoppingItem)
+        .where(ShoppingItem.id == item_id, ShoppingItem.list_id == list_id)
+        .values(seq=version, **values)
+        .returning(ShoppingItem)
+        .execution_options(populate_existing=True)
     )
-    existing_items = existing_result.scalars().all()
-    existing_by_name = {item.ingredient_name.lower(): item for item in existing_items}
-
-    for ing in ingredients:
-        existing = existing_by_name.get(ing.name.lower())
-        if existing:
-            combined = try_combine(existing.quantity, existing.unit, ing.quantity, ing.unit)
-            if combined:
-                existing.quantity, existing.unit = combined
-                continue
-        new_item = ShoppingItem(
-            id=str(uuid.uuid4()),
-            list_id=list_id,
-            recipe_id=body.recipe_id,
-            ingredient_name=ing.name,
-            quantity=ing.quantity,
-            unit=ing.unit,
-            category=categorize_ingredient(ing.name),
-        )
-        db.add(new_item)
-        existing_by_name[ing.name.lower()] = new_item
+    if item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return item
 
+@router.patch("/{list_id}/items/{item_id}/check", response_model=ShoppingListOut | ShoppingListDelta)
+async def toggle_item(
+    list_id: str,
+    item_id: str,
+    delta: bool = Query(False, description="Return only the toggled item and the list's version"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    version = await _claim_version(db, list_id, current_user.household_id)
+    item = await _update_item(db, list_id, version, item_id, checked=~ShoppingItem.checked)
+    await publish(db, list_id, "item_checked", version, [item])
     await db.commit()
-    return await _get_list_with_items(db, list_id, current_user.household_id)
-
-@router.patch("/{list_id}/items/{item_id}/check", response_model=ShoppingListOut)
-async def toggle_item(list_id: str, item_id: str, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
-    await _get_list_with_items(db, list_id, current_user.household_id)  # verify ownership
-    result = await db.execute(select(ShoppingItem).where(ShoppingItem.id == item_id, ShoppingItem.list_id == list_id))
-    item = result.scalar_one_or_none()
-    if not item:
+    return await _mutation_response(db, list_id, current_user.household_id, version, [item], delta)
+
+@router.patch("/{list_id}/items/{item_id}/category", response_model=ShoppingListOut | ShoppingListDelta)
+async def set_item_category(
+    list_id: str,
+    item_id: str,
+    body: ItemCategoryIn,
+    delta: bool = Query(False, description="Return only the moved item and the list's version"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Move an item to another aisle; the household's future items of that ingredient follow."""
+    version = await _claim_version(db, list_id, current_user.household_id)
+    item = await _update_item(db, list_id, version, item_id, category=body.category)
+    await record_override(db, current_user.household_id, item.ingredient_name, body.category)
+    await publish(db, list_id, "item_updated", version, [item])
+    await db.commit()
+    return await _mutation_response(db, list_id, current_user.household_id, version, [item], delta)
+
+async def _delete_items(db: AsyncSession, list_id: str, version: int, item_ids: list[str]) -> list[str]:
+    """Delete the list's items among ``item_ids``, leaving tombstones; returns the ids that existed."""
+    deleted = list(await db.scalars(
+        delete(ShoppingItem)
+        .where(ShoppingItem.list_id == list_id, ShoppingItem.id.in_(item_ids))
+        .returning(ShoppingItem.id)
+        .execution_options(synchronize_session=False)
+    ))
+    if deleted:
+        stmt = pg_insert(ShoppingItemTombstone).values([
+            {"item_id": item_id, "list_id": list_id, "seq": version} for item_id in deleted
+        ])
+        await db.execute(stmt.on_conflict_do_update(
+            index_elements=[ShoppingItemTombstone.list_id, ShoppingItemTombstone.item_id], set_={"seq": version},
+        ))
+    return deleted
+
+@router.delete("/{list_id}/items/{item_id}", response_model=ShoppingListOut | ShoppingListDelta)
+async def delete_item(
+    list_id: str,
+    item_id: str,
+    delta: bool = Query(False, description="Return only the deleted item's id and the list's version"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    version = await _claim_version(db, list_id, current_user.household_id)
+    if not await _delete_items(db, list_id, version, [item_id]):
         raise HTTPException(status_code=404, detail="Item not found")
-    item.checked = not item.checked
+    await publish(db, list_id, "item_deleted", version, deleted=[item_id])
     await db.commit()
-    return await _get_list_with_items(db, list_id, current_user.household_id)
+    return await _mutation_response(db, list_id, current_user.household_id, version, [], delta, deleted=[item_id])
+
+async def _changes_since(db: AsyncSession, list_id: str, version: int, since: int) -> ShoppingListDelta:
+    items, deleted = [], []
+    if since < version:
+        items = await db.scalars(
+            select(ShoppingItem).where(ShoppingItem.list_id == list_id, ShoppingItem.seq > since).order_by(ShoppingItem.seq)
+        )
+        deleted = await db.scalars(
+            select(ShoppingItemTombstone.item_id)
+            .where(ShoppingItemTombstone.list_id == list_id, ShoppingItemTombstone.seq > since)
+        )
+    return ShoppingListDelta(id=list_id, version=version, items=list(items), deleted=list(deleted))
+
+@router.get("/{list_id}/changes", response_model=ShoppingListDelta)
+async def list_changes(
+    list_id: str,
+    since: int = Query(..., ge=0, description="The list version the client last synced"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Items written and deleted after version ``since``; apply them, then sync from ``version`` next time.
+
+    Items come back in full, deletions as ids. A client without a copy of the list
+    starts from GET /{list_id} instead.
+    """
+    version = await db.scalar(
+        select(ShoppingList.version).where(ShoppingList.id == list_id, ShoppingList.household_id == current_user.household_id)
+    )
+    if version is None:
+        raise HTTPException(status_code=404, detail="List not found")
+    return SHOPPING_LIST_DELTA.response(await _changes_since(db, list_id, version, since))
+
+@router.post("/{list_id}/changes", response_model=ShoppingListDelta)
+async def apply_changes(
+    list_id: str,
+    body: ShoppingOpsBatch,
+    since: int = Query(..., ge=0, description="The list version the client last synced"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Apply edits queued offline in one transaction, then answer like GET /{list_id}/changes.
+
+    The batch is folded to each item's final state first, so an item added, checked
+    and deleted offline never reaches the database. Edits to items someone else
+    deleted are dropped. Adds of an id the list already has, or has deleted, are
+    ignored, so a batch whose response was lost can be safely sent again. An add
+    whose id belongs to another list is a 409; one whose recipe is gone, or isn't
+    the household's, is added without its recipe.
+    """
+    household_id = current_user.household_id
+    if not body.ops:
+        return await list_changes(list_id, since, db, current_user)
+    version = await _claim_version(db, list_id, household_id)
+
+    added: dict[str, AddItemOp] = {}
+    checked: dict[str, bool] = {}
+    deleted: dict[str, None] = {}
+    for op in body.ops:
+        if isinstance(op, AddItemOp):
+            added[str(op.id)] = op
+            deleted.pop(str(op.id), None)
+        elif isinstance(op, CheckItemOp):
+            checked[op.item_id] = op.checked
+        else:
+            added.pop(op.item_id, None)
+            checked.pop(op.item_id, None)
+            deleted[op.item_id] = None
+
+    changed: list[ShoppingItem] = []
+    if added:
+        # A re-sent add must not bring back an item the list has deleted since
+        buried = await db.scalars(
+            select(ShoppingItemTombstone.item_id)
+            .where(ShoppingItemTombstone.list_id == list_id, ShoppingItemTombstone.item_id.in_(added))
+        )
+        for item_id in buried:
+            del added[item_id]
+    if added:
+        # The recipe may have been deleted while the client was offline; the item stays, unlinked
+        recipe_ids = {op.recipe_id for op in added.values() if op.recipe_id is not None}
+        known = set(await db.scalars(
+            select(Recipe.id).where(Recipe.id.in_(recipe_ids), Recipe.household_id == household_id)
+        )) if recipe_ids else set()
+        categories = await categorize_for_household(db, household_id, [op.ingredient_name for op in added.values()])
+        inserted = list(await db.scalars(
+            pg_insert(ShoppingItem)
+            .values([
+                {
+                    "id": item_id, "list_id": list_id, "recipe_id": op.recipe_id if op.recipe_id in known else None,
+                    "ingredient_name": op.ingredient_name, "quantity": op.quantity, "unit": op.unit,
+                    "checked": checked.pop(item_id, False), "category": category,
+                    "seq": version,
+                }
+                for (item_id, op), category in zip(added.items(), categories)
+            ])
+            .on_conflict_do_nothing(index_elements=[ShoppingItem.id])
+            .returning(ShoppingItem)
+        ))
+        # Ids that weren't inserted must already be this list's items (an earlier send of the batch)
+        skipped = added.keys() - {item.id for item in inserted}
+        if skipped and await db.scalar(
+            select(ShoppingItem.id).where(ShoppingItem.id.in_(skipped), ShoppingItem.list_id != list_id).limit(1)
+        ):
+            raise HTTPException(status_code=409, detail="Item id is already in use")
+        changed += inserted
+    for value in (True, False):
+        item_ids = [item_id for item_id, state in checked.items() if state is value]
+        if item_ids:
+            changed += await db.scalars(
+                update(ShoppingItem)
+                .where(ShoppingItem.list_id == list_id, ShoppingItem.id.in_(item_ids))
+                .values(checked=value, seq=version)
+                .returning(ShoppingItem)
+                .execution_options(synchronize_session=False)
+            )
+    gone = await _delete_items(db, list_id, version, list(deleted)) if deleted else []
+    await publish(db, list_id, "items_changed", version, changed, gone)
+    await db.commit()
+    return SHOPPING_LIST_DELTA.response(await _changes_since(db, list_id, version, since))
+
+@router.get("/{list_id}/events")
+async def list_events(
+    list_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    broker: ListBroker = Depends(get_broker),
+):
+    """Live changes to the list as Server-Sent Events.
+
+    The first message carries the list's current version. Each later one is an
+    {"event", "version", "items", "deleted"} change, as a ``?delta=true`` response
+    would report it. A "resync" message, sent when this client fell too far behind, means
+    reload the list and reconnect. The stream ends after either that or "list_deleted".
+
+    Like every other endpoint this needs the ``Authorization: Bearer`` header, which
+    the browser's ``EventSource`` cannot send: read the stream with ``fetch()`` (or
+    a fetch-based SSE reader) instead.
+    """
+    # Subscribe before reading the version so nothing committed in between is missed
+    sub = await broker.subscribe(list_id)
+    version = await db.scalar(
+        select(ShoppingList.version).where(ShoppingList.id == list_id, ShoppingList.household_id == current_user.household_id)
+    )
+    # The stream can stay open for hours; don't hold a pooled connection for it
+    await db.close()
+    if version is None:
+        broker.unsubscribe(sub)
+        raise HTTPException(status_code=404, detail="List not found")
+    return StreamingResponse(
+        broker.stream(sub, first=dumps({"event": "hello", "version": version})),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @router.delete("/{list_id}", status_code=204)
 async def delete_list(list_id: str, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
@@ -132,4 +524,5 @@ async def delete_list(list_id: str, db: AsyncSession = Depends(get_db), current_
     if not sl:
         raise HTTPException(status_code=404, detail="List not found")
     await db.delete(sl)
+    await publish(db, list_id, "list_deleted", sl.version + 1)
     await db.commit()
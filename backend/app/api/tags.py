@@ -1,12 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from datetime import datetime, UTC
+from sqlalchemy import select, delete, update
 from sqlalchemy.orm import selectinload
 from app.core.database import get_db
 from app.core.deps import get_current_user
-from app.models import User, Tag, Recipe, RecipeTag
-from app.schemas.tag import TagIn, TagOut
-from app.schemas.recipe import RecipeOut
+from app.core.etag import is_fresh, make_etag, not_modified
+from app.models import User, Household, Tag, Recipe, RecipeTag
+from app.schemas.tag import TagIn, TagOut, TAGS_OUT
+from app.schemas.recipe import RecipeOut, RECIPE_OUT
+from app.services.cache.base import recipe_key
+from app.services.cache.factory import get_cache
+from app.services.search import refresh_search_vectors
 import uuid
 
 router = APIRouter(prefix="/api/tags", tags=["tags"])
@@ -33,18 +38,33 @@ async def _get_or_create_tag(db: AsyncSession, household_id: str, tag_in: TagIn)
             color=_CATEGORY_COLORS.get(tag_in.category, "#84cc16"),
         )
         db.add(tag)
+        await _bump_tags_version(db, household_id)
         await db.flush()
     return tag
 
 
+async def _bump_tags_version(db: AsyncSession, household_id: str) -> None:
+    await db.execute(
+        update(Household).where(Household.id == household_id).values(tags_version=Household.tags_version + 1)
+    )
+
+
 @router.get("", response_model=list[TagOut])
-async def list_tags(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def list_tags(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    version = await db.scalar(select(Household.tags_version).where(Household.id == current_user.household_id))
+    etag = make_etag("tags", current_user.household_id, version)
+    if is_fresh(request, etag):
+        return not_modified(etag)
     result = await db.execute(
         select(Tag)
         .where(Tag.household_id == current_user.household_id)
         .order_by(Tag.category, Tag.name)
     )
-    return result.scalars().all()
+    return TAGS_OUT.response(result.scalars().all(), headers={"ETag": etag})
 
 
 @router.delete("/{tag_id}", status_code=204)
@@ -53,8 +73,24 @@ async def delete_tag(tag_id: str, db: AsyncSession = Depends(get_db), current_us
     tag = result.scalar_one_or_none()
     if not tag:
         raise HTTPException(status_code=404, detail="Tag not found")
+    tagged = await db.execute(
+        select(Recipe.id, Recipe.updated_at)
+        .join(RecipeTag, RecipeTag.recipe_id == Recipe.id)
+        .where(RecipeTag.tag_id == tag_id)
+    )
+    stale = tagged.all()
+    recipe_ids = [recipe_id for recipe_id, _ in stale]
     await db.delete(tag)
+    await _bump_tags_version(db, tag.household_id)
+    if recipe_ids:
+        # A recipe's tags are part of its content: bump updated_at so cached copies miss
+        await db.execute(
+            update(Recipe).where(Recipe.id.in_(recipe_ids)).values(updated_at=datetime.now(UTC))
+            .execution_options(synchronize_session=False)
+        )
+    await refresh_search_vectors(db, recipe_ids)
     await db.commit()
+    await get_cache().delete(*(recipe_key(tag.household_id, rid, ts) for rid, ts in stale))
 
 
 # ---- Recipe tag management ----
@@ -85,7 +121,11 @@ async def update_recipe_tags(
     for tag in resolved:
         db.add(RecipeTag(recipe_id=recipe_id, tag_id=tag.id))
 
+    cached = recipe_key(current_user.household_id, recipe_id, recipe.updated_at)
+    recipe.updated_at = datetime.now(UTC)
+    await refresh_search_vectors(db, [recipe_id])
     await db.commit()
+    await get_cache().delete(cached)
 
     # Expunge the recipe from the identity map so the next SELECT fetches
     # a completely fresh copy from the DB (avoids selectinload skipping the
@@ -96,4 +136,4 @@ async def update_recipe_tags(
         .options(selectinload(Recipe.ingredients), selectinload(Recipe.steps), selectinload(Recipe.tags))
         .where(Recipe.id == recipe_id, Recipe.household_id == current_user.household_id)
     )
-    return result.scalar_one()
+    return RECIPE_OUT.response(result.scalar_one())
@@ -16,4 +16,11 @@ class Settings(BaseSettings):
     parser_backend: str = "local"  # "local" | "ai" | "hybrid" (tesseract OCR + AI parser)
     openai_api_key: str = ""
 
+    response_cache_backend: str = "memory"  # "memory" | "none"
+    response_cache_max_bytes: int = 64 * 1024 * 1024
+
+    realtime_queue_size: int = 100  # events held per live-update stream before its client must resync
+
+    bulk_import_batch_size: int = 500  # recipes per multi-row INSERT in POST /api/recipes/bulk
+
 settings = Settings()
@@ -0,0 +1,69 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Sequence
+from fastapi import HTTPException
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+# Response header carrying the cursor for the next page; absent on the last page.
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# (sort expression, descending). The last key must be unique (usually the primary key)
+# so the ordering is total and no row is skipped or repeated across pages.
+KeysetKey = tuple[ColumnElement, bool]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[KeysetKey]) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError
+        return [
+            datetime.fromisoformat(v) if col.type.python_type is datetime else col.type.python_type(v)
+            for (col, _), v in zip(keys, values)
+        ]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _after(keys: Sequence[KeysetKey], values: Sequence[Any]):
+    """Rows strictly after ``values`` in ``keys`` order, as an OR of equal-prefix branches.
+
+    Spelled out rather than a row comparison so mixed ASC/DESC keys still match the index.
+    """
+    branches = []
+    for i, ((col, descending), value) in enumerate(zip(keys, values)):
+        prefix = [c == v for (c, _), v in zip(keys[:i], values[:i])]
+        branches.append(and_(*prefix, col < value if descending else col > value))
+    return or_(*branches)
+
+
+def keyset_page(stmt: Select, keys: Sequence[KeysetKey], *, limit: int | None, cursor: str | None) -> Select:
+    """Order ``stmt`` by ``keys`` and resume after ``cursor``.
+
+    The key expressions are appended as trailing result columns and one extra row is
+    fetched to detect a following page; hand the rows to ``split_page``.
+    """
+    stmt = (
+        stmt.add_columns(*(col.label(f"_keyset_{i}") for i, (col, _) in enumerate(keys)))
+        .order_by(*(col.desc() if descending else col.asc() for col, descending in keys))
+    )
+    if cursor:
+        stmt = stmt.where(_after(keys, decode_cursor(cursor, keys)))
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    return stmt
+
+
+def split_page(rows: Sequence, keys: Sequence[KeysetKey], limit: int | None) -> tuple[list, str | None]:
+    """Return (items, next_cursor) from rows produced by a ``keyset_page`` statement."""
+    if limit is None or len(rows) <= limit:
+        return [row[0] for row in rows], None
+    rows = rows[:limit]
+    return [row[0] for row in rows], encode_cursor(list(rows[-1][-len(keys):]))
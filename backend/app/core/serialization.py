@@ -0,0 +1,97 @@
+"""Opt-in fast path for JSON responses.
+
+FastAPI validates whatever an endpoint returns against its ``response_model`` —
+for ORM objects that means re-reading every attribute through pydantic — before
+dumping it. For objects this app loaded itself that validation is redundant.
+A ``Serializer`` is built once per schema and writes such objects straight to JSON
+bytes with orjson; endpoints keep ``response_model`` for the OpenAPI docs and
+return ``serializer.response(obj)``.
+"""
+import types
+import typing
+from typing import Any, Callable, Generic, TypeVar
+import orjson
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import case, func
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+# UTC as "Z", matching pydantic's own datetime output
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+def json_datetime(column: ColumnElement) -> ColumnElement:
+    """A timestamptz as the string ``dumps`` writes for it, for JSON built in SQL.
+
+    Postgres's own JSON rendering follows the session TimeZone ("+00:00"); this is
+    always UTC with a "Z", with microseconds only when there are any.
+    """
+    utc = func.timezone("UTC", column)
+    fraction = case((func.to_char(utc, "US") == "000000", ""), else_=func.to_char(utc, ".US"))
+    return func.concat(func.to_char(utc, 'YYYY-MM-DD"T"HH24:MI:SS'), fraction, "Z")
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson, for content that is already plain data
+    (query rows/mappings, dicts) and needs no pydantic pass at all."""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _compile(annotation: Any) -> Callable[[Any], Any] | None:
+    """Build a function mapping a trusted object onto ``annotation``'s JSON shape.
+
+    Pydantic models become dicts of their declared fields read by attribute
+    (so ORM objects work), lists and optionals recurse, and everything else is
+    left for orjson. Returns None where the value can be passed through as is.
+    """
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        fields = [(name, _compile(field.annotation)) for name, field in annotation.model_fields.items()]
+
+        def model(obj):
+            return {
+                name: getattr(obj, name) if convert is None else convert(getattr(obj, name))
+                for name, convert in fields
+            }
+        return model
+    if origin is list and args:
+        item = _compile(args[0])
+        return None if item is None else (lambda values: [item(v) for v in values])
+    if origin in (typing.Union, types.UnionType) and type(None) in args:
+        inner = [a for a in args if a is not type(None)]
+        convert = _compile(inner[0]) if len(inner) == 1 else None
+        return None if convert is None else (lambda value: None if value is None else convert(value))
+    return None
+
+
+class Serializer(Generic[T]):
+    """Pre-built JSON serializer for one response schema, e.g. ``Serializer(RecipeOut)``."""
+
+    def __init__(self, schema: type[T]) -> None:
+        self.adapter = TypeAdapter(schema)
+        self.plain: Callable[[Any], Any] = _compile(schema) or (lambda obj: obj)
+        """Map a trusted object onto plain dicts/lists that orjson can write."""
+
+    def dump(self, obj: Any) -> bytes:
+        """JSON for ``obj`` — a schema instance, or an ORM object/row with the same attributes.
+
+        Schema instances are dumped by their TypeAdapter without being validated again;
+        anything else is read field by field and written with orjson, unvalidated.
+        """
+        sample = obj[0] if isinstance(obj, list) and obj else obj
+        if isinstance(sample, BaseModel):
+            return self.adapter.dump_json(obj)
+        return dumps(self.plain(obj))
+
+    def response(self, obj: Any, status_code: int = 200, headers: dict[str, str] | None = None) -> Response:
+        return Response(content=self.dump(obj), status_code=status_code, headers=headers, media_type="application/json")
@@ -1,11 +1,11 @@
 from app.models.base import Base
 from app.models.household import Household, HouseholdInvite
 from app.models.user import User, UserRole
-from app.models.recipe import Recipe, Ingredient, Step, Tag, RecipeTag
-from app.models.shopping import ShoppingList, ShoppingItem
+from app.models.recipe import Recipe, Ingredient, IngredientTerm, Step, Tag, RecipeTag
+from app.models.shopping import ShoppingList, ShoppingItem, ShoppingItemTombstone, CategoryOverride
 
 __all__ = [
     "Base", "Household", "HouseholdInvite", "User", "UserRole",
-    "Recipe", "Ingredient", "Step", "Tag", "RecipeTag",
-    "ShoppingList", "ShoppingItem",
+    "Recipe", "Ingredient", "IngredientTerm", "Step", "Tag", "RecipeTag",
+    "ShoppingList", "ShoppingItem", "ShoppingItemTombstone", "CategoryOverride",
 ]
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, DDL, event
 
 convention = {
     "ix": "ix_%(column_0_label)s",
@@ -11,3 +11,7 @@ convention = {
 
 class Base(DeclarativeBase):
     metadata = MetaData(naming_convention=convention)
+
+# Trigram indexes (gin_trgm_ops) need pg_trgm. Migrations create it explicitly;
+# this covers metadata.create_all() as used by the test suite.
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
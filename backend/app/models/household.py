@@ -1,7 +1,7 @@
 import uuid
 import secrets
 from datetime import datetime, UTC
-from sqlalchemy import String, DateTime, ForeignKey
+from sqlalchemy import String, DateTime, ForeignKey, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 
@@ -11,6 +11,10 @@ class Household(Base):
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
+    # Bumped whenever the household's tags change; the tag list's ETag
+    tags_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    # Bumped whenever the household's category overrides change; validates cached copies
+    category_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     users: Mapped[list["User"]] = relationship(back_populates="household")
     recipes: Mapped[list["Recipe"]] = relationship(back_populates="household")
@@ -1,6 +1,7 @@
 import uuid
 from datetime import datetime, UTC
-from sqlalchemy import String, DateTime, ForeignKey, Integer, Text, JSON, ARRAY, Float
+from sqlalchemy import String, DateTime, ForeignKey, Integer, Text, JSON, ARRAY, Float, Index, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 
@@ -16,11 +17,16 @@ class Tag(Base):
     household: Mapped["Household"] = relationship(back_populates="tags")
     recipes: Mapped[list["Recipe"]] = relationship(secondary="recipe_tags", back_populates="tags")
 
+    __table_args__ = (
+        Index("ix_tags_household_id_name", "household_id", "name"),
+    )
+
 class RecipeTag(Base):
     __tablename__ = "recipe_tags"
 
     recipe_id: Mapped[str] = mapped_column(String, ForeignKey("recipes.id"), primary_key=True)
-    tag_id: Mapped[str] = mapped_column(String, ForeignKey("tags.id"), primary_key=True)
+    # The primary key leads with recipe_id; this serves lookups from the tag side
+    tag_id: Mapped[str] = mapped_column(String, ForeignKey("tags.id"), primary_key=True, index=True)
 
 class Recipe(Base):
     __tablename__ = "recipes"
@@ -44,6 +50,9 @@ class Recipe(Base):
     nutrition: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC), onupdate=lambda: datetime.now(UTC))
+    # Full-text document over title/description/ingredients/steps/tags; rebuilt by
+    # app.services.search.refresh_search_vectors. Deferred so ORM loads skip it.
+    search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True, deferred=True)
 
     household: Mapped["Household"] = relationship(back_populates="recipes")
     created_by: Mapped["User | None"] = relationship("User", foreign_keys=[created_by_id])
@@ -51,11 +60,19 @@ class Recipe(Base):
     steps: Mapped[list["Step"]] = relationship(back_populates="recipe", cascade="all, delete-orphan", order_by="Step.order")
     tags: Mapped[list["Tag"]] = relationship(secondary="recipe_tags", back_populates="recipes")
 
+    __table_args__ = (
+        # Keyset pagination order for list_recipes
+        Index("ix_recipes_household_id_created_at_id", "household_id", text("created_at DESC"), "id"),
+        Index("ix_recipes_search_vector", "search_vector", postgresql_using="gin"),
+        # Serves both fuzzy (<%) and substring (ILIKE '%q%') title search
+        Index("ix_recipes_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+    )
+
 class Ingredient(Base):
     __tablename__ = "ingredients"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    recipe_id: Mapped[str] = mapped_column(String, ForeignKey("recipes.id"), nullable=False)
+    recipe_id: Mapped[str] = mapped_column(String, ForeignKey("recipes.id"), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(500), nullable=False)
     quantity: Mapped[float | None] = mapped_column(Float, nullable=True)
     unit: Mapped[str | None] = mapped_column(String(100), nullable=True)
@@ -64,14 +81,29 @@ class Ingredient(Base):
 
     recipe: Mapped["Recipe"] = relationship(back_populates="ingredients")
 
+    __table_args__ = (
+        Index("ix_ingredients_name_trgm", "name", postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"}),
+    )
+
 class Step(Base):
     __tablename__ = "steps"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    recipe_id: Mapped[str] = mapped_column(String, ForeignKey("recipes.id"), nullable=False)
+    recipe_id: Mapped[str] = mapped_column(String, ForeignKey("recipes.id"), nullable=False, index=True)
     title: Mapped[str | None] = mapped_column(String(255), nullable=True)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     order: Mapped[int] = mapped_column(Integer, default=0)
     timer_seconds: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     recipe: Mapped["Recipe"] = relationship(back_populates="steps")
+
+class IngredientTerm(Base):
+    """Inverted index of normalized ingredient names (app.utils.terms) per recipe.
+
+    Rebuilt from Ingredient rows by app.services.search.refresh_ingredient_terms.
+    """
+    __tablename__ = "ingredient_terms"
+
+    household_id: Mapped[str] = mapped_column(String, ForeignKey("households.id"), primary_key=True)
+    term: Mapped[str] = mapped_column(String(500), primary_key=True)
+    recipe_id: Mapped[str] = mapped_column(String, ForeignKey("recipes.id", ondelete="CASCADE"), primary_key=True, index=True)
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, UTC
-from sqlalchemy import String, DateTime, ForeignKey, Boolean, Float
+from sqlalchemy import String, DateTime, ForeignKey, Boolean, Float, Integer, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 
@@ -11,20 +11,59 @@ class ShoppingList(Base):
     household_id: Mapped[str] = mapped_column(String, ForeignKey("households.id"), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(UTC))
+    # Bumped on every change to the list or its items; the list's ETag
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
 
     household: Mapped["Household"] = relationship(back_populates="shopping_lists")
     items: Mapped[list["ShoppingItem"]] = relationship(back_populates="list", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # Keyset pagination order for list_shopping_lists
+        Index("ix_shopping_lists_household_id_created_at_id", "household_id", text("created_at DESC"), "id"),
+    )
+
 class ShoppingItem(Base):
     __tablename__ = "shopping_items"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     list_id: Mapped[str] = mapped_column(String, ForeignKey("shopping_lists.id"), nullable=False)
-    recipe_id: Mapped[str | None] = mapped_column(String, ForeignKey("recipes.id", ondelete="SET NULL"), nullable=True)
+    # Indexed so deleting a recipe can find the items to SET NULL without a scan
+    recipe_id: Mapped[str | None] = mapped_column(String, ForeignKey("recipes.id", ondelete="SET NULL"), nullable=True, index=True)
     ingredient_name: Mapped[str] = mapped_column(String(500), nullable=False)
     quantity: Mapped[float | None] = mapped_column(Float, nullable=True)
     unit: Mapped[str | None] = mapped_column(String(100), nullable=True)
     checked: Mapped[bool] = mapped_column(Boolean, default=False)
     category: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    # The list version that last wrote this item; the changefeed returns items with seq > since
+    seq: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
     list: Mapped["ShoppingList"] = relationship(back_populates="items")
+
+    __table_args__ = (
+        # Also serves every plain list_id lookup
+        Index("ix_shopping_items_list_id_seq", "list_id", "seq"),
+    )
+
+class ShoppingItemTombstone(Base):
+    """A deleted item, kept so the changefeed can tell offline clients to drop it."""
+
+    __tablename__ = "shopping_item_tombstones"
+
+    list_id: Mapped[str] = mapped_column(String, ForeignKey("shopping_lists.id", ondelete="CASCADE"), primary_key=True)
+    item_id: Mapped[str] = mapped_column(String, primary_key=True)
+    # The list version that deleted the item
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_shopping_item_tombstones_list_id_seq", "list_id", "seq"),
+    )
+
+class CategoryOverride(Base):
+    """A household's own aisle for an ingredient, learned when someone re-categorizes an item."""
+
+    __tablename__ = "category_overrides"
+
+    household_id: Mapped[str] = mapped_column(String, ForeignKey("households.id", ondelete="CASCADE"), primary_key=True)
+    # Pantry term of the ingredient name (see app.utils.terms)
+    term: Mapped[str] = mapped_column(String(500), primary_key=True)
+    category: Mapped[str] = mapped_column(String(100), nullable=False)
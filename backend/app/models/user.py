@@ -13,7 +13,7 @@ class User(Base):
     __tablename__ = "users"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    household_id: Mapped[str] = mapped_column(String, ForeignKey("households.id"), nullable=False)
+    household_id: Mapped[str] = mapped_column(String, ForeignKey("households.id"), nullable=False, index=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     google_id: Mapped[str | None] = mapped_column(String(255), unique=True, nullable=True)
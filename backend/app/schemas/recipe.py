@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
+from app.core.serialization import Serializer
 
 class IngredientIn(BaseModel):
+    id: str | None = None  # set when editing an existing row; see update_recipe
     name: str
     quantity: float | None = None
     unit: str | None = None
@@ -12,6 +14,7 @@ class IngredientOut(IngredientIn):
     id: str
 
 class StepIn(BaseModel):
+    id: str | None = None
     title: str | None = None
     description: str
     order: int = 0
@@ -28,6 +31,9 @@ class TagOut(BaseModel):
 
     model_config = {"from_attributes": True}
 
+class TagFacet(TagOut):
+    recipe_count: int
+
 class CreatorOut(BaseModel):
     id: str
     name: str
@@ -91,3 +97,28 @@ class RecipeListItem(BaseModel):
     created_by: CreatorOut | None = None
 
     model_config = {"from_attributes": True}
+
+class PantryQuery(BaseModel):
+    ingredients: list[str]
+    limit: int = Field(20, ge=1, le=100)
+
+class PantryMatch(BaseModel):
+    id: str
+    title: str
+    image_url: str | None
+    ingredient_count: int
+    matched: list[str]
+    missing: list[str]
+
+class BulkItemResult(BaseModel):
+    index: int  # position in the submitted list / NDJSON stream
+    id: str | None = None
+    error: str | None = None
+
+class BulkImportResult(BaseModel):
+    created: int
+    failed: int
+    results: list[BulkItemResult]
+
+# Pre-built response serializers; see app.core.serialization
+RECIPE_OUT = Serializer(RecipeOut)
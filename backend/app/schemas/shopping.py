@@ -1,5 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import Annotated, Literal
+from uuid import UUID
+from app.core.serialization import Serializer
 
 class ShoppingItemIn(BaseModel):
     ingredient_name: str
@@ -18,6 +21,9 @@ class ShoppingItemOut(BaseModel):
 
     model_config = {"from_attributes": True}
 
+class ItemCategoryIn(BaseModel):
+    category: str = Field(min_length=1, max_length=100)
+
 class ShoppingListIn(BaseModel):
     name: str
 
@@ -26,10 +32,59 @@ class ShoppingListOut(BaseModel):
     name: str
     household_id: str
     created_at: datetime
+    version: int
     items: list[ShoppingItemOut] = []
 
     model_config = {"from_attributes": True}
 
+class ShoppingListSummary(BaseModel):
+    """A list on the index page (``GET /api/shopping?view=summary``): counts instead of items."""
+    id: str
+    name: str
+    created_at: datetime
+    version: int
+    item_count: int
+    checked_count: int
+
+class ShoppingListDelta(BaseModel):
+    """What changed in a list as of ``version``: written items and the ids of deleted ones.
+
+    Returned by mutations with ``?delta=true`` and by the changefeed.
+    """
+    id: str
+    version: int
+    items: list[ShoppingItemOut]
+    deleted: list[str] = []
+
+class AddItemOp(ShoppingItemIn):
+    op: Literal["add"]
+    # Chosen by the client, so re-sending a batch that already went through adds nothing twice
+    id: UUID
+
+class CheckItemOp(BaseModel):
+    op: Literal["check"]
+    item_id: str
+    checked: bool
+
+class DeleteItemOp(BaseModel):
+    op: Literal["delete"]
+    item_id: str
+
+ShoppingOp = Annotated[AddItemOp | CheckItemOp | DeleteItemOp, Field(discriminator="op")]
+
+class ShoppingOpsBatch(BaseModel):
+    """Edits a client queued while offline, in the order they were made."""
+    ops: list[ShoppingOp] = Field(max_length=1000)
+
 class AddFromRecipeRequest(BaseModel):
     recipe_id: str
     ingredient_ids: list[str] | None = None
+    scale: float = Field(1.0, gt=0, le=100)
+
+class AddFromRecipesRequest(BaseModel):
+    recipes: list[AddFromRecipeRequest] = Field(min_length=1, max_length=100)
+
+# Pre-built response serializers; see app.core.serialization
+SHOPPING_LIST_OUT = Serializer(ShoppingListOut)
+SHOPPING_LISTS_OUT = Serializer(list[ShoppingListOut])
+SHOPPING_LIST_DELTA = Serializer(ShoppingListDelta)
@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from app.core.serialization import Serializer
 
 class TagIn(BaseModel):
     name: str
@@ -12,3 +13,6 @@ class TagOut(BaseModel):
     household_id: str
 
     model_config = {"from_attributes": True}
+
+# Pre-built response serializer; see app.core.serialization
+TAGS_OUT = Serializer(list[TagOut])
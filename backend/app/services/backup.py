@@ -0,0 +1,340 @@
+"""Household export and restore.
+
+Exports read recipes and shopping lists through a server-side cursor a page at a
+time (children loaded per page with selectinload) and release each page before the
+next is fetched, so memory stays flat however many recipes the household has.
+
+Restores load an NDJSON export back with COPY, in the caller's transaction.
+"""
+import json
+import logging
+import uuid
+from datetime import datetime, UTC
+from typing import AsyncIterator, Iterable, Literal
+import asyncpg
+from sqlalchemy import ARRAY, Select, String, any_, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import selectinload
+from app.models import (
+    Household, User, Recipe, Ingredient, Step, Tag, RecipeTag, ShoppingList, ShoppingItem,
+)
+from app.core.serialization import dumps
+from app.schemas.recipe import RECIPE_OUT, TagOut
+from app.schemas.shopping import SHOPPING_LIST_OUT
+from app.services.search import reindex_recipes
+from app.utils.units import format_quantity
+
+ExportFormat = Literal["ndjson", "jsonld"]
+
+EXPORT_VERSION = 1
+EXPORT_PAGE_SIZE = 500
+
+MEDIA_TYPES: dict[str, str] = {"ndjson": "application/x-ndjson", "jsonld": "application/ld+json"}
+
+# SQLSTATE -> why a table's rows were rejected; the driver's own text quotes keys and values
+_COPY_MESSAGES = {
+    "22001": "a value is too long",
+    "22003": "a number is out of range",
+    "23502": "a required value is missing",
+    "23503": "a row refers to one that doesn't exist",
+    "23505": "the archive repeats an id",
+}
+
+logger = logging.getLogger(__name__)
+
+
+async def _pages(session: AsyncSession, stmt: Select) -> AsyncIterator[list]:
+    result = await session.stream(stmt.execution_options(yield_per=EXPORT_PAGE_SIZE))
+    async for page in result.scalars().partitions():
+        yield page
+        # Drop the page (and, by cascade, its children) from the identity map before
+        # fetching the next one. Tags and creators are few and stay cached.
+        for obj in page:
+            session.expunge(obj)
+
+
+def _recipe_pages(session: AsyncSession, household_id: str) -> AsyncIterator[list[Recipe]]:
+    return _pages(
+        session,
+        select(Recipe)
+        .options(
+            selectinload(Recipe.ingredients),
+            selectinload(Recipe.steps),
+            selectinload(Recipe.tags),
+            selectinload(Recipe.created_by),
+        )
+        .where(Recipe.household_id == household_id)
+        .order_by(Recipe.created_at, Recipe.id),
+    )
+
+
+def _line(record: dict) -> bytes:
+    return dumps(record) + b"\n"
+
+
+async def _ndjson(session: AsyncSession, household: Household) -> AsyncIterator[bytes]:
+    """``household`` header, then every ``tag``, ``recipe`` and ``shopping_list`` — one JSON object per line."""
+    yield _line({
+        "type": "household", "version": EXPORT_VERSION, "id": household.id, "name": household.name,
+        "exported_at": datetime.now(UTC).isoformat(),
+    })
+    tags = await session.execute(select(Tag).where(Tag.household_id == household.id).order_by(Tag.name))
+    yield b"".join(_line({"type": "tag", **TagOut.model_validate(tag).model_dump()}) for tag in tags.scalars())
+    async for page in _recipe_pages(session, household.id):
+        yield b"".join(
+            _line({"type": "recipe", **RECIPE_OUT.plain(r)}) for r in page
+        )
+    lists = _pages(
+        session,
+        select(ShoppingList)
+        .options(selectinload(ShoppingList.items))
+        .where(ShoppingList.household_id == household.id)
+        .order_by(ShoppingList.created_at, ShoppingList.id),
+    )
+    async for page in lists:
+        yield b"".join(
+            _line({"type": "shopping_list", **SHOPPING_LIST_OUT.plain(sl)}) for sl in page
+        )
+
+
+# ---- schema.org JSON-LD ----
+
+def _duration(minutes: int | None) -> str | None:
+    return f"PT{minutes}M" if minutes is not None else None
+
+
+def _ingredient_line(ingredient) -> str:
+    line = " ".join(filter(None, [format_quantity(ingredient.quantity), ingredient.unit, ingredient.name]))
+    return f"{line}, {ingredient.notes}" if ingredient.notes else line
+
+
+def recipe_jsonld(recipe: Recipe) -> dict:
+    """A recipe as a schema.org ``Recipe`` node; empty properties are left out."""
+    node = {
+        "@type": "Recipe",
+        "identifier": recipe.id,
+        "name": recipe.title,
+        "description": recipe.description,
+        "image": recipe.image_url,
+        "url": recipe.source_url,
+        "author": {"@type": "Person", "name": recipe.author} if recipe.author else None,
+        "recipeYield": recipe.servings,
+        "prepTime": _duration(recipe.prep_time),
+        "cookTime": _duration(recipe.cook_time),
+        "totalTime": _duration(recipe.total_time),
+        "recipeCuisine": recipe.cuisine,
+        "recipeCategory": recipe.category,
+        "cookingMethod": recipe.cooking_method,
+        "suitableForDiet": recipe.suitable_for_diet,
+        "nutrition": {"@type": "NutritionInformation", **recipe.nutrition} if recipe.nutrition else None,
+        "keywords": ", ".join(tag.name for tag in recipe.tags),
+        "recipeIngredient": [_ingredient_line(i) for i in recipe.ingredients],
+        "recipeInstructions": [
+            {k: v for k, v in {"@type": "HowToStep", "name": s.title, "text": s.description}.items() if v}
+            for s in recipe.steps
+        ],
+        "dateCreated": recipe.created_at.isoformat(),
+        "dateModified": recipe.updated_at.isoformat(),
+    }
+    return {k: v for k, v in node.items() if v not in (None, "", [])}
+
+
+async def _jsonld(session: AsyncSession, household: Household) -> AsyncIterator[bytes]:
+    """One JSON-LD document whose ``@graph`` holds every recipe, written out page by page."""
+    yield b'{"@context":"https://schema.org","@graph":['
+    first = True
+    async for page in _recipe_pages(session, household.id):
+        chunk = b",".join(dumps(recipe_jsonld(r)) for r in page)
+        yield chunk if first else b"," + chunk
+        first = False
+    yield b"]}"
+
+
+async def export_household(bind: AsyncEngine, household_id: str, format: ExportFormat) -> AsyncIterator[bytes]:
+    """Body of a streaming export response.
+
+    Opens its own session: the request's session may be closed before the response
+    body has finished streaming.
+    """
+    async with AsyncSession(bind) as session:
+        household = await session.get(Household, household_id)
+        stream = _ndjson if format == "ndjson" else _jsonld
+        async for chunk in stream(session, household):
+            yield chunk
+
+
+# ---- Restore ----
+
+# Recipe ids per reindex call, keeping each IN list well under the bind parameter limit
+_REINDEX_CHUNK = 1000
+
+
+def _timestamp(value: str | None) -> datetime:
+    return datetime.fromisoformat(value) if value else datetime.now(UTC)
+
+
+async def _taken(db: AsyncSession, model: type, ids: Iterable[str]) -> set[str]:
+    """Which of ``ids`` already exist in ``model``'s table, in one array-parameter query."""
+    ids = list(ids)
+    if not ids:
+        return set()
+    result = await db.execute(select(model.id).where(model.id == any_(literal(ids, ARRAY(String)))))
+    return set(result.scalars())
+
+
+async def _remap(db: AsyncSession, model: type, ids: Iterable[str]) -> dict[str, str]:
+    """Archive id -> id to write: unchanged unless another row already uses it."""
+    ids = list(dict.fromkeys(ids))
+    taken = await _taken(db, model, ids)
+    return {old: str(uuid.uuid4()) if old in taken else old for old in ids}
+
+
+async def _copy(driver: asyncpg.Connection, model: type, rows: list[dict]) -> None:
+    if not rows:
+        return
+    columns = list(rows[0])
+    try:
+        await driver.copy_records_to_table(
+            model.__tablename__, columns=columns, records=[tuple(row[c] for c in columns) for row in rows],
+        )
+    except asyncpg.PostgresError as exc:
+        logger.warning("Restore rejected %s rows: %s", model.__tablename__, exc)
+        reason = _COPY_MESSAGES.get(exc.sqlstate, "the database rejected its rows")
+        raise ValueError(f"Could not restore {model.__tablename__}: {reason}") from exc
+
+
+def _read_archive(lines: Iterable[bytes | str]) -> dict[str, list[dict]]:
+    records: dict[str, list[dict]] = {"household": [], "tag": [], "recipe": [], "shopping_list": []}
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            records[record["type"]].append(record)
+        except (ValueError, TypeError, KeyError):
+            raise ValueError(f"Line {number} is not an export record")
+    header = records["household"]
+    if len(header) != 1 or header[0].get("version", 0) > EXPORT_VERSION:
+        raise ValueError("Not a household export this version can restore")
+    return records
+
+
+async def restore_household(db: AsyncSession, household_id: str, lines: Iterable[bytes | str]) -> dict[str, int]:
+    """Load an NDJSON export into ``household_id``; returns rows written per table.
+
+    Everything goes through COPY on the session's connection, so it commits or rolls
+    back with the caller's transaction. Tags are merged into existing ones by name;
+    any other id already in use is replaced with a fresh one and references follow.
+    Raises ValueError for an unreadable archive or rows the database rejects.
+    """
+    records = _read_archive(lines)
+    try:
+        return await _restore(db, household_id, records)
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"Malformed export record: missing or invalid {exc}")
+
+
+async def _restore(db: AsyncSession, household_id: str, records: dict[str, list[dict]]) -> dict[str, int]:
+    recipes, lists = records["recipe"], records["shopping_list"]
+
+    # Tags: standalone records plus any only seen on recipes, merged by name
+    archive_tags = {t["id"]: t for t in records["tag"]}
+    for recipe in recipes:
+        for tag in recipe["tags"]:
+            archive_tags.setdefault(tag["id"], tag)
+    existing = await db.execute(select(Tag.name, Tag.id).where(Tag.household_id == household_id))
+    tag_ids: dict[str, str] = {}
+    by_name = dict(existing.all())
+    new_tag_ids = await _remap(db, Tag, [t["id"] for t in archive_tags.values() if t["name"] not in by_name])
+    tag_rows = []
+    for old, tag in archive_tags.items():
+        if tag["name"] not in by_name:
+            by_name[tag["name"]] = new_tag_ids[old]
+            tag_rows.append({
+                "id": new_tag_ids[old], "household_id": household_id, "name": tag["name"],
+                "category": tag.get("category", "custom"), "color": tag.get("color", "#84cc16"),
+            })
+        tag_ids[old] = by_name[tag["name"]]
+
+    users = set((await db.execute(select(User.id).where(User.household_id == household_id))).scalars())
+    recipe_ids = await _remap(db, Recipe, [r["id"] for r in recipes])
+    ingredient_ids = await _remap(db, Ingredient, [i["id"] for r in recipes for i in r["ingredients"]])
+    step_ids = await _remap(db, Step, [s["id"] for r in recipes for s in r["steps"]])
+    list_ids = await _remap(db, ShoppingList, [sl["id"] for sl in lists])
+    item_ids = await _remap(db, ShoppingItem, [i["id"] for sl in lists for i in sl["items"]])
+
+    recipe_rows, ingredient_rows, step_rows, link_rows = [], [], [], set()
+    for r in recipes:
+        rid = recipe_ids[r["id"]]
+        creator = (r.get("created_by") or {}).get("id")
+        recipe_rows.append({
+            "id": rid, "household_id": household_id, "created_by_id": creator if creator in users else None,
+            "title": r["title"], "description": r.get("description"), "image_url": r.get("image_url"),
+            "source_url": r.get("source_url"), "author": r.get("author"), "servings": r.get("servings"),
+            "prep_time": r.get("prep_time"), "cook_time": r.get("cook_time"), "total_time": r.get("total_time"),
+            "cuisine": r.get("cuisine"), "category": r.get("category"), "cooking_method": r.get("cooking_method"),
+            "suitable_for_diet": r.get("suitable_for_diet"),
+            # COPY bypasses SQLAlchemy's JSON type, and the json codec takes text
+            "nutrition": json.dumps(r["nutrition"]) if r.get("nutrition") is not None else None,
+            "created_at": _timestamp(r.get("created_at")), "updated_at": _timestamp(r.get("updated_at")),
+        })
+        ingredient_rows += [
+            {
+                "id": ingredient_ids[i["id"]], "recipe_id": rid, "name": i["name"], "quantity": i.get("quantity"),
+                "unit": i.get("unit"), "notes": i.get("notes"), "order": i.get("order", n),
+            }
+            for n, i in enumerate(r["ingredients"])
+        ]
+        step_rows += [
+            {
+                "id": step_ids[s["id"]], "recipe_id": rid, "title": s.get("title"), "description": s["description"],
+                "order": s.get("order", n), "timer_seconds": s.get("timer_seconds"),
+            }
+            for n, s in enumerate(r["steps"])
+        ]
+        link_rows.update((rid, tag_ids[t["id"]]) for t in r["tags"])
+
+    list_rows, item_rows = [], []
+    for sl in lists:
+        lid = list_ids[sl["id"]]
+        list_rows.append({
+            "id": lid, "household_id": household_id, "name": sl["name"], "created_at": _timestamp(sl.get("created_at")),
+        })
+        item_rows += [
+            {
+                "id": item_ids[i["id"]], "list_id": lid,
+                # Items from recipes that weren't in the archive keep their text but lose the link
+                "recipe_id": recipe_ids.get(i.get("recipe_id")), "ingredient_name": i["ingredient_name"],
+                "quantity": i.get("quantity"), "unit": i.get("unit"), "checked": i.get("checked", False),
+                "category": i.get("category"),
+            }
+            for i in sl["items"]
+        ]
+
+    driver = (await (await db.connection()).get_raw_connection()).driver_connection
+    await _copy(driver, Tag, tag_rows)
+    if tag_rows:
+        await db.execute(
+            update(Household).where(Household.id == household_id).values(tags_version=Household.tags_version + 1)
+        )
+    await _copy(driver, Recipe, recipe_rows)
+    await _copy(driver, Ingredient, ingredient_rows)
+    await _copy(driver, Step, step_rows)
+    await _copy(driver, RecipeTag, [{"recipe_id": r, "tag_id": t} for r, t in link_rows])
+    await _copy(driver, ShoppingList, list_rows)
+    await _copy(driver, ShoppingItem, item_rows)
+
+    restored = [row["id"] for row in recipe_rows]
+    for start in range(0, len(restored), _REINDEX_CHUNK):
+        await reindex_recipes(db, restored[start:start + _REINDEX_CHUNK])
+
+    remapped = sum(
+        old != new
+        for ids in (recipe_ids, ingredient_ids, step_ids, list_ids, item_ids, new_tag_ids)
+        for old, new in ids.items()
+    )
+    return {
+        "tags": len(tag_rows), "recipes": len(recipe_rows), "ingredients": len(ingredient_rows),
+        "steps": len(step_rows), "recipe_tags": len(link_rows), "shopping_lists": len(list_rows),
+        "shopping_items": len(item_rows), "remapped_ids": remapped,
+    }
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class ResponseCache(ABC):
+    """Pre-serialized response bodies by key.
+
+    Keys embed the version of what they cache (e.g. a recipe's updated_at), so a
+    stale entry is simply never asked for again; ``delete`` only frees it early.
+    That keeps per-worker caches correct without any cross-process invalidation.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Return the cached body, or None on a miss."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes) -> None: ...
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None: ...
+
+
+class NullCache(ResponseCache):
+    async def get(self, key: str) -> bytes | None:
+        return None
+
+    async def set(self, key: str, value: bytes) -> None:
+        pass
+
+    async def delete(self, *keys: str) -> None:
+        pass
+
+
+def recipe_key(household_id: str, recipe_id: str, updated_at: datetime, variant: str = "") -> str:
+    """Key for a recipe body; ``variant`` distinguishes scaled/converted views of it."""
+    key = f"recipe:{household_id}:{recipe_id}:{updated_at.isoformat()}"
+    return f"{key}:{variant}" if variant else key
@@ -0,0 +1,12 @@
+from functools import cache
+from app.core.config import settings
+from app.services.cache.base import NullCache, ResponseCache
+
+
+@cache
+def get_cache() -> ResponseCache:
+    """The process-wide response cache; one instance so every request shares it."""
+    if settings.response_cache_backend == "none":
+        return NullCache()
+    from app.services.cache.memory import MemoryCache
+    return MemoryCache(max_bytes=settings.response_cache_max_bytes)
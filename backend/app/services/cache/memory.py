@@ -0,0 +1,33 @@
+from collections import OrderedDict
+from app.services.cache.base import ResponseCache
+
+
+class MemoryCache(ResponseCache):
+    """In-process LRU bounded by the total size of the cached bodies."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+
+    async def get(self, key: str) -> bytes | None:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        await self.delete(key)
+        self._entries[key] = value
+        self.size += len(value)
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self.size -= len(value)
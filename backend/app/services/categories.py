@@ -0,0 +1,65 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Sequence
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import CategoryOverride, Household
+from app.utils.categorize import categorize_many
+from app.utils.terms import ingredient_term
+
+# household_id -> (category_version, {term: category}). A copy is used only while its
+# version matches the household's, so a write through another worker can't leave a
+# stale copy here; writes through this one also drop it straight away. Only the most
+# recently used households are kept, so a long-running worker's memory stays flat.
+_overrides: OrderedDict[str, tuple[int, dict[str, str]]] = OrderedDict()
+_MAX_HOUSEHOLDS = 1024
+
+
+@lru_cache(maxsize=4096)
+def override_term(name: str) -> str:
+    return ingredient_term(name) or name.strip().lower()
+
+
+async def _household_overrides(db: AsyncSession, household_id: str) -> dict[str, str]:
+    version = (await db.execute(
+        select(Household.category_version).where(Household.id == household_id)
+    )).scalar_one()
+    cached = _overrides.get(household_id)
+    if cached is None or cached[0] != version:
+        rows = await db.execute(
+            select(CategoryOverride.term, CategoryOverride.category).where(CategoryOverride.household_id == household_id)
+        )
+        cached = _overrides[household_id] = (version, dict(rows.all()))
+        while len(_overrides) > _MAX_HOUSEHOLDS:
+            _overrides.popitem(last=False)
+    _overrides.move_to_end(household_id)
+    return cached[1]
+
+
+async def categorize_for_household(db: AsyncSession, household_id: str, names: Sequence[str]) -> list[str]:
+    """Grocery section per ingredient name: the household's overrides first, then the keyword map.
+
+    One version check (plus one load when the cached overrides are out of date)
+    per call, however many names there are.
+    """
+    overrides = await _household_overrides(db, household_id)
+    terms = [override_term(name) for name in names]
+    defaults = iter(categorize_many(name for name, term in zip(names, terms) if term not in overrides))
+    return [overrides[term] if term in overrides else next(defaults) for term in terms]
+
+
+async def record_override(db: AsyncSession, household_id: str, name: str, category: str) -> None:
+    """Remember ``category`` for this ingredient in the household; takes effect once committed."""
+    stmt = insert(CategoryOverride).values(household_id=household_id, term=override_term(name), category=category)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[CategoryOverride.household_id, CategoryOverride.term],
+        set_={"category": stmt.excluded.category},
+    ))
+    await db.execute(
+        update(Household)
+        .where(Household.id == household_id)
+        .values(category_version=Household.category_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    _overrides.pop(household_id, None)
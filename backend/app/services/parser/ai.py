@@ -6,7 +6,7 @@ from recipe_scrapers import scrape_html
 
 from app.core.config import settings
 from app.services.parser.base import ParsedIngredient, ParsedRecipe, RecipeParser
-from app.utils.units import parse_ingredient_string
+from app.utils.units import parse_ingredient_string, parse_many
 
 _SYSTEM_PROMPT = """You are a recipe data extractor. Your job is to organize text into structured JSON — NOT to rewrite, summarize, or improve the text.
 
@@ -50,7 +50,6 @@ def _parse_json_recipe(data: dict) -> ParsedRecipe:
             ))
         elif isinstance(ing, str):
             # Legacy plain-string format — best effort parse
-            from app.utils.units import parse_ingredient_string
             ingredients.append(parse_ingredient_string(ing))
 
     return ParsedRecipe(
@@ -117,7 +116,7 @@ class AIRecipeParser(RecipeParser):
                     prep_time=_mins(scraper.prep_time()),
                     cook_time=_mins(scraper.cook_time()),
                     total_time=_mins(scraper.total_time()),
-                    ingredients=[parse_ingredient_string(i) for i in ingredients],
+                    ingredients=parse_many(ingredients),
                     steps=steps_raw,
                 )
         except Exception:
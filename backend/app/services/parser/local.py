@@ -1,6 +1,6 @@
 from recipe_scrapers import scrape_me, WebsiteNotImplementedError, NoSchemaFoundInWildMode
 from app.services.parser.base import RecipeParser, ParsedRecipe, ParsedIngredient
-from app.utils.units import parse_ingredient_string
+from app.utils.units import parse_ingredient_string, parse_many
 
 def _duration_to_minutes(value) -> int | None:
     """Convert recipe-scrapers time value (int minutes) to int or None."""
@@ -45,7 +45,7 @@ class LocalRecipeParser(RecipeParser):
             total_time=_duration_to_minutes(safe(scraper.total_time)),
             cuisine=safe(scraper.cuisine),
             category=safe(scraper.category),
-            ingredients=[parse_ingredient_string(i) for i in ingredients_raw],
+            ingredients=parse_many(ingredients_raw),
             steps=steps,
         )
 
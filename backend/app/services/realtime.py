@@ -0,0 +1,153 @@
+"""Shopping-list change events pushed to subscribed clients.
+
+Writers call ``publish`` inside their transaction. Postgres hands the NOTIFY to
+every listening API worker once that transaction commits, and drops it if it
+rolls back. Each worker runs one ``ListBroker``: a single LISTEN connection plus
+a registry of subscriptions per list, each with a bounded queue.
+
+A client too slow to drain its queue is not allowed to hold events back for
+everyone else. Its queue is emptied and replaced by one "resync" message, and
+the client reloads the list. The same happens to everyone when the LISTEN
+connection is lost.
+"""
+import asyncio
+from functools import cache
+from typing import AsyncIterator, Sequence
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.serialization import Serializer, dumps
+from app.models import ShoppingItem
+from app.schemas.shopping import ShoppingItemOut
+
+CHANNEL = "shopping_list_events"
+# Postgres caps NOTIFY payloads at 8000 bytes; bigger events go out without their items
+_MAX_PAYLOAD = 7900
+_ITEMS_OUT = Serializer(list[ShoppingItemOut])
+_RESYNC = b'{"event":"resync"}'
+# publish() writes "event" first, so a deletion is recognised without parsing the payload
+_LIST_DELETED = b'{"event":"list_deleted",'
+
+
+async def publish(
+    db: AsyncSession,
+    list_id: str,
+    event: str,
+    version: int,
+    items: Sequence[ShoppingItem] = (),
+    deleted: Sequence[str] = (),
+) -> None:
+    """Queue ``event`` for the list's subscribers. It is sent when ``db`` commits.
+
+    Subscribers receive ``{"event", "version", "items", "deleted"}``: the touched
+    items and the ids of deleted ones. Both are null when there were too many to
+    send, and the list should be reloaded.
+    """
+    body = dumps({"event": event, "version": version, "items": _ITEMS_OUT.plain(items), "deleted": list(deleted)})
+    if len(body) > _MAX_PAYLOAD:
+        body = dumps({"event": event, "version": version, "items": None, "deleted": None})
+    # "<list id> <json>": the broker routes on the prefix without parsing the JSON
+    await db.execute(select(func.pg_notify(CHANNEL, f"{list_id} {body.decode()}")))
+
+
+class Subscription:
+    """One client's stream of events for one list."""
+
+    def __init__(self, list_id: str, queue_size: int) -> None:
+        self.list_id = list_id
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(queue_size)
+
+
+class ListBroker:
+    """Fans this worker's share of list events out from one LISTEN connection."""
+
+    def __init__(self, database_url: str, queue_size: int = 100) -> None:
+        self._dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self._queue_size = queue_size
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._conn: asyncpg.Connection | None = None
+        self._connecting = asyncio.Lock()
+
+    async def subscribe(self, list_id: str) -> Subscription:
+        """Register for the list's events; they start arriving once this returns."""
+        await self._listen()
+        sub = Subscription(list_id, self._queue_size)
+        self._subscribers.setdefault(list_id, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        subs = self._subscribers.get(sub.list_id)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._subscribers[sub.list_id]
+
+    def subscriber_count(self, list_id: str) -> int:
+        return len(self._subscribers.get(list_id, ()))
+
+    async def stream(self, sub: Subscription, first: bytes | None = None, heartbeat: float = 15.0) -> AsyncIterator[bytes]:
+        """Server-Sent Events for ``sub``, starting with ``first`` if given.
+
+        A comment line every ``heartbeat`` seconds keeps proxies from closing an idle
+        stream. Ends after a resync message or the list's deletion; unsubscribes
+        however it ends.
+        """
+        try:
+            yield b"retry: 3000\n\n"
+            if first is not None:
+                yield b"data: " + first + b"\n\n"
+            while True:
+                try:
+                    data = await asyncio.wait_for(sub.queue.get(), heartbeat)
+                except TimeoutError:
+                    yield b": keep-alive\n\n"
+                    continue
+                yield b"data: " + data + b"\n\n"
+                if data is _RESYNC or data.startswith(_LIST_DELETED):
+                    return
+        finally:
+            self.unsubscribe(sub)
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.close()
+
+    async def _listen(self) -> None:
+        async with self._connecting:
+            if self._conn is None or self._conn.is_closed():
+                conn = await asyncpg.connect(self._dsn)
+                conn.add_termination_listener(self._on_lost)
+                await conn.add_listener(CHANNEL, self._on_notify)
+                self._conn = conn
+
+    def _on_notify(self, conn: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        list_id, _, body = payload.partition(" ")
+        data = body.encode()
+        for sub in list(self._subscribers.get(list_id, ())):
+            try:
+                sub.queue.put_nowait(data)
+            except asyncio.QueueFull:
+                self._resync(sub)
+
+    def _on_lost(self, conn: asyncpg.Connection) -> None:
+        # Events may have been missed while disconnected; everyone reloads. The next subscribe reconnects.
+        if conn is self._conn:
+            self._conn = None
+        for subs in list(self._subscribers.values()):
+            for sub in list(subs):
+                self._resync(sub)
+
+    def _resync(self, sub: Subscription) -> None:
+        self.unsubscribe(sub)
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        sub.queue.put_nowait(_RESYNC)
+
+
+@cache
+def get_broker() -> ListBroker:
+    """This worker's broker; one instance so every stream shares its LISTEN connection."""
+    return ListBroker(settings.database_url, queue_size=settings.realtime_queue_size)
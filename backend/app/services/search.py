@@ -0,0 +1,139 @@
+from typing import Iterable
+from sqlalchemy import Float, func, select, update, delete, insert, literal, literal_column, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Recipe, Ingredient, IngredientTerm, Step, Tag, RecipeTag
+from app.utils.terms import ingredient_term
+
+# Text search configuration used both when building documents and parsing queries —
+# the two must match or stemmed terms won't line up.
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+
+def _weighted(text, weight: str):
+    return func.setweight(func.to_tsvector(SEARCH_CONFIG, func.coalesce(text, "")), literal_column(f"'{weight}'"))
+
+
+def search_document():
+    """SQL expression for a recipe's search document, correlated to the outer ``recipes`` row.
+
+    Weights: title A, tags + ingredient names B, description C, step text D.
+    """
+    tag_names = (
+        select(func.string_agg(Tag.name, " "))
+        .join(RecipeTag, RecipeTag.tag_id == Tag.id)
+        .where(RecipeTag.recipe_id == Recipe.id)
+        .correlate(Recipe)
+        .scalar_subquery()
+    )
+    ingredient_names = (
+        select(func.string_agg(Ingredient.name, " "))
+        .where(Ingredient.recipe_id == Recipe.id)
+        .correlate(Recipe)
+        .scalar_subquery()
+    )
+    step_text = (
+        select(func.string_agg(func.concat_ws(" ", Step.title, Step.description), " "))
+        .where(Step.recipe_id == Recipe.id)
+        .correlate(Recipe)
+        .scalar_subquery()
+    )
+    return (
+        _weighted(Recipe.title, "A")
+        .op("||")(_weighted(tag_names, "B"))
+        .op("||")(_weighted(ingredient_names, "B"))
+        .op("||")(_weighted(Recipe.description, "C"))
+        .op("||")(_weighted(step_text, "D"))
+    )
+
+
+def search_query(q: str):
+    """Parse user input with web-search syntax ("quoted phrases", -exclusions, or)."""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+
+def search_rank(tsquery):
+    return func.ts_rank(Recipe.search_vector, tsquery, type_=Float)
+
+
+def matches_search(tsquery):
+    return Recipe.search_vector.op("@@")(tsquery)
+
+
+def matches_title_substring(q: str):
+    # Leading-wildcard ILIKE is served by the title trigram index
+    return Recipe.title.ilike(f"%{q}%")
+
+
+# ---- Fuzzy (pg_trgm) search ----
+
+async def set_similarity_threshold(db: AsyncSession, threshold: float) -> None:
+    """Set the cutoff used by the ``<%`` operator for the rest of this transaction."""
+    await db.execute(select(func.set_config("pg_trgm.word_similarity_threshold", str(threshold), True)))
+
+
+def matches_fuzzy(q: str):
+    """Title or any ingredient name is word-similar to ``q``; both sides use trigram indexes."""
+    return or_(
+        literal(q).op("<%")(Recipe.title),
+        Recipe.id.in_(select(Ingredient.recipe_id).where(literal(q).op("<%")(Ingredient.name))),
+    )
+
+
+def fuzzy_rank(q: str):
+    best_ingredient = (
+        select(func.max(func.word_similarity(q, Ingredient.name)))
+        .where(Ingredient.recipe_id == Recipe.id)
+        .correlate(Recipe)
+        .scalar_subquery()
+    )
+    return func.greatest(func.word_similarity(q, Recipe.title), func.coalesce(best_ingredient, 0), type_=Float)
+
+
+async def refresh_search_vectors(db: AsyncSession, recipe_ids: Iterable[str]) -> None:
+    """Rebuild the search document for the given recipes in one set-based UPDATE.
+
+    Call after ingredients, steps or tag links change; pending ORM changes are
+    autoflushed first so the document sees them.
+    """
+    ids = list(recipe_ids)
+    if not ids:
+        return
+    await db.execute(
+        update(Recipe)
+        .where(Recipe.id.in_(ids))
+        # Keep updated_at as-is: a reindex alone isn't a content change.
+        .values(search_vector=search_document(), updated_at=Recipe.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+# ---- Pantry term index ----
+
+async def refresh_ingredient_terms(db: AsyncSession, recipe_ids: Iterable[str]) -> None:
+    """Replace the ingredient_terms rows for the given recipes from their current ingredients."""
+    ids = list(recipe_ids)
+    if not ids:
+        return
+    result = await db.execute(
+        select(Recipe.household_id, Ingredient.recipe_id, Ingredient.name)
+        .join(Recipe, Recipe.id == Ingredient.recipe_id)
+        .where(Ingredient.recipe_id.in_(ids))
+    )
+    rows = {
+        (household_id, term, recipe_id)
+        for household_id, recipe_id, name in result
+        if (term := ingredient_term(name))
+    }
+    await db.execute(delete(IngredientTerm).where(IngredientTerm.recipe_id.in_(ids)))
+    if rows:
+        await db.execute(
+            insert(IngredientTerm),
+            [{"household_id": h, "term": t, "recipe_id": r} for h, t, r in rows],
+        )
+
+
+async def reindex_recipes(db: AsyncSession, recipe_ids: Iterable[str]) -> None:
+    """Rebuild all derived search data (full-text document and pantry terms) for recipes."""
+    ids = list(recipe_ids)
+    await refresh_search_vectors(db, ids)
+    await refresh_ingredient_terms(db, ids)
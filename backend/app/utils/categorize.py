@@ -1,4 +1,5 @@
 from __future__ import annotations
+from typing import Iterable
 
 _CATEGORIES: list[tuple[str, list[str]]] = [
     ("Produce", [
@@ -96,18 +97,60 @@ for _cat, _keywords in _CATEGORIES:
         _KEYWORD_MAP[_kw] = _cat
 
 
+# ── Keyword automaton ─────────────────────────────────────────────────────────
+# An Aho-Corasick automaton over every keyword, built once at import: one pass
+# over a name finds all keywords it contains. Each state records the best keyword
+# ending there — longest first, then earliest in _KEYWORD_MAP, the same choice the
+# old keyword-by-keyword substring scan made.
+
+_goto: list[dict[str, int]] = [{}]
+_best: list[tuple[int, int] | None] = [None]  # per state: (-length, keyword index), smaller is better
+_categories = list(_KEYWORD_MAP.values())
+
+for _index, _kw in enumerate(_KEYWORD_MAP):
+    _state = 0
+    for _ch in _kw:
+        if _ch not in _goto[_state]:
+            _goto.append({})
+            _best.append(None)
+            _goto[_state][_ch] = len(_goto) - 1
+        _state = _goto[_state][_ch]
+    _best[_state] = (-len(_kw), _index)
+
+# Failure links, breadth first; each state inherits the best keyword of its fail state
+_fail = [0] * len(_goto)
+_queue = list(_goto[0].values())
+for _state in _queue:
+    for _ch, _next in _goto[_state].items():
+        _f = _fail[_state]
+        while _f and _ch not in _goto[_f]:
+            _f = _fail[_f]
+        _fail[_next] = _goto[_f].get(_ch, 0)
+        _inherited = _best[_fail[_next]]
+        if _inherited is not None and (_best[_next] is None or _inherited < _best[_next]):
+            _best[_next] = _inherited
+        _queue.append(_next)
+
+
 def categorize_ingredient(name: str) -> str:
-    """Return a grocery store section for an ingredient name using keyword matching."""
-    lower = name.lower()
-    # Exact match first
-    if lower in _KEYWORD_MAP:
-        return _KEYWORD_MAP[lower]
-    # Substring match (longest keyword wins to avoid false positives)
-    best: tuple[int, str] | None = None
-    for kw, cat in _KEYWORD_MAP.items():
-        if kw in lower:
-            if best is None or len(kw) > best[0]:
-                best = (len(kw), cat)
-    if best:
-        return best[1]
-    return "Other"
+    """Return a grocery store section for an ingredient name using keyword matching.
+
+    The longest keyword found anywhere in the name wins.
+    """
+    goto, fail, best_at = _goto, _fail, _best
+    state, best = 0, None
+    for ch in name.lower():
+        while state and ch not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(ch, 0)
+        found = best_at[state]
+        if found is not None and (best is None or found < best):
+            best = found
+    return _categories[best[1]] if best else "Other"
+
+
+def categorize_many(names: Iterable[str]) -> list[str]:
+    """Categorize a batch of ingredient names; repeated names are matched once."""
+    names = list(names)
+    found = {name: categorize_ingredient(name) for name in dict.fromkeys(names)}
+    return [found[name] for name in names]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Callable, Hashable, Iterable, Sequence
+import numpy as np
+from app.utils.units import (
+    UnitSystem, _SYSTEM_PREFS, _VOLUME_PREF, _VOLUME_TO_ML, _WEIGHT_PREF, _WEIGHT_TO_G, normalize_unit,
+)
+
+# ── Batch quantity combining ──────────────────────────────────────────────────
+# The array version of try_combine: every (quantity, unit) sharing an ingredient
+# key and a dimension is summed, and each sum gets its display unit, in a few
+# NumPy passes over the whole batch instead of one Python call per pair.
+
+_VOLUME, _WEIGHT = 0, 1  # dimension ids; see _unit_table
+
+
+@dataclass
+class Combined:
+    """combine_many's result as columns, one entry per line in order of first appearance."""
+
+    quantities: list[float | None]
+    units: list[str | None]
+    first: list[int]  # input position of each line's first entry
+    sizes: list[int]  # number of inputs summed into each line
+    line_of: np.ndarray  # line number of every input
+
+
+def _unit_table(spellings: list[str | None]) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[str | None]]:
+    """Per distinct spelling: dimension, factor to the dimension's base unit and normalized-unit id.
+
+    Volume and weight are dimensions 0 and 1; every other unit is a dimension of
+    its own from 2 up, and a missing unit gets -1 (never combined).
+    """
+    dims, factors, norm_ids = [], [], []
+    norms: dict[str | None, int] = {}
+    for spelling in spellings:
+        norm = normalize_unit(spelling)
+        if norm in _VOLUME_TO_ML:
+            dim, factor = _VOLUME, _VOLUME_TO_ML[norm]
+        elif norm in _WEIGHT_TO_G:
+            dim, factor = _WEIGHT, _WEIGHT_TO_G[norm]
+        else:
+            dim, factor = (-1 if norm is None else 2 + norms.setdefault(norm, len(norms))), 1.0
+        dims.append(dim)
+        factors.append(factor)
+        norm_ids.append(norms.setdefault(norm, len(norms)))
+    names = list(norms)
+    return np.array(dims), np.array(factors), np.array(norm_ids), names
+
+
+def _align_dimensions(
+    distinct_keys: list[Hashable],
+    key_col: np.ndarray,
+    dim_col: np.ndarray,
+    base: np.ndarray,
+    density: Callable[[Hashable], float | None],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Move weights to volume (or volumes to weight) for keys with a known density.
+
+    Each key's target is the dimension of its first volume/weight entry, matching
+    try_combine, where the existing quantity's dimension wins.
+    """
+    per_key = np.array([density(key) for key in distinct_keys], dtype=float)  # None → nan
+    measured = np.flatnonzero(((dim_col == _VOLUME) | (dim_col == _WEIGHT)) & ~np.isnan(base))
+    keys_seen, first = np.unique(key_col[measured], return_index=True)
+    target = np.full(len(distinct_keys), -1)
+    target[keys_seen] = dim_col[measured[first]]
+    rows_density = per_key[key_col]
+    to_volume = (dim_col == _WEIGHT) & (target[key_col] == _VOLUME) & ~np.isnan(rows_density)
+    to_weight = (dim_col == _VOLUME) & (target[key_col] == _WEIGHT) & ~np.isnan(rows_density)
+    dim_col, base = dim_col.copy(), base.copy()
+    dim_col[to_volume], base[to_volume] = _VOLUME, base[to_volume] / rows_density[to_volume]
+    dim_col[to_weight], base[to_weight] = _WEIGHT, base[to_weight] * rows_density[to_weight]
+    return dim_col, base
+
+
+def _best_units(totals: np.ndarray, prefs: list[str], to_base: dict[str, float]) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized _best_volume / _best_weight: first preferred unit giving at least 0.7 of it."""
+    factors = np.array([to_base[u] for u in prefs])
+    fits = totals[:, None] / factors[None, :] >= 0.7
+    # argmax finds the first True; rows with none fall back to the last (smallest) unit
+    choice = np.where(fits.any(axis=1), fits.argmax(axis=1), len(prefs) - 1)
+    return totals / factors[choice], choice
+
+
+def combine_many(
+    keys: Sequence[Hashable],
+    quantities: Sequence[float | None],
+    units: Sequence[str | None],
+    system: UnitSystem | None = None,
+    density: Callable[[Hashable], float | None] | None = None,
+) -> Combined:
+    """Sum quantities per (key, dimension) and pick each line's display unit.
+
+    Follows try_combine: a line made of one unit stays in that (normalized) unit,
+    mixed volumes or weights are shown in the best unit of _VOLUME_PREF /
+    _WEIGHT_PREF, and missing quantities or units are never combined. A lone
+    entry keeps its unit as written. With ``system``, every volume and weight line
+    is instead expressed in that system's units. Lines come back in order of first
+    appearance.
+
+    ``density`` maps a key to grams per milliliter (e.g. app.utils.density.density_for
+    when keys are ingredient names); volumes and weights of a key with a known
+    density combine in the dimension of the key's first measured entry.
+
+    The NumPy passes cost about 0.1-0.2 ms whatever the size, so on lists under
+    ~1000 entries this is slower than folding pairs with try_combine; see
+    benchmarks/bench_combine.py.
+    """
+    n = len(keys)
+    if n == 0:
+        return Combined([], [], [], [], np.empty(0, dtype=np.int64))
+    # The only per-item Python work: interning keys and unit spellings (C-level dict lookups)
+    key_ids = {key: i for i, key in enumerate(dict.fromkeys(keys))}
+    key_col = np.fromiter(map(key_ids.__getitem__, keys), dtype=np.int64, count=n)
+    spellings = {unit: i for i, unit in enumerate(dict.fromkeys(units))}
+    spelling_col = np.fromiter(map(spellings.__getitem__, units), dtype=np.int64, count=n)
+    qty = np.array(quantities, dtype=float)  # None → nan
+
+    dims, factors, norm_ids, names = _unit_table(list(spellings))
+    dim_col = dims[spelling_col]
+    norm_col = norm_ids[spelling_col]
+    base = qty * factors[spelling_col]
+    if density is not None:
+        dim_col, base = _align_dimensions(list(key_ids), key_col, dim_col, base, density)
+    # One integer per (key, dimension); entries that never combine get a code of their own
+    code = key_col * (len(names) + 2) + dim_col
+    alone = np.isnan(qty) | (dim_col < 0)
+    code[alone] = len(key_ids) * (len(names) + 2) + np.flatnonzero(alone)
+
+    _, first, group = np.unique(code, return_index=True, return_inverse=True)
+    group = group.reshape(-1)
+    groups = len(first)
+    totals = np.bincount(group, weights=np.where(alone, 0.0, base), minlength=groups)
+    sizes = np.bincount(group, minlength=groups)
+    # A group is single-unit when every member shares its first member's unit
+    same_unit = np.bincount(group, weights=norm_col == norm_col[first][group], minlength=groups) == sizes
+    group_dims = dim_col[first]
+    group_norm = norm_col[first]
+
+    shown_qty = totals.copy()
+    shown_unit = np.array(names, dtype=object)[group_norm]
+    for dim, to_base, default_prefs, slot in (
+        (_VOLUME, _VOLUME_TO_ML, _VOLUME_PREF, 0), (_WEIGHT, _WEIGHT_TO_G, _WEIGHT_PREF, 1),
+    ):
+        in_dim = group_dims == dim
+        prefs = _SYSTEM_PREFS[system][slot] if system else default_prefs
+        convert = in_dim if system else in_dim & ~same_unit
+        if convert.any():
+            shown_qty[convert], choice = _best_units(totals[convert], prefs, to_base)
+            shown_unit[convert] = np.array(prefs, dtype=object)[choice]
+        keep = in_dim & ~convert
+        shown_qty[keep] = totals[keep] / factors[spelling_col[first[keep]]]
+    # Lone entries are passed through exactly as given
+    as_given = alone[first] | ((sizes == 1) & ~(bool(system) & (group_dims <= _WEIGHT)))
+
+    out_qty = shown_qty.astype(object)
+    out_qty[as_given] = np.array(quantities, dtype=object)[first[as_given]]
+    shown_unit[as_given] = np.array(units, dtype=object)[first[as_given]]
+
+    appear = np.argsort(first, kind="stable")
+    line_of = np.empty(groups, dtype=np.int64)
+    line_of[appear] = np.arange(groups)
+    return Combined(
+        out_qty[appear].tolist(), shown_unit[appear].tolist(),
+        first[appear].tolist(), sizes[appear].tolist(), line_of[group],
+    )
+
+
+def convert_quantities(
+    items: Iterable[tuple[float | None, str | None]],
+    factor: float = 1.0,
+    system: UnitSystem | None = None,
+) -> list[tuple[float | None, str | None]]:
+    """Scale (quantity, unit) pairs by ``factor`` and express them in ``system``, in one batch.
+
+    Quantities with no known volume/weight unit are only scaled and keep their
+    unit as written; with ``system=None`` every unit is kept as written.
+    """
+    items = list(items)
+    combined = combine_many(
+        range(len(items)),
+        [None if qty is None else qty * factor for qty, _ in items],
+        [unit for _, unit in items],
+        system,
+    )
+    return list(zip(combined.quantities, combined.units))
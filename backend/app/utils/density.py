@@ -0,0 +1,49 @@
+from __future__ import annotations
+from functools import lru_cache
+from app.utils.terms import ingredient_term
+
+# ── Ingredient densities ──────────────────────────────────────────────────────
+# Grams per milliliter for common pantry items, used to combine a volume of an
+# ingredient with a weight of the same one ("1 cup flour" + "200 g flour").
+# Keys are pantry terms (see app.utils.terms); dry goods are spooned and leveled,
+# brown sugar packed.
+
+_DENSITY_G_PER_ML: dict[str, float] = {
+    # Flours and starches
+    "flour": 0.53, "all-purpose flour": 0.53, "bread flour": 0.55, "cake flour": 0.48,
+    "whole wheat flour": 0.51, "almond flour": 0.40, "rye flour": 0.43, "cornstarch": 0.54,
+    "cornmeal": 0.65, "semolina": 0.70,
+    # Sugars and sweeteners
+    "sugar": 0.85, "granulated sugar": 0.85, "brown sugar": 0.90, "powdered sugar": 0.51,
+    "confectioner sugar": 0.51, "honey": 1.42, "maple syrup": 1.32, "molasses": 1.40,
+    # Fats
+    "butter": 0.96, "oil": 0.92, "olive oil": 0.91, "vegetable oil": 0.92, "coconut oil": 0.92,
+    "shortening": 0.81, "peanut butter": 1.08,
+    # Dairy and liquids
+    "water": 1.00, "milk": 1.03, "buttermilk": 1.03, "cream": 1.01, "heavy cream": 1.01,
+    "sour cream": 1.01, "yogurt": 1.03, "greek yogurt": 1.10, "broth": 1.00, "stock": 1.00,
+    # Grains, legumes, seeds
+    "rice": 0.78, "oat": 0.38, "rolled oat": 0.38, "quinoa": 0.72, "lentil": 0.81,
+    "dried bean": 0.75, "breadcrumb": 0.45, "panko": 0.21,
+    # Baking
+    "salt": 1.22, "kosher salt": 0.54, "baking soda": 0.93, "baking powder": 0.81,
+    "cocoa powder": 0.42, "chocolate chip": 0.72, "yeast": 0.60,
+    # Cheese
+    "parmesan": 0.42, "parmesan cheese": 0.42, "cheddar": 0.47, "shredded cheese": 0.47,
+}
+
+
+@lru_cache(maxsize=4096)
+def density_for(name: str | None) -> float | None:
+    """Density of an ingredient in g/ml, or None if it isn't in the table.
+
+    Matches the ingredient's pantry term, then the term with leading words
+    dropped, so "unsalted butter" finds "butter" but "brown sugar" stays itself.
+    """
+    term = ingredient_term(name)
+    words = term.split() if term else []
+    for start in range(len(words)):
+        density = _DENSITY_G_PER_ML.get(" ".join(words[start:]))
+        if density is not None:
+            return density
+    return None
@@ -0,0 +1,41 @@
+from __future__ import annotations
+import re
+
+# ── Ingredient terms ──────────────────────────────────────────────────────────
+# A term is the canonical form of an ingredient name used for pantry matching:
+# "Fresh Shallots, minced" and "shallot" both become "shallot".
+
+_PARENTHETICAL = re.compile(r"\([^)]*\)")
+_NON_WORD = re.compile(r"[^a-z\s-]+")
+
+# Preparation / size words that don't change what you'd need to have on hand
+_DESCRIPTORS = frozenset({
+    "fresh", "freshly", "large", "medium", "small", "extra", "chopped", "minced",
+    "diced", "sliced", "grated", "shredded", "crushed", "peeled", "softened",
+    "melted", "divided", "finely", "roughly", "thinly", "optional", "to", "taste",
+    "for", "serving", "garnish", "about", "whole", "organic", "and", "or",
+})
+
+# Words whose trailing "s" isn't a plural
+_KEEP_S = frozenset({"asparagus", "hummus", "couscous", "molasses", "swiss", "citrus", "grits"})
+
+
+def _singular(word: str) -> str:
+    if word in _KEEP_S or len(word) <= 3 or word.endswith("ss"):
+        return word
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith("oes"):
+        return word[:-2]
+    if word.endswith("s"):
+        return word[:-1]
+    return word
+
+
+def ingredient_term(name: str | None) -> str | None:
+    """Canonical pantry term for an ingredient name, or None if nothing is left."""
+    if not name:
+        return None
+    text = _PARENTHETICAL.sub(" ", name.lower()).split(",")[0]
+    words = [_singular(w) for w in _NON_WORD.sub(" ", text).split() if w not in _DESCRIPTORS]
+    return " ".join(words) or None
@@ -1,5 +1,10 @@
 from __future__ import annotations
+import re
 from fractions import Fraction
+from functools import lru_cache
+from typing import Iterable, Literal
+from app.services.parser.base import ParsedIngredient
+from app.utils.density import density_for
 
 # ── Fraction parsing ──────────────────────────────────────────────────────────
 
@@ -8,6 +13,9 @@ def parse_fraction(s: str | None) -> float | None:
     if not s:
         return None
     s = s.strip()
+    # Whole numbers and decimals are most amounts; Fraction is only needed for "1/2"
+    if s.replace(".", "", 1).isdecimal():
+        return float(s)
     try:
         parts = s.split()
         if len(parts) == 2:
@@ -70,20 +78,20 @@ _VOLUME_PREF = ["gallon", "quart", "pint", "cup", "fluid_ounce", "tablespoon", "
 _WEIGHT_PREF = ["kilogram", "pound", "ounce", "gram"]
 
 
-def _best_volume(ml: float) -> tuple[float, str]:
-    for unit in _VOLUME_PREF:
+def _best_volume(ml: float, prefs: list[str] = _VOLUME_PREF) -> tuple[float, str]:
+    for unit in prefs:
         qty = ml / _VOLUME_TO_ML[unit]
         if qty >= 0.7:
             return qty, unit
-    return ml, "milliliter"
+    return ml / _VOLUME_TO_ML[prefs[-1]], prefs[-1]
 
 
-def _best_weight(g: float) -> tuple[float, str]:
-    for unit in _WEIGHT_PREF:
+def _best_weight(g: float, prefs: list[str] = _WEIGHT_PREF) -> tuple[float, str]:
+    for unit in prefs:
         qty = g / _WEIGHT_TO_G[unit]
         if qty >= 0.7:
             return qty, unit
-    return g, "gram"
+    return g / _WEIGHT_TO_G[prefs[-1]], prefs[-1]
 
 
 def try_combine(
@@ -91,8 +99,13 @@ def try_combine(
     existing_unit: str | None,
     new_qty: float | None,
     new_unit: str | None,
+    ingredient: str | None = None,
 ) -> tuple[float, str] | None:
-    """Combine two quantities. Returns (combined, unit) or None if incompatible."""
+    """Combine two quantities. Returns (combined, unit) or None if incompatible.
+
+    Given the ``ingredient`` name, a volume and a weight of it combine through its
+    density (see app.utils.density), in the dimension of the existing quantity.
+    """
     if existing_qty is None or new_qty is None:
         return None
     eu = normalize_unit(existing_unit)
@@ -109,8 +122,40 @@ def try_combine(
         return _best_weight(total_g)
     if eu is not None and eu == nu:
         return existing_qty + new_qty, eu
+    density = density_for(ingredient) if ingredient else None
+    if density is not None:
+        if eu in _VOLUME_TO_ML and nu in _WEIGHT_TO_G:
+            return _best_volume(existing_qty * _VOLUME_TO_ML[eu] + new_qty * _WEIGHT_TO_G[nu] / density)
+        if eu in _WEIGHT_TO_G and nu in _VOLUME_TO_ML:
+            return _best_weight(existing_qty * _WEIGHT_TO_G[eu] + new_qty * _VOLUME_TO_ML[nu] * density)
     return None
 
+# ── Scaling and unit systems ──────────────────────────────────────────────────
+
+UnitSystem = Literal["metric", "us"]
+
+# Preferred units per system, largest first (see _best_volume / _best_weight)
+_SYSTEM_PREFS: dict[str, tuple[list[str], list[str]]] = {
+    "metric": (["liter", "milliliter"], ["kilogram", "gram"]),
+    "us": (["gallon", "quart", "cup", "tablespoon", "teaspoon"], ["pound", "ounce"]),
+}
+
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+
+def servings_count(servings: str | None) -> float | None:
+    """The first number in a free-text yield like "4 servings" or "Serves 6-8"."""
+    m = _NUMBER.search(servings or "")
+    return float(m.group()) if m else None
+
+
+def scale_servings(servings: str | None, factor: float) -> str | None:
+    """Rewrite a yield for a scaled recipe: "Serves 4-6" x 1.5 → "Serves 6-9"."""
+    if not servings or factor == 1:
+        return servings
+    return _NUMBER.sub(lambda m: format_quantity(float(m.group()) * factor), servings)
+
+
 # ── Quantity display ──────────────────────────────────────────────────────────
 
 _FRACTIONS: list[tuple[float, str]] = [
@@ -137,30 +182,73 @@ def format_quantity(qty: float | None) -> str:
         return str(whole) if abs(frac) < 0.02 else f"{qty:.4g}"
     return f"{whole} {frac_str}"
 
-import re as _re
+# ── Ingredient line parsing ───────────────────────────────────────────────────
+
+# Vulgar fractions become ASCII so one number pattern covers "1½", "1 ½" and "1 1/2"
+_VULGAR_FRACTIONS = str.maketrans({
+    "¼": " 1/4", "½": " 1/2", "¾": " 3/4", "⅓": " 1/3", "⅔": " 2/3", "⅕": " 1/5", "⅖": " 2/5",
+    "⅗": " 3/5", "⅘": " 4/5", "⅙": " 1/6", "⅚": " 5/6", "⅛": " 1/8", "⅜": " 3/8", "⅝": " 5/8",
+    "⅞": " 7/8", "⁄": "/", "–": "-", "—": "-",
+})
+
+_NUMBER_PAT = r"\d+\s+\d+/\d+|\d+/\d+|\d*\.\d+|\d+"
+_UNIT_PAT = (
+    r"teaspoons?|tablespoons?|tbsps?|tbs|tsps?|cups?|pints?|pts?|quarts?|qts?|gallons?|gal|"
+    r"fl\.?\s?oz|fluid\s+ounces?|ounces?|oz|pounds?|lbs?|grams?|g|kilograms?|kg|"
+    r"milliliters?|millilitres?|ml|liters?|litres?|l|"
+    r"cloves?|cans?|slices?|pieces?|sprigs?|bunch(?:es)?|pinch(?:es)?|dash(?:es)?|"
+    r"packages?|pkgs?|sticks?|heads?|stalks?|jars?|bottles?|handfuls?"
+)
+_INGREDIENT_RE = re.compile(
+    rf"""^
+    (?:(?P<qty>{_NUMBER_PAT})(?:\s*(?:-|to|or)\s*(?P<qty_high>{_NUMBER_PAT}))?\s*)?
+    (?:\((?P<size>[^)]*)\)\s*)?                  # "1 (14 oz) can"
+    (?:(?P<unit>{_UNIT_PAT})\b\.?\s*)?
+    (?:of\s+(?:the\s+)?)?
+    (?P<name>.*)$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+_PARENTHETICAL_RE = re.compile(r"\s*\(([^)]*)\)")
+
+# (name, quantity, unit, notes)
+ParsedLine = tuple[str, float | None, str | None, str | None]
+
+
+@lru_cache(maxsize=4096)
+def parse_ingredient_line(line: str) -> ParsedLine:
+    """Parse a raw ingredient line like "1 ½ cups flour, sifted" into (name, quantity, unit, notes).
+
+    Ranges ("2-3 cups") keep their upper bound so shopping lists don't come up
+    short; parenthetical sizes and anything after the first comma become notes.
+    Cached, since imports see the same lines ("1 egg", "salt to taste") over and over.
+    """
+    # Most lines are plain ASCII and have nothing to translate
+    text = (line if line.isascii() else line.translate(_VULGAR_FRACTIONS)).strip()
+    qty, qty_high, size, unit, name = _INGREDIENT_RE.match(text).groups()
+    notes = [size] if size else []
+    if "(" in name:
+        notes += _PARENTHETICAL_RE.findall(name)
+        name = _PARENTHETICAL_RE.sub("", name)
+    name, _, rest = name.partition(",")
+    if rest.strip():
+        notes.append(rest.strip())
+    name = name.strip()
+    qty = qty_high or qty
+    return (
+        # Nothing left after the amount ("1½ cups"): the line as written is the best name
+        name or line.strip(),
+        parse_fraction(qty) if qty else None,
+        unit.lower() if unit else None,
+        "; ".join(notes) or None,
+    )
 
-def parse_ingredient_string(line: str) -> "ParsedIngredient":
-    """Best-effort parse of a raw ingredient string like '2 cups flour'.
 
-    Imports ParsedIngredient lazily to avoid module-level circular import risk.
-    """
-    from app.services.parser.base import ParsedIngredient
+def parse_ingredient_string(line: str) -> ParsedIngredient:
+    """Best-effort parse of a raw ingredient string like '2 cups flour'."""
+    name, quantity, unit, notes = parse_ingredient_line(line)
+    return ParsedIngredient(name=name, quantity=quantity, unit=unit, notes=notes)
 
-    _UNIT_PAT = (
-        r"teaspoons?|tablespoons?|tbsps?|tsps?|cups?|pints?|quarts?|gallons?|"
-        r"ounces?|oz|pounds?|lbs?|grams?|g|kilograms?|kg|ml|liters?|l|"
-        r"cloves?|cans?|slices?|pieces?|sprigs?|bunches?"
-    )
-    m = _re.match(
-        rf'^([\d\s/]+)?\s*({_UNIT_PAT})?\s*(.+)',
-        line.strip(), _re.IGNORECASE
-    )
-    if m:
-        qty_str, unit_str, name = m.group(1), m.group(2), m.group(3)
-        clean_name = _re.sub(r'^of\s+(?:the\s+)?', '', name.strip(), flags=_re.IGNORECASE)
-        return ParsedIngredient(
-            name=clean_name.strip(),
-            quantity=parse_fraction(qty_str.strip()) if qty_str else None,
-            unit=unit_str.strip().lower() if unit_str else None,
-        )
-    return ParsedIngredient(name=line.strip())
+
+def parse_many(lines: Iterable[str]) -> list[ParsedIngredient]:
+    """Parse a batch of ingredient lines; repeated lines are parsed once."""
+    return [ParsedIngredient(*parse_ingredient_line(line)) for line in lines]
@@ -0,0 +1,89 @@
+"""Recipe import throughput: one POST /api/recipes per recipe vs. POST /api/recipes/bulk.
+
+    python -m benchmarks.bench_bulk_import
+"""
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.core.database import get_db
+from app.core.deps import get_current_user
+from app.main import app
+from app.models import Tag
+from benchmarks.common import fresh_engine, seed_household
+
+
+def _recipes(count: int, tag_ids: list[str]) -> list[dict]:
+    return [
+        {
+            "title": f"Imported recipe {i}",
+            "description": "A reasonably long description. " * 8,
+            "servings": "4", "total_time": 45, "cuisine": "Italian",
+            "tag_ids": [tag_ids[i % len(tag_ids)], tag_ids[(i + 1) % len(tag_ids)]],
+            "ingredients": [
+                {"name": f"ingredient {k}", "quantity": 1.5, "unit": "cup", "notes": "chopped"} for k in range(10)
+            ],
+            "steps": [{"description": f"Do step {k} until it looks right."} for k in range(6)],
+        }
+        for i in range(count)
+    ]
+
+
+async def main() -> None:
+    engine = await fresh_engine()
+    household_id, user_id = await seed_household(engine, recipes=0)
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as db:
+        tag_ids = list((await db.execute(select(Tag.id))).scalars())
+
+    async def override_get_db():
+        async with Session() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=user_id, household_id=household_id)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench", timeout=None) as client:
+        print(f"{'method':<24}  {'recipes':>8}  {'seconds':>8}  {'recipes/s':>10}")
+
+        async def report(label: str, count: int, send) -> None:
+            start = time.perf_counter()
+            await send()
+            elapsed = time.perf_counter() - start
+            print(f"{label:<24}  {count:>8}  {elapsed:>8.2f}  {count / elapsed:>10.0f}")
+
+        single = _recipes(200, tag_ids)
+
+        async def one_by_one():
+            for recipe in single:
+                (await client.post("/api/recipes", json=recipe)).raise_for_status()
+
+        await report("POST /api/recipes", len(single), one_by_one)
+
+        payload = _recipes(2_000, tag_ids)
+        for batch_size in (100, 500, 1000):
+            async def bulk_json():
+                resp = await client.post(f"/api/recipes/bulk?batch_size={batch_size}", json=payload)
+                assert resp.json()["failed"] == 0
+
+            await report(f"bulk json, batch {batch_size}", len(payload), bulk_json)
+
+        ndjson = "\n".join(json.dumps(r) for r in payload)
+
+        async def bulk_ndjson():
+            resp = await client.post(
+                "/api/recipes/bulk", content=ndjson, headers={"Content-Type": "application/x-ndjson"},
+            )
+            assert resp.json()["failed"] == 0
+
+        await report("bulk ndjson, batch 500", len(payload), bulk_ndjson)
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
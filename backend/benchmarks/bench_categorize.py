@@ -0,0 +1,40 @@
+"""Ingredient categorization: the keyword-by-keyword substring scan vs. the automaton.
+
+    python -m benchmarks.bench_categorize
+"""
+import random
+from app.utils.categorize import _KEYWORD_MAP, categorize_ingredient, categorize_many
+from benchmarks.common import timed_sync
+
+
+def _substring_scan(name: str) -> str:
+    """categorize_ingredient as it was before the automaton."""
+    lower = name.lower()
+    if lower in _KEYWORD_MAP:
+        return _KEYWORD_MAP[lower]
+    best = None
+    for kw, cat in _KEYWORD_MAP.items():
+        if kw in lower and (best is None or len(kw) > best[0]):
+            best = (len(kw), cat)
+    return best[1] if best else "Other"
+
+
+def main() -> None:
+    rng = random.Random(3)
+    keywords = list(_KEYWORD_MAP)
+    names = [f"{rng.choice(['fresh', 'large', 'organic', ''])} {rng.choice(keywords)}, chopped" for _ in range(2_000)]
+    names += [f"unknown item {i}" for i in range(500)]
+    print(f"{len(keywords)} keywords, {len(names)} names")
+    print(f"{'method':<28}  {'ms':>8}  {'µs/name':>8}")
+    for label, run in (
+        ("substring scan", lambda: [_substring_scan(n) for n in names]),
+        ("automaton", lambda: [categorize_ingredient(n) for n in names]),
+        ("categorize_many (x4 repeats)", lambda: categorize_many(names * 4)),
+    ):
+        ms = timed_sync(run)
+        count = len(names) * (4 if "many" in label else 1)
+        print(f"{label:<28}  {ms:>8.2f}  {ms * 1000 / count:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
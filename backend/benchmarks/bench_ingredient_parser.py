@@ -0,0 +1,113 @@
+"""Ingredient-line parsing: throughput and accuracy on a labelled corpus.
+
+Compares the previous per-call parser (regex rebuilt on every call, kept here
+as a baseline) with the compiled parser uncached, and with parse_many on
+distinct lines (cold cache) and on repeated ones (warm cache).
+
+    python -m benchmarks.bench_ingredient_parser
+"""
+import re
+import time
+from app.utils.units import parse_fraction, parse_ingredient_line, parse_many
+
+# (line, expected (name, quantity, unit))
+CORPUS: list[tuple[str, tuple[str, float | None, str | None]]] = [
+    ("2 cups flour", ("flour", 2.0, "cups")),
+    ("1 cup sugar", ("sugar", 1.0, "cup")),
+    ("1/2 teaspoon salt", ("salt", 0.5, "teaspoon")),
+    ("2 1/4 cups all-purpose flour", ("all-purpose flour", 2.25, "cups")),
+    ("3 tablespoons olive oil", ("olive oil", 3.0, "tablespoons")),
+    ("1 lb ground beef", ("ground beef", 1.0, "lb")),
+    ("8 oz cream cheese", ("cream cheese", 8.0, "oz")),
+    ("500 g pasta", ("pasta", 500.0, "g")),
+    ("1 kg potatoes", ("potatoes", 1.0, "kg")),
+    ("250 ml milk", ("milk", 250.0, "ml")),
+    ("2 large eggs", ("large eggs", 2.0, None)),
+    ("3 cloves garlic", ("garlic", 3.0, "cloves")),
+    ("1 can black beans", ("black beans", 1.0, "can")),
+    ("4 slices bacon", ("bacon", 4.0, "slices")),
+    ("2 sprigs thyme", ("thyme", 2.0, "sprigs")),
+    ("1 bunch cilantro", ("cilantro", 1.0, "bunch")),
+    ("salt and pepper", ("salt and pepper", None, None)),
+    ("1 onion", ("onion", 1.0, None)),
+    ("½ cup butter", ("butter", 0.5, "cup")),
+    ("1½ cups milk", ("milk", 1.5, "cups")),
+    ("1 ½ teaspoons vanilla extract", ("vanilla extract", 1.5, "teaspoons")),
+    ("⅓ cup honey", ("honey", 1 / 3, "cup")),
+    ("¾ cup brown sugar", ("brown sugar", 0.75, "cup")),
+    ("2-3 cups chicken broth", ("chicken broth", 3.0, "cups")),
+    ("1 to 2 tablespoons lemon juice", ("lemon juice", 2.0, "tablespoons")),
+    ("2–3 cloves garlic", ("garlic", 3.0, "cloves")),
+    ("1 (14.5 oz) can diced tomatoes", ("diced tomatoes", 1.0, "can")),
+    ("2 (8-ounce) packages cream cheese", ("cream cheese", 2.0, "packages")),
+    ("3 cloves garlic, minced", ("garlic", 3.0, "cloves")),
+    ("1 cup walnuts, chopped", ("walnuts", 1.0, "cup")),
+    ("2 lbs. chicken thighs (boneless)", ("chicken thighs", 2.0, "lbs")),
+    ("1/2 cup of the reserved pasta water", ("reserved pasta water", 0.5, "cup")),
+    ("2 tbsp soy sauce", ("soy sauce", 2.0, "tbsp")),
+    ("1 tsp baking soda", ("baking soda", 1.0, "tsp")),
+    ("1 pinch nutmeg", ("nutmeg", 1.0, "pinch")),
+    ("2 sticks butter", ("butter", 2.0, "sticks")),
+    ("1 head cauliflower", ("cauliflower", 1.0, "head")),
+    ("1 l water", ("water", 1.0, "l")),
+    (".5 kg rice", ("rice", 0.5, "kg")),
+    ("1 fl oz bourbon", ("bourbon", 1.0, "fl oz")),
+    ("2 green onions, sliced", ("green onions", 2.0, None)),
+    ("fresh basil leaves", ("fresh basil leaves", None, None)),
+]
+
+
+def _legacy_parse(line: str) -> tuple[str, float | None, str | None]:
+    """parse_ingredient_string as it was before the compiled parser."""
+    unit_pat = (
+        r"teaspoons?|tablespoons?|tbsps?|tsps?|cups?|pints?|quarts?|gallons?|"
+        r"ounces?|oz|pounds?|lbs?|grams?|g|kilograms?|kg|ml|liters?|l|"
+        r"cloves?|cans?|slices?|pieces?|sprigs?|bunches?"
+    )
+    m = re.match(rf'^([\d\s/]+)?\s*({unit_pat})?\s*(.+)', line.strip(), re.IGNORECASE)
+    qty_str, unit_str, name = m.group(1), m.group(2), m.group(3)
+    clean_name = re.sub(r'^of\s+(?:the\s+)?', '', name.strip(), flags=re.IGNORECASE)
+    return (
+        clean_name.strip(),
+        parse_fraction(qty_str.strip()) if qty_str else None,
+        unit_str.strip().lower() if unit_str else None,
+    )
+
+
+def _accuracy(parse) -> float:
+    correct = 0
+    for line, (name, qty, unit) in CORPUS:
+        got_name, got_qty, got_unit = parse(line)
+        same_qty = (got_qty is None) == (qty is None) and (qty is None or abs(got_qty - qty) < 1e-6)
+        correct += got_name == name and same_qty and got_unit == unit
+    return correct / len(CORPUS)
+
+
+def main() -> None:
+    # Every line different, so nothing is served from the cache
+    distinct = [f"{line} {i}" for i in range(250) for line, _ in CORPUS]
+    # ~10k lines with the repetition real imports have
+    repeated = [line for line, _ in CORPUS] * 250
+
+    def report(label: str, lines: list[str], run, accuracy: float, warm: bool = False) -> None:
+        best = float("inf")
+        for _ in range(5):
+            parse_ingredient_line.cache_clear()
+            if warm:
+                run(lines)
+            start = time.perf_counter()
+            run(lines)
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<26}  {len(lines) / best:>12,.0f}  {accuracy:>9.0%}")
+
+    print(f"{'parser':<26}  {'lines/s':>12}  {'accuracy':>9}")
+    report("legacy, per call", distinct, lambda lines: [_legacy_parse(line) for line in lines], _accuracy(_legacy_parse))
+    new_accuracy = _accuracy(lambda line: parse_ingredient_line(line)[:3])
+    uncached = parse_ingredient_line.__wrapped__
+    report("compiled, no cache", distinct, lambda lines: [uncached(line) for line in lines], new_accuracy)
+    report("parse_many, cold cache", distinct, parse_many, new_accuracy)
+    report("parse_many, warm cache", repeated, parse_many, new_accuracy, warm=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Checking off items on a 150-item list: full-list responses vs. ?delta=true.
+
+    python -m benchmarks.bench_item_toggle
+"""
+import asyncio
+from types import SimpleNamespace
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.core.database import get_db
+from app.core.deps import get_current_user
+from app.main import app
+from benchmarks.common import fresh_engine, seed_household
+
+ITEMS = 150
+TAPS = 50
+
+
+async def main() -> None:
+    engine = await fresh_engine()
+    household_id, user_id = await seed_household(engine, recipes=0)
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_db():
+        async with Session() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=user_id, household_id=household_id)
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench", timeout=None) as client:
+        list_id = (await client.post("/api/shopping", json={"name": "Big shop"})).json()["id"]
+        item_ids = []
+        for i in range(ITEMS):
+            resp = await client.post(
+                f"/api/shopping/{list_id}/items?delta=true",
+                json={"ingredient_name": f"item {i}", "quantity": 1.0, "unit": "can"},
+            )
+            item_ids.append(resp.json()["items"][0]["id"])
+
+        print(f"{'response':<12}  {'queries/tap':>11}  {'bytes/tap':>10}  {'ms/tap':>8}")
+        for label, query in (("full list", ""), ("delta", "?delta=true")):
+            statements.clear()
+            sent = 0
+            start = asyncio.get_running_loop().time()
+            for item_id in item_ids[:TAPS]:
+                resp = await client.patch(f"/api/shopping/{list_id}/items/{item_id}/check{query}")
+                resp.raise_for_status()
+                sent += len(resp.content)
+            elapsed = (asyncio.get_running_loop().time() - start) * 1000
+            print(f"{label:<12}  {len(statements) / TAPS:>11.1f}  {sent // TAPS:>10,}  {elapsed / TAPS:>8.2f}")
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
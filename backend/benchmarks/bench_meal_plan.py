@@ -0,0 +1,63 @@
+"""Meal plan to shopping list: seven add-from-recipe calls vs. one add-from-recipes call.
+
+    python -m benchmarks.bench_meal_plan
+"""
+import asyncio
+from types import SimpleNamespace
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.core.database import get_db
+from app.core.deps import get_current_user
+from app.main import app
+from app.models import Recipe
+from benchmarks.common import fresh_engine, seed_household
+
+DINNERS = 7
+
+
+async def main() -> None:
+    engine = await fresh_engine()
+    household_id, user_id = await seed_household(engine, recipes=DINNERS * 4, ingredients_per_recipe=15)
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    async with Session() as db:
+        recipe_ids = list((await db.execute(select(Recipe.id).limit(DINNERS))).scalars())
+
+    async def override_get_db():
+        async with Session() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=user_id, household_id=household_id)
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench", timeout=None) as client:
+        async def new_list() -> str:
+            return (await client.post("/api/shopping", json={"name": "Week"})).json()["id"]
+
+        async def one_by_one(list_id: str) -> None:
+            for recipe_id in recipe_ids:
+                (await client.post(f"/api/shopping/{list_id}/add-from-recipe", json={"recipe_id": recipe_id})).raise_for_status()
+
+        async def batch(list_id: str) -> None:
+            entries = [{"recipe_id": recipe_id} for recipe_id in recipe_ids]
+            (await client.post(f"/api/shopping/{list_id}/add-from-recipes", json={"recipes": entries})).raise_for_status()
+
+        print(f"{'method':<28}  {'requests':>8}  {'queries':>8}  {'ms':>8}")
+        for label, requests, run in (("add-from-recipe x 7", DINNERS, one_by_one), ("add-from-recipes", 1, batch)):
+            samples = []
+            for _ in range(5):
+                list_id = await new_list()
+                statements.clear()
+                start = asyncio.get_running_loop().time()
+                await run(list_id)
+                samples.append((asyncio.get_running_loop().time() - start) * 1000)
+            print(f"{label:<28}  {requests:>8}  {len(statements):>8}  {sorted(samples)[2]:>8.1f}")
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
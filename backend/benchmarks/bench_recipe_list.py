@@ -0,0 +1,54 @@
+"""Recipe list: ORM + Pydantic path vs. the column-projected JSON path used by list_recipes.
+
+    python -m benchmarks.bench_recipe_list
+"""
+import asyncio
+import json
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import selectinload
+from app.api.recipes import _list_item_document
+from app.models import Recipe, User
+from app.schemas.recipe import RecipeListItem
+from benchmarks.common import fresh_engine, seed_household, timed
+
+
+async def main() -> None:
+    print(f"{'recipes':>8}  {'orm (ms)':>10}  {'projected (ms)':>15}  {'speedup':>8}")
+    for size in (1_000, 10_000):
+        engine = await fresh_engine()
+        household_id, _ = await seed_household(engine, recipes=size)
+        Session = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def orm_path() -> bytes:
+            # What list_recipes did before: full ORM rows, then response_model validation + encoding
+            async with Session() as db:
+                result = await db.execute(
+                    select(Recipe)
+                    .options(selectinload(Recipe.tags), selectinload(Recipe.created_by))
+                    .where(Recipe.household_id == household_id)
+                    .order_by(Recipe.created_at.desc(), Recipe.id)
+                )
+                items = [RecipeListItem.model_validate(r) for r in result.scalars().all()]
+                return json.dumps(jsonable_encoder(items)).encode()
+
+        async def projected_path() -> bytes:
+            async with Session() as db:
+                result = await db.execute(
+                    select(_list_item_document())
+                    .select_from(Recipe)
+                    .outerjoin(User, User.id == Recipe.created_by_id)
+                    .where(Recipe.household_id == household_id)
+                    .order_by(Recipe.created_at.desc(), Recipe.id)
+                )
+                return ("[" + ",".join(result.scalars().all()) + "]").encode()
+
+        orm_ms = await timed(orm_path)
+        projected_ms = await timed(projected_path)
+        print(f"{size:>8}  {orm_ms:>10.1f}  {projected_ms:>15.1f}  {orm_ms / projected_ms:>7.1f}x")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,33 @@
+"""Household restore: export a seeded household, then time loading it back with COPY.
+
+    python -m benchmarks.bench_restore
+"""
+import asyncio
+import time
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.services.backup import export_household, restore_household
+from benchmarks.common import fresh_engine, seed_household
+
+
+async def main() -> None:
+    print(f"{'recipes':>8}  {'ingredients':>12}  {'export (s)':>11}  {'restore (s)':>12}")
+    for size in (1_000, 5_000):
+        engine = await fresh_engine()
+        household_id, _ = await seed_household(engine, recipes=size, ingredients_per_recipe=10)
+
+        start = time.perf_counter()
+        archive = b"".join([chunk async for chunk in export_household(engine, household_id, "ndjson")])
+        export_s = time.perf_counter() - start
+
+        # Restoring into the same household remaps every id, the slowest case
+        start = time.perf_counter()
+        async with AsyncSession(engine) as db:
+            counts = await restore_household(db, household_id, archive.splitlines())
+            await db.commit()
+        restore_s = time.perf_counter() - start
+        print(f"{counts['recipes']:>8}  {counts['ingredients']:>12}  {export_s:>11.2f}  {restore_s:>12.2f}")
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+"""Response serialization cost per schema, without a database or HTTP in the way.
+
+Compares, for ORM objects shaped like real responses:
+  - jsonable_encoder + json.dumps (FastAPI's path for non-pydantic content)
+  - TypeAdapter validate_python + dump_json (FastAPI's path with a response_model)
+  - Serializer.dump (app.core.serialization), or plain orjson for endpoints
+    such as /pantry that already build dicts from query rows
+
+    python -m benchmarks.bench_serialization
+"""
+import json
+import uuid
+from datetime import datetime, UTC
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from app.core.serialization import Serializer, dumps
+from app.models import Recipe, Ingredient, Step, Tag, User, ShoppingList, ShoppingItem
+from app.schemas.recipe import RecipeOut, RecipeListItem, PantryMatch
+from app.schemas.shopping import ShoppingListOut
+from app.schemas.tag import TagOut
+from benchmarks.common import timed_sync
+
+NOW = datetime.now(UTC)
+
+
+def _id() -> str:
+    return str(uuid.uuid4())
+
+
+def _tags(count: int, household_id: str) -> list[Tag]:
+    return [
+        Tag(id=_id(), household_id=household_id, name=f"tag {i}", category="custom", color="#888888")
+        for i in range(count)
+    ]
+
+
+def _recipe(household_id: str, ingredients: int, steps: int) -> Recipe:
+    return Recipe(
+        id=_id(), household_id=household_id, title="A large recipe",
+        description="A reasonably long description. " * 8, image_url=None, source_url="https://example.com/r",
+        author="Someone", servings="4", prep_time=15, cook_time=30, total_time=45, cuisine="Italian",
+        category="Dinner", cooking_method="Bake", suitable_for_diet=["Vegetarian"],
+        nutrition={"calories": "450 kcal", "proteinContent": "12 g"}, created_at=NOW, updated_at=NOW,
+        created_by=User(id=_id(), name="Cook", email="cook@example.com", hashed_password="x"),
+        tags=_tags(6, household_id),
+        ingredients=[
+            Ingredient(id=_id(), name=f"ingredient {k}", quantity=1.5, unit="cup", notes="chopped", order=k)
+            for k in range(ingredients)
+        ],
+        steps=[
+            Step(id=_id(), title=None, description=f"Do step {k} until it looks right.", order=k, timer_seconds=None)
+            for k in range(steps)
+        ],
+    )
+
+
+def _shopping_list(household_id: str, items: int) -> ShoppingList:
+    return ShoppingList(
+        id=_id(), household_id=household_id, name="Weekly shop", created_at=NOW, version=7,
+        items=[
+            ShoppingItem(
+                id=_id(), ingredient_name=f"item {k}", quantity=2.0, unit="lb", recipe_id=None,
+                checked=k % 3 == 0, category="Produce",
+            )
+            for k in range(items)
+        ],
+    )
+
+
+def _pantry_matches(count: int) -> list[dict]:
+    return [
+        {
+            "id": _id(), "title": f"Recipe {i}", "image_url": None, "ingredient_count": 8,
+            "matched": ["onion", "garlic", "butter"], "missing": ["thyme", "cream"],
+        }
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    household_id = _id()
+    cases = [
+        ("RecipeOut (40 ingr, 20 steps)", RecipeOut, _recipe(household_id, 40, 20)),
+        ("list[RecipeListItem] x 50", list[RecipeListItem], [_recipe(household_id, 0, 0) for _ in range(50)]),
+        ("ShoppingListOut (100 items)", ShoppingListOut, _shopping_list(household_id, 100)),
+        ("list[TagOut] x 200", list[TagOut], _tags(200, household_id)),
+        ("list[PantryMatch] x 100", list[PantryMatch], _pantry_matches(100)),
+    ]
+
+    print(f"{'schema':<32}  {'jsonable_encoder':>16}  {'validate+dump':>14}  {'fast path':>10}  (ms)")
+    for label, schema, obj in cases:
+        adapter = TypeAdapter(schema)
+        model = adapter.validate_python(obj, from_attributes=True)
+        # Plain data skips the Serializer and goes straight to orjson
+        dump = dumps if isinstance(obj, list) and isinstance(obj[0], dict) else Serializer(schema).dump
+        assert dump(obj) == adapter.dump_json(model)
+
+        encoder = timed_sync(lambda: json.dumps(jsonable_encoder(model)).encode(), repeat=50)
+        validated = timed_sync(lambda: adapter.dump_json(adapter.validate_python(obj, from_attributes=True)), repeat=50)
+        fast = timed_sync(lambda: dump(obj), repeat=50)
+        print(f"{label:<32}  {encoder:>16.3f}  {validated:>14.3f}  {fast:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Shopping list index: full lists with every item vs. ?view=summary, 200 lists x 100 items.
+
+    python -m benchmarks.bench_shopping_lists
+"""
+import asyncio
+import uuid
+from datetime import datetime, timedelta, UTC
+from types import SimpleNamespace
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.core.database import get_db
+from app.core.deps import get_current_user
+from app.main import app
+from app.models import ShoppingList, ShoppingItem
+from benchmarks.common import fresh_engine, seed_household, timed
+
+LISTS = 200
+ITEMS_PER_LIST = 100
+
+
+async def main() -> None:
+    engine = await fresh_engine()
+    household_id, user_id = await seed_household(engine, recipes=0)
+    now = datetime.now(UTC)
+    list_ids = [str(uuid.uuid4()) for _ in range(LISTS)]
+    async with engine.begin() as conn:
+        await conn.execute(insert(ShoppingList), [
+            {"id": list_id, "household_id": household_id, "name": f"Week {i}", "created_at": now - timedelta(days=7 * i)}
+            for i, list_id in enumerate(list_ids)
+        ])
+        await conn.execute(insert(ShoppingItem), [
+            {
+                "id": str(uuid.uuid4()), "list_id": list_id, "ingredient_name": f"item {n}", "quantity": 1.0,
+                "unit": "cup", "checked": n % 3 == 0, "category": "Pantry",
+            }
+            for list_id in list_ids for n in range(ITEMS_PER_LIST)
+        ])
+        await conn.exec_driver_sql("ANALYZE")
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_db():
+        async with Session() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=user_id, household_id=household_id)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench", timeout=None) as client:
+        print(f"{'view':<24}  {'bytes':>11}  {'ms':>8}")
+        for label, params in (
+            ("full, all lists", {}), ("summary, all lists", {"view": "summary"}),
+            ("full, first 20", {"limit": 20}), ("summary, first 20", {"view": "summary", "limit": 20}),
+        ):
+            size = len((await client.get("/api/shopping", params=params)).content)
+            ms = await timed(lambda: client.get("/api/shopping", params=params))
+            print(f"{label:<24}  {size:>11,}  {ms:>8.1f}")
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
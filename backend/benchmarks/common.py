@@ -0,0 +1,90 @@
+"""Shared helpers for the standalone benchmark scripts.
+
+Benchmarks run against a scratch database (its tables are dropped and recreated):
+
+    BENCH_DATABASE_URL=postgresql+asyncpg://user@localhost:5432/recipedb_bench \\
+        python -m benchmarks.bench_recipe_list
+"""
+import os
+import statistics
+import time
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from app.models import Base
+
+BENCH_DB_URL = os.environ.get("BENCH_DATABASE_URL", "postgresql+asyncpg://postgres@localhost:5432/recipedb_bench")
+
+
+async def fresh_engine() -> AsyncEngine:
+    engine = create_async_engine(BENCH_DB_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    return engine
+
+
+async def timed(fn, repeat: int = 5) -> float:
+    """Median wall time of ``await fn()`` in milliseconds, after one warm-up call."""
+    await fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def timed_sync(fn, repeat: int = 5) -> float:
+    fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def seed_household(engine: AsyncEngine, recipes: int, tags_per_recipe: int = 3, ingredients_per_recipe: int = 0) -> tuple[str, str]:
+    """Insert one household with a user and ``recipes`` recipes; returns (household_id, user_id)."""
+    import uuid
+    from datetime import datetime, timedelta, UTC
+    from sqlalchemy import insert
+    from app.models import Household, User, Recipe, Ingredient, Tag, RecipeTag
+
+    household_id, user_id = str(uuid.uuid4()), str(uuid.uuid4())
+    now = datetime.now(UTC)
+    tag_ids = [str(uuid.uuid4()) for _ in range(12)]
+    recipe_rows = [
+        {
+            "id": str(uuid.uuid4()), "household_id": household_id, "created_by_id": user_id,
+            "title": f"Recipe {i}", "description": "A reasonably long description. " * 8,
+            "servings": "4", "total_time": 30 + i % 60, "cuisine": "Italian",
+            "nutrition": {"calories": 500, "protein": "20g"},
+            "created_at": now - timedelta(minutes=i), "updated_at": now,
+        }
+        for i in range(recipes)
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(insert(Household), [{"id": household_id, "name": "Bench", "created_at": now}])
+        await conn.execute(insert(User), [{
+            "id": user_id, "household_id": household_id, "email": f"{user_id}@bench.test",
+            "name": "Bench User", "role": "admin", "created_at": now,
+        }])
+        await conn.execute(insert(Tag), [
+            {"id": t, "household_id": household_id, "name": f"tag-{i}", "category": "custom", "color": "#84cc16"}
+            for i, t in enumerate(tag_ids)
+        ])
+        for start in range(0, recipes, 1000):
+            batch = recipe_rows[start:start + 1000]
+            await conn.execute(insert(Recipe), batch)
+            await conn.execute(insert(RecipeTag), [
+                {"recipe_id": r["id"], "tag_id": tag_ids[(i + j) % len(tag_ids)]}
+                for i, r in enumerate(batch) for j in range(tags_per_recipe)
+            ])
+            if ingredients_per_recipe:
+                await conn.execute(insert(Ingredient), [
+                    {"id": str(uuid.uuid4()), "recipe_id": r["id"], "name": f"ingredient {k}",
+                     "quantity": 1.5, "unit": "cup", "order": k}
+                    for r in batch for k in range(ingredients_per_recipe)
+                ])
+        await conn.exec_driver_sql("ANALYZE")
+    return household_id, user_id
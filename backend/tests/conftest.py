@@ -22,7 +22,7 @@ async def setup_db():
 
     app.dependency_overrides[get_db] = override_get_db
 
-    yield
+    yield engine
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
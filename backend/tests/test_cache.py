@@ -0,0 +1,23 @@
+from app.services.cache.memory import MemoryCache
+
+
+async def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_bytes=10)
+    await cache.set("a", b"1234")
+    await cache.set("b", b"1234")
+    assert await cache.get("a") == b"1234"  # now most recently used
+    await cache.set("c", b"1234")
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"1234"
+    assert cache.size == 8
+
+
+async def test_memory_cache_replace_and_delete():
+    cache = MemoryCache(max_bytes=10)
+    await cache.set("a", b"1234")
+    await cache.set("a", b"12")
+    assert cache.size == 2
+    await cache.set("too-big", b"x" * 11)
+    assert await cache.get("too-big") is None
+    await cache.delete("a", "missing")
+    assert await cache.get("a") is None and cache.size == 0
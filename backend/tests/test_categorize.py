@@ -0,0 +1,40 @@
+import random
+from app.utils.categorize import _KEYWORD_MAP, categorize_ingredient, categorize_many
+
+
+def _reference_categorize(name: str) -> str:
+    """The keyword-by-keyword substring scan the automaton replaced."""
+    lower = name.lower()
+    if lower in _KEYWORD_MAP:
+        return _KEYWORD_MAP[lower]
+    best: tuple[int, str] | None = None
+    for kw, cat in _KEYWORD_MAP.items():
+        if kw in lower:
+            if best is None or len(kw) > best[0]:
+                best = (len(kw), cat)
+    return best[1] if best else "Other"
+
+
+def _corpus() -> list[str]:
+    keywords = list(_KEYWORD_MAP)
+    rng = random.Random(19)
+    names = keywords + [kw.upper() for kw in keywords] + [f"fresh {kw}s, chopped" for kw in keywords]
+    names += [" ".join(rng.sample(keywords, 3)) for _ in range(2000)]
+    names += ["".join(rng.sample(keywords, 2)) for _ in range(1000)]  # keywords run together
+    names += ["", "xyz", "unknown thing", "ñame", "jalapeños"]
+    return names
+
+
+def test_categorize_matches_reference_scan():
+    for name in _corpus():
+        assert categorize_ingredient(name) == _reference_categorize(name), name
+
+
+def test_categorize_longest_keyword_wins():
+    assert categorize_ingredient("Peanut Butter") == "Pantry & Dry Goods"  # not "butter"
+    assert categorize_ingredient("frozen peas") == "Frozen"  # not "pea"
+    assert categorize_ingredient("mystery") == "Other"
+
+
+def test_categorize_many():
+    assert categorize_many(["milk", "salmon fillet", "milk"]) == ["Dairy & Eggs", "Meat & Seafood", "Dairy & Eggs"]
@@ -0,0 +1,87 @@
+import random
+import pytest
+from app.utils.combine import combine_many, convert_quantities
+from app.utils.density import density_for
+from app.utils.units import try_combine
+
+
+# ── combine_many ──────────────────────────────────────────────────────────────
+
+def _lines(keys, quantities, units, system=None, density=None):
+    combined = combine_many(keys, quantities, units, system, density)
+    members = [[] for _ in combined.first]
+    for i, line in enumerate(combined.line_of.tolist()):
+        members[line].append(i)
+    assert [m[0] for m in members] == combined.first
+    assert [len(m) for m in members] == combined.sizes
+    return list(zip(combined.quantities, combined.units, members))
+
+def test_combine_many_groups_by_key_and_dimension():
+    lines = _lines(
+        ["flour", "sugar", "flour", "flour", "garlic", "garlic", "flour"],
+        [1.0, 2.0, 4.0, 200.0, 2.0, 1.0, None],
+        ["cup", "tbsp", "tablespoon", "g", "cloves", "clove", "cup"],
+    )
+    assert lines[0] == (pytest.approx(1.25, rel=1e-2), "cup", [0, 2])
+    assert lines[1] == (2.0, "tbsp", [1])  # alone: unit kept as written
+    assert lines[2] == (200.0, "g", [3])
+    assert lines[3] == (3.0, "clove", [4, 5])
+    assert lines[4] == (None, "cup", [6])  # missing quantities never combine
+
+def test_combine_many_leaves_unitless_quantities_alone():
+    assert _lines(["egg", "egg"], [2.0, 3.0], [None, None]) == [(2.0, None, [0]), (3.0, None, [1])]
+
+def test_combine_many_same_unit_is_not_converted():
+    assert _lines(["oil", "oil"], [2.0, 3.0], ["tbsp", "tbsp"]) == [(5.0, "tablespoon", [0, 1])]
+
+def test_combine_many_matches_pairwise_try_combine():
+    units = ["cup", "tbsp", "tsp", "ml", "l", "oz", "lb", "g", "kg", "clove", "can", None]
+    rng = random.Random(4)
+    for _ in range(200):
+        unit_a, unit_b = rng.choice(units), rng.choice(units)
+        qty_a, qty_b = rng.uniform(0.1, 500), rng.uniform(0.1, 500)
+        pairwise = try_combine(qty_a, unit_a, qty_b, unit_b)
+        lines = _lines(["x", "x"], [qty_a, qty_b], [unit_a, unit_b])
+        if pairwise is None:
+            assert len(lines) == 2
+        else:
+            assert lines == [(pytest.approx(pairwise[0]), pairwise[1], [0, 1])]
+
+def test_combine_many_with_density():
+    lines = _lines(
+        ["butter", "butter", "butter", "salt", "salt"],
+        [100.0, 0.5, 2.0, 1.0, 5.0],
+        ["g", "cup", "tbsp", "tsp", "g"],
+        density=density_for,
+    )
+    # butter: 100 g + (118.3 ml + 29.6 ml) * 0.96 g/ml, kept as a weight like its first entry
+    assert lines[0] == (pytest.approx(242.0 / 28.3495, rel=1e-2), "ounce", [0, 1, 2])
+    assert lines[1] == (pytest.approx(1.0 + 5.0 / 1.22 / 4.929, rel=1e-2), "teaspoon", [3, 4])
+
+def test_combine_many_density_matches_try_combine():
+    for unit_a, unit_b in (("cup", "g"), ("oz", "tbsp"), ("ml", "lb")):
+        pairwise = try_combine(2.0, unit_a, 3.0, unit_b, ingredient="sugar")
+        assert _lines(["sugar", "sugar"], [2.0, 3.0], [unit_a, unit_b], density=density_for) == [
+            (pytest.approx(pairwise[0]), pairwise[1], [0, 1]),
+        ]
+
+def test_combine_many_empty():
+    assert combine_many([], [], []).first == []
+
+
+# ── convert_quantities ────────────────────────────────────────────────────────
+
+def test_convert_quantities_scales_and_converts_batch():
+    converted = convert_quantities([(2.0, "cup"), (8.0, "oz"), (2.0, "cloves"), (None, "pinch")], 2, "metric")
+    assert converted[0] == (pytest.approx(0.946, rel=1e-3), "liter")
+    assert converted[1] == (pytest.approx(453.592), "gram")
+    assert converted[2:] == [(4.0, "cloves"), (None, "pinch")]
+
+def test_convert_quantities_to_us():
+    (cups, unit), (oz, weight_unit) = convert_quantities([(500.0, "ml"), (100.0, "g")], system="us")
+    assert (cups, unit) == (pytest.approx(2.113, rel=1e-3), "cup")
+    assert (oz, weight_unit) == (pytest.approx(3.527, rel=1e-3), "ounce")
+
+def test_convert_quantities_without_system_keeps_units():
+    assert convert_quantities([(1.5, "tbsp")], 2) == [(3.0, "tbsp")]
+
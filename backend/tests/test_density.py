@@ -0,0 +1,15 @@
+import pytest
+from app.utils.density import density_for
+
+
+def test_density_for_matches_pantry_term():
+    assert density_for("All-Purpose Flour, sifted") == pytest.approx(0.53)
+    assert density_for("Brown sugar") == pytest.approx(0.90)
+
+def test_density_for_falls_back_to_trailing_words():
+    assert density_for("unsalted butter") == density_for("butter")
+    assert density_for("extra virgin olive oil") == density_for("olive oil")
+
+def test_density_for_unknown():
+    assert density_for("eggs") is None
+    assert density_for(None) is None
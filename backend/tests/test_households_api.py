@@ -0,0 +1,140 @@
+import json
+from app.services import backup
+
+
+async def _seed_recipes(client):
+    first = (await client.post("/api/recipes", json={
+        "title": "Pancakes", "servings": "4", "prep_time": 10, "author": "Gran",
+        "ingredients": [{"name": "flour", "quantity": 1.5, "unit": "cup", "notes": "sifted"}, {"name": "eggs", "quantity": 2}],
+        "steps": [{"title": "Mix", "description": "Whisk everything."}, {"description": "Fry."}],
+    })).json()
+    await client.put(f"/api/tags/recipes/{first['id']}", json=[{"name": "Breakfast", "category": "meal"}])
+    second = (await client.post("/api/recipes", json={"title": "Toast"})).json()
+    return first, second
+
+
+async def test_export_ndjson(authed_client, monkeypatch):
+    monkeypatch.setattr(backup, "EXPORT_PAGE_SIZE", 1)  # one recipe per cursor page
+    first, second = await _seed_recipes(authed_client)
+
+    resp = await authed_client.get("/api/households/export")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in resp.text.splitlines()]
+    assert [r["type"] for r in records] == ["household", "tag", "recipe", "recipe"]
+    assert records[0]["name"] == "Test Household"
+    assert records[1]["name"] == "Breakfast"
+    pancakes = records[2]
+    assert pancakes["id"] == first["id"]
+    assert [(i["name"], i["quantity"]) for i in pancakes["ingredients"]] == [("flour", 1.5), ("eggs", 2.0)]
+    assert [s["description"] for s in pancakes["steps"]] == ["Whisk everything.", "Fry."]
+    assert [t["name"] for t in pancakes["tags"]] == ["Breakfast"]
+    assert records[3]["id"] == second["id"]
+
+
+async def test_export_jsonld(authed_client):
+    await _seed_recipes(authed_client)
+
+    resp = await authed_client.get("/api/households/export", params={"format": "jsonld"})
+    assert resp.headers["content-type"].startswith("application/ld+json")
+    doc = resp.json()
+    assert doc["@context"] == "https://schema.org"
+    pancakes, toast = doc["@graph"]
+    assert pancakes["@type"] == "Recipe"
+    assert pancakes["recipeIngredient"] == ["1 1/2 cup flour, sifted", "2 eggs"]
+    assert pancakes["recipeInstructions"][0] == {"@type": "HowToStep", "name": "Mix", "text": "Whisk everything."}
+    assert pancakes["prepTime"] == "PT10M"
+    assert pancakes["author"] == {"@type": "Person", "name": "Gran"}
+    assert pancakes["keywords"] == "Breakfast"
+    assert "recipeIngredient" not in toast
+
+
+async def test_export_only_includes_own_household(authed_client, client):
+    await _seed_recipes(authed_client)
+    resp = await client.post("/api/auth/register", json={
+        "household_name": "Other", "name": "Other", "email": "other@example.com", "password": "pw123456",
+    })
+    resp = await client.get(
+        "/api/households/export", headers={"Authorization": f"Bearer {resp.json()['access_token']}"},
+    )
+    assert [json.loads(line)["type"] for line in resp.text.splitlines()] == ["household"]
+
+
+async def _export(client) -> bytes:
+    return (await client.get("/api/households/export")).content
+
+
+async def test_restore_round_trip(authed_client):
+    first, _ = await _seed_recipes(authed_client)
+    shopping = (await authed_client.post("/api/shopping", json={"name": "Weekly"})).json()
+    await authed_client.post(f"/api/shopping/{shopping['id']}/add-from-recipe", json={"recipe_id": first["id"]})
+    archive = await _export(authed_client)
+
+    resp = await authed_client.post("/api/households/restore", files={"archive": ("backup.ndjson", archive)})
+    assert resp.status_code == 200
+    counts = resp.json()
+    # Same household: tags merge by name, every other id collides and is remapped
+    assert counts["tags"] == 0
+    assert (counts["recipes"], counts["ingredients"], counts["steps"], counts["recipe_tags"]) == (2, 2, 2, 1)
+    assert (counts["shopping_lists"], counts["shopping_items"]) == (1, 2)
+    assert counts["remapped_ids"] == 2 + 2 + 2 + 1 + 2
+
+    recipes = (await authed_client.get("/api/recipes", params={"q": "pancakes"})).json()
+    assert len(recipes) == 2
+    copy = next(r for r in recipes if r["id"] != first["id"])
+    restored = (await authed_client.get(f"/api/recipes/{copy['id']}")).json()
+    assert [(i["name"], i["notes"]) for i in restored["ingredients"]] == [("flour", "sifted"), ("eggs", None)]
+    original = (await authed_client.get(f"/api/recipes/{first['id']}")).json()
+    assert [t["id"] for t in restored["tags"]] == [t["id"] for t in original["tags"]]
+
+    lists = (await authed_client.get("/api/shopping")).json()
+    restored_list = next(sl for sl in lists if sl["id"] != shopping["id"])
+    assert {i["recipe_id"] for i in restored_list["items"]} == {copy["id"]}
+
+
+async def test_restore_keeps_free_ids(authed_client):
+    first, _ = await _seed_recipes(authed_client)
+    archive = await _export(authed_client)
+    await authed_client.delete(f"/api/recipes/{first['id']}")
+
+    resp = await authed_client.post("/api/households/restore", files={"archive": ("backup.ndjson", archive)})
+    counts = resp.json()
+    assert counts["recipes"] == 2 and counts["remapped_ids"] == 1  # only the still-present Toast collides
+    assert (await authed_client.get(f"/api/recipes/{first['id']}")).json()["title"] == "Pancakes"
+
+
+async def test_restore_rejects_bad_archive_atomically(authed_client):
+    archive = await _export(authed_client) + b'{"type": "recipe", "id": "x"}\n'
+    resp = await authed_client.post("/api/households/restore", files={"archive": ("backup.ndjson", archive)})
+    assert resp.status_code == 400
+
+    resp = await authed_client.post("/api/households/restore", files={"archive": ("notes.txt", b"hello")})
+    assert resp.status_code == 400
+    assert (await authed_client.get("/api/recipes")).json() == []
+
+
+async def test_restore_error_does_not_echo_database_text(authed_client):
+    await _seed_recipes(authed_client)
+    export = await _export(authed_client)
+    recipe_line = next(line for line in export.splitlines(keepends=True) if json.loads(line)["type"] == "recipe")
+    await authed_client.delete(f"/api/recipes/{json.loads(recipe_line)['id']}")
+
+    # The same recipe twice: both copies keep the free id and the second collides with the first
+    resp = await authed_client.post(
+        "/api/households/restore", files={"archive": ("backup.ndjson", export + recipe_line)},
+    )
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Could not restore recipes: the archive repeats an id"
+
+
+async def test_restore_requires_admin(authed_client, client):
+    invite = (await authed_client.post("/api/households/invite")).json()
+    await client.post("/api/auth/register", json={
+        "household_name": "", "name": "Member", "email": "member@example.com", "password": "pw123456",
+        "invite_token": invite["token"],
+    })
+    login = await client.post("/api/auth/login", json={"email": "member@example.com", "password": "pw123456"})
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    resp = await client.post("/api/households/restore", files={"archive": ("backup.ndjson", b"")})
+    assert resp.status_code == 403
@@ -0,0 +1,119 @@
+"""Query-plan regression tests.
+
+Each test drives an endpoint against a seeded dataset, records every statement it
+sends, then EXPLAINs them with sequential scans disabled. A Seq Scan that survives
+``enable_seqscan = off`` means no index can serve the query at all.
+"""
+import json
+import pytest
+from sqlalchemy import event
+
+# Tables that grow with usage; small lookup tables (households, invites) may be scanned.
+LARGE_TABLES = {
+    "recipes", "ingredients", "steps", "tags", "recipe_tags", "ingredient_terms",
+    "shopping_lists", "shopping_items", "users",
+}
+_NOT_EXPLAINABLE = ("INSERT", "BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE", "SET", "ANALYZE")
+
+
+@pytest.fixture
+async def seeded(authed_client):
+    """A household with 40 recipes, some tagged, and a shopping list built from five."""
+    recipes = [
+        {
+            "title": f"Recipe {i}", "description": "Slow-cooked and simple.",
+            "ingredients": [{"name": n, "quantity": 1, "unit": "cup"} for n in ("garlic", "onion", f"spice {i}")],
+            "steps": [{"description": "Chop."}, {"description": "Cook."}],
+        }
+        for i in range(40)
+    ]
+    result = (await authed_client.post("/api/recipes/bulk", json=recipes)).json()
+    ids = [r["id"] for r in result["results"]]
+    for recipe_id in ids[:10]:
+        await authed_client.put(f"/api/tags/recipes/{recipe_id}", json=[{"name": "Quick"}, {"name": "Dinner"}])
+    shopping = (await authed_client.post("/api/shopping", json={"name": "Weekly"})).json()
+    for recipe_id in ids[:5]:
+        await authed_client.post(f"/api/shopping/{shopping['id']}/add-from-recipe", json={"recipe_id": recipe_id})
+    tags = (await authed_client.get("/api/tags")).json()
+    return {"recipe_ids": ids, "list_id": shopping["id"], "tag_ids": [t["id"] for t in tags]}
+
+
+@pytest.fixture
+async def explained(setup_db, seeded):
+    """Records statements sent while the test runs; afterwards fails on any seq scan."""
+    engine = setup_db
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("ANALYZE")
+
+    statements: list[tuple[str, tuple]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and not statement.lstrip().upper().startswith(_NOT_EXPLAINABLE):
+            statements.append((statement, tuple(parameters or ())))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    assert statements
+    offenders = []
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        for statement, parameters in statements:
+            plan = (await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)).scalar()
+            scanned = _seq_scans(json.loads(plan) if isinstance(plan, str) else plan) & LARGE_TABLES
+            if scanned:
+                offenders.append(f"{sorted(scanned)}: {statement}")
+    assert not offenders, "Sequential scans on large tables:\n" + "\n\n".join(offenders)
+
+
+def _seq_scans(node) -> set[str]:
+    if isinstance(node, list):
+        return set().union(*map(_seq_scans, node))
+    if not isinstance(node, dict):
+        return set()
+    found = {node["Relation Name"]} if node.get("Node Type") == "Seq Scan" else set()
+    return found.union(*(_seq_scans(v) for v in node.values() if isinstance(v, (dict, list))))
+
+
+async def test_recipe_list_plans(authed_client, seeded, explained):
+    resp = await authed_client.get("/api/recipes", params={"limit": 10})
+    await authed_client.get("/api/recipes", params={"limit": 10, "cursor": resp.headers["X-Next-Cursor"]})
+    await authed_client.get("/api/recipes", params={"q": "garlic"})
+    await authed_client.get("/api/recipes", params={"q": "Recipe 1"})
+    await authed_client.get("/api/recipes", params={"q": "garlik", "fuzzy": True})
+    await authed_client.get("/api/recipes", params={"tag_names": ["Quick", "Dinner"]})
+    await authed_client.get("/api/recipes/facets", params={"tag_ids": seeded["tag_ids"][:1]})
+
+
+async def test_recipe_detail_plans(authed_client, seeded, explained):
+    recipe_id = seeded["recipe_ids"][0]
+    recipe = (await authed_client.get(f"/api/recipes/{recipe_id}")).json()
+    await authed_client.put(f"/api/recipes/{recipe_id}", json={
+        "title": "Renamed", "tag_ids": seeded["tag_ids"][:1],
+        "ingredients": [{"id": i["id"], "name": i["name"]} for i in recipe["ingredients"][1:]],
+        "steps": [{"description": "Just cook."}],
+    })
+    await authed_client.delete(f"/api/recipes/{seeded['recipe_ids'][1]}")
+
+
+async def test_pantry_plans(authed_client, seeded, explained):
+    await authed_client.post("/api/recipes/pantry", json={"ingredients": ["garlic", "spice 3"]})
+
+
+async def test_tag_plans(authed_client, seeded, explained):
+    await authed_client.get("/api/tags")
+    await authed_client.put(f"/api/tags/recipes/{seeded['recipe_ids'][20]}", json=[{"name": "Quick"}])
+    await authed_client.delete(f"/api/tags/{seeded['tag_ids'][0]}")
+
+
+async def test_shopping_plans(authed_client, seeded, explained):
+    list_id = seeded["list_id"]
+    await authed_client.get("/api/shopping")
+    shopping = (await authed_client.get(f"/api/shopping/{list_id}")).json()
+    await authed_client.patch(f"/api/shopping/{list_id}/items/{shopping['items'][0]['id']}/check")
+    await authed_client.post(f"/api/shopping/{list_id}/add-from-recipe", json={"recipe_id": seeded["recipe_ids"][9]})
+
+
+async def test_export_plans(authed_client, seeded, explained):
+    await authed_client.get("/api/households/export")
@@ -0,0 +1,82 @@
+import asyncio
+import json
+import pytest
+from app.main import app
+from app.services.realtime import ListBroker, get_broker
+from tests.conftest import TEST_DB_URL
+
+
+@pytest.fixture
+async def broker():
+    broker = ListBroker(TEST_DB_URL, queue_size=3)
+    app.dependency_overrides[get_broker] = lambda: broker
+    yield broker
+    app.dependency_overrides.pop(get_broker, None)
+    await broker.close()
+
+
+async def _next_event(sub) -> dict:
+    return json.loads(await asyncio.wait_for(sub.queue.get(), 5))
+
+
+async def test_committed_changes_reach_list_subscribers(authed_client, broker):
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Week"})).json()["id"]
+    other_id = (await authed_client.post("/api/shopping", json={"name": "Party"})).json()["id"]
+    sub = await broker.subscribe(list_id)
+    other = await broker.subscribe(other_id)
+
+    item = (await authed_client.post(f"/api/shopping/{list_id}/items?delta=true", json={"ingredient_name": "eggs"})).json()["items"][0]
+    await authed_client.patch(f"/api/shopping/{list_id}/items/{item['id']}/check")
+    # A failed change rolls its event back with it
+    await authed_client.patch(f"/api/shopping/{list_id}/items/missing/check")
+    await authed_client.post(f"/api/shopping/{list_id}/items", json={"ingredient_name": "milk"})
+
+    added, checked, added_again = [await _next_event(sub) for _ in range(3)]
+    assert added == {"event": "item_added", "version": 2, "items": [item], "deleted": []}
+    assert checked == {"event": "item_checked", "version": 3, "items": [{**item, "checked": True}], "deleted": []}
+    assert added_again["version"] == 4 and added_again["items"][0]["ingredient_name"] == "milk"
+    assert other.queue.empty()
+
+
+async def test_slow_subscriber_is_told_to_resync(authed_client, broker):
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Week"})).json()["id"]
+    sub = await broker.subscribe(list_id)
+    for name in ("a", "b", "c", "d"):
+        await authed_client.post(f"/api/shopping/{list_id}/items", json={"ingredient_name": name})
+    for _ in range(50):
+        if broker.subscriber_count(list_id) == 0:
+            break
+        await asyncio.sleep(0.05)
+
+    assert broker.subscriber_count(list_id) == 0
+    # Its backlog is dropped and the stream ends with the resync message
+    chunks = [chunk async for chunk in broker.stream(sub)]
+    assert chunks == [b"retry: 3000\n\n", b'data: {"event":"resync"}\n\n']
+
+
+async def test_events_endpoint(authed_client, broker):
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Week"})).json()["id"]
+    assert (await authed_client.get("/api/shopping/missing/events")).status_code == 404
+    assert broker.subscriber_count("missing") == 0
+
+    stream = asyncio.create_task(authed_client.get(f"/api/shopping/{list_id}/events"))
+    while broker.subscriber_count(list_id) == 0:
+        await asyncio.sleep(0.01)
+    broker._on_lost(None)  # as if the LISTEN connection dropped: every stream resyncs and ends
+    resp = await asyncio.wait_for(stream, 5)
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.text == (
+        'retry: 3000\n\ndata: {"event":"hello","version":1}\n\ndata: {"event":"resync"}\n\n'
+    )
+
+
+async def test_stream_ends_when_list_is_deleted(authed_client, broker):
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Week"})).json()["id"]
+    sub = await broker.subscribe(list_id)
+    await authed_client.delete(f"/api/shopping/{list_id}")
+    while sub.queue.empty():
+        await asyncio.sleep(0.01)
+
+    chunks = [chunk async for chunk in broker.stream(sub)]
+    assert json.loads(chunks[-1].removeprefix(b"data: "))["event"] == "list_deleted"
+    assert broker.subscriber_count(list_id) == 0
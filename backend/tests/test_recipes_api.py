@@ -1,4 +1,7 @@
 import pytest
+from datetime import datetime
+from app.services.cache.base import recipe_key
+from app.services.cache.factory import get_cache
 
 async def test_create_recipe_returns_201(authed_client):
     resp = await authed_client.post("/api/recipes", json={
@@ -81,3 +84,354 @@ async def test_recipe_not_accessible_across_households(authed_client, client):
 
     resp = await client.get(f"/api/recipes/{recipe_id}")
     assert resp.status_code == 404
+
+async def test_search_matches_ingredients_steps_and_tags(authed_client):
+    await authed_client.post("/api/recipes", json={
+        "title": "Weeknight Stir Fry",
+        "ingredients": [{"name": "bok choy"}],
+        "steps": [{"description": "Toss with toasted sesame oil."}],
+    })
+    await authed_client.post("/api/recipes", json={"title": "Caesar Salad"})
+
+    for q in ("bok choy", "sesame", "toasted"):
+        resp = await authed_client.get(f"/api/recipes?q={q}")
+        assert [r["title"] for r in resp.json()] == ["Weeknight Stir Fry"]
+
+async def test_search_ranks_title_matches_first(authed_client):
+    await authed_client.post("/api/recipes", json={
+        "title": "Garlic Bread",
+        "description": "Goes well with pasta.",
+    })
+    await authed_client.post("/api/recipes", json={"title": "Pasta Primavera"})
+
+    resp = await authed_client.get("/api/recipes?q=pasta")
+    assert [r["title"] for r in resp.json()] == ["Pasta Primavera", "Garlic Bread"]
+
+async def test_search_reflects_updated_ingredients(authed_client):
+    resp = await authed_client.post("/api/recipes", json={
+        "title": "Soup",
+        "ingredients": [{"name": "leek"}],
+    })
+    recipe_id = resp.json()["id"]
+    await authed_client.put(f"/api/recipes/{recipe_id}", json={
+        "title": "Soup",
+        "ingredients": [{"name": "butternut squash"}],
+    })
+
+    assert (await authed_client.get("/api/recipes?q=leek")).json() == []
+    assert len((await authed_client.get("/api/recipes?q=squash")).json()) == 1
+
+async def test_search_matches_partial_title(authed_client):
+    await authed_client.post("/api/recipes", json={"title": "Pasta Carbonara"})
+
+    resp = await authed_client.get("/api/recipes?q=carbo")
+    assert [r["title"] for r in resp.json()] == ["Pasta Carbonara"]
+
+async def test_fuzzy_search_tolerates_typos(authed_client):
+    await authed_client.post("/api/recipes", json={"title": "Chicken Parmesan"})
+    await authed_client.post("/api/recipes", json={
+        "title": "Caesar Salad",
+        "ingredients": [{"name": "parmesan cheese"}],
+    })
+    await authed_client.post("/api/recipes", json={"title": "Beef Stew"})
+
+    assert (await authed_client.get("/api/recipes?q=parmesean chiken")).json() == []
+
+    resp = await authed_client.get("/api/recipes?q=parmesean chiken&fuzzy=true")
+    assert resp.json()[0]["title"] == "Chicken Parmesan"
+
+    resp = await authed_client.get("/api/recipes?q=parmesean&fuzzy=true")
+    assert {r["title"] for r in resp.json()} == {"Chicken Parmesan", "Caesar Salad"}
+
+async def test_fuzzy_search_respects_min_similarity(authed_client):
+    await authed_client.post("/api/recipes", json={"title": "Chicken Parmesan"})
+
+    resp = await authed_client.get("/api/recipes?q=chiken&fuzzy=true&min_similarity=1")
+    assert resp.json() == []
+    resp = await authed_client.get("/api/recipes?q=chiken&fuzzy=true&min_similarity=0.5")
+    assert len(resp.json()) == 1
+
+async def test_list_recipes_cursor_pagination(authed_client):
+    for i in range(5):
+        await authed_client.post("/api/recipes", json={"title": f"Recipe {i}"})
+    everything = [r["id"] for r in (await authed_client.get("/api/recipes")).json()]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2} | ({"cursor": cursor} if cursor else {})
+        resp = await authed_client.get("/api/recipes", params=params)
+        assert len(resp.json()) <= 2
+        seen += [r["id"] for r in resp.json()]
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert seen == everything
+
+async def test_list_recipes_ranked_search_pagination(authed_client):
+    await authed_client.post("/api/recipes", json={"title": "Pasta Primavera"})
+    await authed_client.post("/api/recipes", json={"title": "Garlic Bread", "description": "Serve with pasta."})
+    await authed_client.post("/api/recipes", json={"title": "Baked Pasta"})
+
+    first = await authed_client.get("/api/recipes", params={"q": "pasta", "limit": 2})
+    second = await authed_client.get("/api/recipes", params={
+        "q": "pasta", "limit": 2, "cursor": first.headers["X-Next-Cursor"],
+    })
+    assert [r["title"] for r in second.json()] == ["Garlic Bread"]
+    assert "X-Next-Cursor" not in second.headers
+
+async def test_list_recipes_invalid_cursor(authed_client):
+    resp = await authed_client.get("/api/recipes", params={"limit": 2, "cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+async def _tagged_recipes(client):
+    """Three recipes tagged Italian+Quick, Italian+Baked, Quick; returns {name: tag}."""
+    resp = await client.post("/api/recipes", json={"title": "Carbonara"})
+    await client.put(f"/api/tags/recipes/{resp.json()['id']}", json=[{"name": "Italian"}, {"name": "Quick"}])
+    resp = await client.post("/api/recipes", json={"title": "Lasagna"})
+    await client.put(f"/api/tags/recipes/{resp.json()['id']}", json=[{"name": "Italian"}, {"name": "Baked"}])
+    resp = await client.post("/api/recipes", json={"title": "Omelette"})
+    await client.put(f"/api/tags/recipes/{resp.json()['id']}", json=[{"name": "Quick"}])
+    return {t["name"]: t for t in (await client.get("/api/tags")).json()}
+
+async def test_list_recipes_filters_by_all_tags(authed_client):
+    tags = await _tagged_recipes(authed_client)
+
+    resp = await authed_client.get("/api/recipes", params={"tag_names": ["Italian", "Quick"]})
+    assert [r["title"] for r in resp.json()] == ["Carbonara"]
+
+    resp = await authed_client.get("/api/recipes", params={"tag_ids": [tags["Italian"]["id"]], "tag_names": ["Italian"]})
+    assert {r["title"] for r in resp.json()} == {"Carbonara", "Lasagna"}
+
+    resp = await authed_client.get("/api/recipes", params={"tag_ids": [tags["Baked"]["id"]], "tag_names": ["Quick"]})
+    assert resp.json() == []
+
+async def test_tag_facets(authed_client):
+    await _tagged_recipes(authed_client)
+
+    resp = await authed_client.get("/api/recipes/facets")
+    assert {f["name"]: f["recipe_count"] for f in resp.json()} == {"Italian": 2, "Quick": 2, "Baked": 1}
+
+    resp = await authed_client.get("/api/recipes/facets", params={"tag_names": ["Italian"]})
+    assert {f["name"]: f["recipe_count"] for f in resp.json()} == {"Quick": 1, "Baked": 1}
+
+async def test_cook_with_pantry_ranks_by_coverage(authed_client):
+    await authed_client.post("/api/recipes", json={
+        "title": "Omelette",
+        "ingredients": [{"name": "Eggs"}, {"name": "butter"}, {"name": "fresh chives, minced"}],
+    })
+    await authed_client.post("/api/recipes", json={
+        "title": "Scrambled Eggs",
+        "ingredients": [{"name": "eggs"}, {"name": "Butter"}],
+    })
+    await authed_client.post("/api/recipes", json={
+        "title": "Roast Chicken",
+        "ingredients": [{"name": "chicken"}, {"name": "shallots"}, {"name": "thyme"}],
+    })
+
+    resp = await authed_client.post("/api/recipes/pantry", json={"ingredients": ["egg", "butter", "chicken"]})
+    assert resp.status_code == 200
+    matches = resp.json()
+    assert [m["title"] for m in matches] == ["Scrambled Eggs", "Omelette", "Roast Chicken"]
+    assert sorted(matches[1]["matched"]) == ["butter", "egg"]
+    assert matches[1]["missing"] == ["chive"]
+    assert matches[1]["ingredient_count"] == 3
+    assert sorted(matches[2]["missing"]) == ["shallot", "thyme"]
+
+async def test_cook_with_pantry_matches_qualified_ingredients(authed_client):
+    await authed_client.post("/api/recipes", json={
+        "title": "Garlic Bread",
+        "ingredients": [
+            {"name": "unsalted butter"}, {"name": "kosher salt"}, {"name": "2 cloves garlic"}, {"name": "baguette"},
+        ],
+    })
+    resp = await authed_client.post("/api/recipes/pantry", json={"ingredients": ["butter", "salt", "garlic"]})
+    [match] = resp.json()
+    assert sorted(match["matched"]) == ["clove garlic", "kosher salt", "unsalted butter"]
+    assert match["missing"] == ["baguette"]
+    # Only whole trailing words count: "salt" doesn't cover "unsalted butter"
+    [match] = (await authed_client.post("/api/recipes/pantry", json={"ingredients": ["salt"]})).json()
+    assert match["matched"] == ["kosher salt"]
+
+async def test_cook_with_pantry_follows_ingredient_edits(authed_client):
+    resp = await authed_client.post("/api/recipes", json={"title": "Toast", "ingredients": [{"name": "bread"}]})
+    recipe_id = resp.json()["id"]
+    await authed_client.put(f"/api/recipes/{recipe_id}", json={"title": "Toast", "ingredients": [{"name": "brioche"}]})
+
+    assert (await authed_client.post("/api/recipes/pantry", json={"ingredients": ["bread"]})).json() == []
+    await authed_client.delete(f"/api/recipes/{recipe_id}")
+    assert (await authed_client.post("/api/recipes/pantry", json={"ingredients": ["brioche"]})).json() == []
+
+async def test_list_recipes_item_shape(authed_client):
+    resp = await authed_client.post("/api/recipes", json={"title": "Pasta", "servings": "4", "total_time": 30})
+    await authed_client.put(f"/api/tags/recipes/{resp.json()['id']}", json=[{"name": "Italian", "category": "cuisine"}])
+
+    item = (await authed_client.get("/api/recipes")).json()[0]
+    assert set(item) == {
+        "id", "title", "description", "image_url", "cuisine", "total_time",
+        "servings", "tags", "created_at", "created_by",
+    }
+    assert item["total_time"] == 30
+    assert item["created_by"]["name"] == "Test User"
+    assert [(t["name"], t["category"]) for t in item["tags"]] == [("Italian", "cuisine")]
+    # Built in SQL, but written exactly as the full recipe's timestamp is
+    assert item["created_at"] == resp.json()["created_at"]
+
+async def test_update_recipe_keeps_unchanged_rows(authed_client):
+    resp = await authed_client.post("/api/recipes", json={
+        "title": "Stew",
+        "ingredients": [{"name": "beef"}, {"name": "carots"}, {"name": "onion"}],
+        "steps": [{"description": "Brown the beef."}, {"description": "Simmer."}],
+    })
+    before = resp.json()
+    ingredients = [{"id": i["id"], "name": i["name"]} for i in before["ingredients"]]
+    ingredients[1]["name"] = "carrots"
+    del ingredients[2]
+    ingredients.insert(0, {"name": "flour"})
+
+    resp = await authed_client.put(f"/api/recipes/{before['id']}", json={
+        "title": "Stew",
+        "ingredients": ingredients,
+        # no ids: matched by position
+        "steps": [{"description": "Brown the beef."}, {"description": "Simmer for 2 hours."}],
+    })
+    assert resp.status_code == 200
+    after = resp.json()
+    assert [(i["name"], i["order"]) for i in after["ingredients"]] == [("flour", 0), ("beef", 1), ("carrots", 2)]
+    assert after["ingredients"][1]["id"] == before["ingredients"][0]["id"]
+    assert after["ingredients"][2]["id"] == before["ingredients"][1]["id"]
+    assert [s["id"] for s in after["steps"]] == [s["id"] for s in before["steps"]]
+    assert after["steps"][1]["description"] == "Simmer for 2 hours."
+
+    fetched = (await authed_client.get(f"/api/recipes/{before['id']}")).json()
+    assert fetched["ingredients"] == after["ingredients"]
+    assert fetched["updated_at"] == after["updated_at"]
+
+async def test_update_recipe_without_changes_keeps_updated_at(authed_client):
+    resp = await authed_client.post("/api/recipes", json={"title": "Toast", "ingredients": [{"name": "bread"}]})
+    recipe = resp.json()
+
+    resp = await authed_client.put(f"/api/recipes/{recipe['id']}", json={
+        "title": "Toast", "ingredients": [{"name": "bread"}],
+    })
+    assert resp.json()["updated_at"] == recipe["updated_at"]
+
+async def test_update_recipe_replaces_tags(authed_client):
+    tags = await _tagged_recipes(authed_client)
+    resp = await authed_client.post("/api/recipes", json={"title": "Pizza", "tag_ids": [tags["Italian"]["id"]]})
+
+    resp = await authed_client.put(f"/api/recipes/{resp.json()['id']}", json={
+        "title": "Pizza", "tag_ids": [tags["Quick"]["id"], tags["Baked"]["id"]],
+    })
+    assert sorted(t["name"] for t in resp.json()["tags"]) == ["Baked", "Quick"]
+
+async def test_bulk_import_reports_per_item_results(authed_client):
+    tags = await _tagged_recipes(authed_client)
+    resp = await authed_client.post("/api/recipes/bulk?batch_size=2", json=[
+        {"title": "Risotto", "tag_ids": [tags["Italian"]["id"], "not-a-tag"],
+         "ingredients": [{"name": "arborio rice"}, {"name": "parmesan"}], "steps": [{"description": "Stir."}]},
+        {"description": "missing a title"},
+        {"title": "x" * 600},  # too long for the column: rejected by the database
+        {"title": "Gazpacho", "ingredients": [{"name": "tomatoes"}]},
+    ])
+    assert resp.status_code == 200
+    body = resp.json()
+    assert (body["created"], body["failed"]) == (2, 2)
+    assert [r["index"] for r in body["results"]] == [0, 1, 2, 3]
+    assert "title" in body["results"][1]["error"]
+    assert body["results"][2] == {"index": 2, "id": None, "error": "recipe: a value is too long"}
+
+    recipe = (await authed_client.get(f"/api/recipes/{body['results'][0]['id']}")).json()
+    assert [i["name"] for i in recipe["ingredients"]] == ["arborio rice", "parmesan"]
+    assert [t["name"] for t in recipe["tags"]] == ["Italian"]
+    found = (await authed_client.get("/api/recipes", params={"q": "tomato"})).json()
+    assert [r["title"] for r in found] == ["Gazpacho"]
+
+async def test_bulk_import_ndjson(authed_client):
+    lines = ['{"title": "Soup"}', "not json", '{"title": "Salad", "steps": [{"description": "Toss."}]}']
+    resp = await authed_client.post(
+        "/api/recipes/bulk", content="\n".join(lines) + "\n",
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    body = resp.json()
+    assert (body["created"], body["failed"]) == (2, 1)
+    assert body["results"][1]["error"].startswith("recipe: Invalid JSON")
+
+async def test_bulk_import_rejects_non_array(authed_client):
+    resp = await authed_client.post("/api/recipes/bulk", json={"title": "Soup"})
+    assert resp.status_code == 400
+
+async def test_get_recipe_reflects_edits_after_caching(authed_client):
+    recipe = (await authed_client.post("/api/recipes", json={"title": "Chili"})).json()
+    url = f"/api/recipes/{recipe['id']}"
+    assert (await authed_client.get(url)).json() == recipe
+    key = recipe_key(recipe["household_id"], recipe["id"], datetime.fromisoformat(recipe["updated_at"]))
+    assert await get_cache().get(key) is not None
+    assert (await authed_client.get(url)).json() == recipe
+
+    await authed_client.put(url, json={"title": "Five-Alarm Chili"})
+    assert (await authed_client.get(url)).json()["title"] == "Five-Alarm Chili"
+
+    await authed_client.put(f"/api/tags/recipes/{recipe['id']}", json=[{"name": "Spicy"}])
+    tags = (await authed_client.get(url)).json()["tags"]
+    assert [t["name"] for t in tags] == ["Spicy"]
+
+    await authed_client.delete(f"/api/tags/{tags[0]['id']}")
+    assert (await authed_client.get(url)).json()["tags"] == []
+
+    await authed_client.delete(url)
+    assert (await authed_client.get(url)).status_code == 404
+
+async def test_get_recipe_etag(authed_client):
+    recipe = (await authed_client.post("/api/recipes", json={"title": "Chili"})).json()
+    url = f"/api/recipes/{recipe['id']}"
+    etag = (await authed_client.get(url)).headers["ETag"]
+
+    resp = await authed_client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
+
+    await authed_client.put(url, json={"title": "Chili con carne"})
+    resp = await authed_client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.json()["title"] == "Chili con carne"
+
+async def test_list_recipes_etag(authed_client):
+    await authed_client.post("/api/recipes", json={"title": "Chili"})
+    etag = (await authed_client.get("/api/recipes")).headers["ETag"]
+    assert (await authed_client.get("/api/recipes", headers={"If-None-Match": etag})).status_code == 304
+    # Different query, different representation
+    assert (await authed_client.get("/api/recipes?q=chili", headers={"If-None-Match": etag})).status_code == 200
+
+    await authed_client.post("/api/recipes", json={"title": "Soup"})
+    assert (await authed_client.get("/api/recipes", headers={"If-None-Match": etag})).status_code == 200
+
+async def test_get_recipe_scaled_and_converted(authed_client):
+    recipe = (await authed_client.post("/api/recipes", json={
+        "title": "Pancakes",
+        "servings": "Serves 4",
+        "ingredients": [
+            {"name": "flour", "quantity": 2, "unit": "cups"},
+            {"name": "butter", "quantity": 4, "unit": "oz"},
+            {"name": "eggs", "quantity": 2},
+        ],
+    })).json()
+    url = f"/api/recipes/{recipe['id']}"
+
+    data = (await authed_client.get(f"{url}?servings=10&system=metric")).json()
+    assert data["servings"] == "Serves 10"
+    assert [(i["quantity"], i["unit"]) for i in data["ingredients"]] == [
+        (1.183, "liter"), (283.495, "gram"), (5.0, None),
+    ]
+    data = (await authed_client.get(f"{url}?scale=0.5")).json()
+    assert [(i["quantity"], i["unit"]) for i in data["ingredients"]] == [(1.0, "cups"), (2.0, "oz"), (1.0, None)]
+
+    # Each view has its own validator, and the plain recipe is untouched
+    plain = await authed_client.get(url)
+    assert plain.json() == recipe
+    scaled = await authed_client.get(f"{url}?scale=0.5")
+    assert scaled.headers["ETag"] != plain.headers["ETag"]
+    resp = await authed_client.get(f"{url}?scale=0.5", headers={"If-None-Match": scaled.headers["ETag"]})
+    assert resp.status_code == 304
+
+    assert (await authed_client.get(f"{url}?scale=2&servings=2")).status_code == 400
+    assert (await authed_client.get(f"{url}?system=imperial")).status_code == 422
@@ -0,0 +1,56 @@
+from datetime import datetime, UTC
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy import DateTime, literal, select, text
+from app.core.serialization import Serializer, dumps, json_datetime
+from app.models import Recipe, Ingredient, Tag, ShoppingList, ShoppingItem
+from app.schemas.recipe import RecipeOut
+from app.schemas.shopping import ShoppingListOut
+
+NOW = datetime(2024, 5, 1, 12, 30, tzinfo=UTC)
+
+
+def _recipe() -> Recipe:
+    return Recipe(
+        id="r1", household_id="h1", title="Soup", description=None, image_url=None, source_url=None,
+        author=None, servings="4", prep_time=None, cook_time=10, total_time=None, cuisine=None,
+        category=None, cooking_method=None, suitable_for_diet=["Vegan"], nutrition={"calories": "200"},
+        created_at=NOW, updated_at=NOW, created_by=None,
+        tags=[Tag(id="t1", household_id="h1", name="Quick", category="time", color="#fff")],
+        ingredients=[Ingredient(id="i1", name="leek", quantity=0.5, unit=None, notes=None, order=0)],
+        steps=[],
+    )
+
+
+def test_serializer_matches_pydantic_for_orm_objects():
+    adapter = TypeAdapter(RecipeOut)
+    recipe = _recipe()
+    assert Serializer(RecipeOut).dump(recipe) == adapter.dump_json(adapter.validate_python(recipe, from_attributes=True))
+
+
+def test_serializer_matches_pydantic_for_lists_and_instances():
+    lists = [
+        ShoppingList(
+            id="l1", household_id="h1", name="Week", created_at=NOW, version=3,
+            items=[ShoppingItem(id="s1", ingredient_name="milk", quantity=1.0, unit="qt",
+                                recipe_id=None, checked=True, category="Dairy")],
+        ),
+        ShoppingList(id="l2", household_id="h1", name="Party", created_at=NOW, version=1, items=[]),
+    ]
+    adapter = TypeAdapter(list[ShoppingListOut])
+    expected = adapter.dump_json(adapter.validate_python(lists))
+    serializer = Serializer(list[ShoppingListOut])
+    assert serializer.dump(lists) == expected
+    assert serializer.dump(adapter.validate_python(lists)) == expected
+
+
+async def test_json_datetime_matches_dumps(setup_db):
+    moments = [NOW, NOW.replace(microsecond=120000)]
+    async with setup_db.connect() as conn:
+        # Postgres's own rendering would follow this; the helper must not
+        await conn.execute(text("SET TIME ZONE 'America/Denver'"))
+        rendered = [
+            await conn.scalar(select(json_datetime(literal(moment, DateTime(timezone=True)))))
+            for moment in moments
+        ]
+    assert rendered == [orjson.loads(dumps(moment)) for moment in moments]
@@ -1,4 +1,10 @@
+import uuid
+from collections import OrderedDict
 import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models import Household
+from app.services import categories
 
 async def test_create_and_get_list(authed_client):
     resp = await authed_client.post("/api/shopping", json={"name": "Weekly Shop"})
@@ -39,6 +45,159 @@ async def test_toggle_item_check(authed_client):
     resp = await authed_client.patch(f"/api/shopping/{list_id}/items/{item_id}/check")
     assert resp.json()["items"][0]["checked"] is False
 
+async def test_mutations_return_delta(authed_client, setup_db):
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Weekly Shop"})).json()["id"]
+    for name in ("eggs", "milk", "bread"):
+        resp = await authed_client.post(f"/api/shopping/{list_id}/items?delta=true", json={"ingredient_name": name})
+    assert resp.status_code == 201
+    assert resp.json()["version"] == 4
+    [bread] = resp.json()["items"]
+    assert bread["ingredient_name"] == "bread" and bread["checked"] is False
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(setup_db.sync_engine, "before_cursor_execute", listener)
+    try:
+        resp = await authed_client.patch(f"/api/shopping/{list_id}/items/{bread['id']}/check?delta=true")
+    finally:
+        event.remove(setup_db.sync_engine, "before_cursor_execute", listener)
+    assert resp.json() == {"id": list_id, "version": 5, "items": [{**bread, "checked": True}], "deleted": []}
+    assert len(statements) == 4  # the current user, claiming the version, flipping the item, its event
+
+    # The delta's ETag is the one the full list now has
+    full = await authed_client.get(f"/api/shopping/{list_id}", headers={"If-None-Match": resp.headers["ETag"]})
+    assert full.status_code == 304
+
+    resp = await authed_client.patch(
+        f"/api/shopping/{list_id}/items/{bread['id']}/category?delta=true", json={"category": "Bakery"},
+    )
+    assert resp.json()["items"] == [{**bread, "checked": True, "category": "Bakery"}]
+
+async def test_mutation_on_missing_item_keeps_version(authed_client):
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Weekly Shop"})).json()["id"]
+    resp = await authed_client.patch(f"/api/shopping/{list_id}/items/nope/check?delta=true")
+    assert resp.status_code == 404
+    assert (await authed_client.get(f"/api/shopping/{list_id}")).json()["version"] == 1
+    resp = await authed_client.post("/api/shopping/nope/items?delta=true", json={"ingredient_name": "eggs"})
+    assert resp.status_code == 404
+
+async def test_changefeed(authed_client):
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Weekly Shop"})).json()["id"]
+    ids = {}
+    for name in ("eggs", "milk", "bread"):
+        resp = await authed_client.post(f"/api/shopping/{list_id}/items?delta=true", json={"ingredient_name": name})
+        ids[name] = resp.json()["items"][0]["id"]
+    assert (await authed_client.get(f"/api/shopping/{list_id}/changes?since=4")).json() == {
+        "id": list_id, "version": 4, "items": [], "deleted": [],
+    }
+
+    await authed_client.patch(f"/api/shopping/{list_id}/items/{ids['eggs']}/check")
+    resp = await authed_client.delete(f"/api/shopping/{list_id}/items/{ids['milk']}?delta=true")
+    assert resp.json() == {"id": list_id, "version": 6, "items": [], "deleted": [ids["milk"]]}
+    assert (await authed_client.delete(f"/api/shopping/{list_id}/items/{ids['milk']}")).status_code == 404
+
+    changes = (await authed_client.get(f"/api/shopping/{list_id}/changes?since=4")).json()
+    assert changes["version"] == 6
+    assert [(i["ingredient_name"], i["checked"]) for i in changes["items"]] == [("eggs", True)]
+    assert changes["deleted"] == [ids["milk"]]
+    changes = (await authed_client.get(f"/api/shopping/{list_id}/changes?since=0")).json()
+    assert [i["ingredient_name"] for i in changes["items"]] == ["bread", "eggs"]
+    assert (await authed_client.get("/api/shopping/missing/changes?since=0")).status_code == 404
+
+async def test_offline_batch(authed_client):
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Weekly Shop"})).json()["id"]
+    eggs = (await authed_client.post(f"/api/shopping/{list_id}/items", json={"ingredient_name": "eggs"})).json()["items"][0]
+    butter, jam, gone = (str(uuid.uuid4()) for _ in range(3))
+    batch = {"ops": [
+        {"op": "add", "id": butter, "ingredient_name": "butter", "quantity": 1, "unit": "lb"},
+        {"op": "check", "item_id": butter, "checked": True},
+        {"op": "check", "item_id": eggs["id"], "checked": True},
+        {"op": "add", "id": jam, "ingredient_name": "jam"},
+        {"op": "delete", "item_id": jam},
+        # Deleted by someone else meanwhile: dropped
+        {"op": "check", "item_id": gone, "checked": True},
+        {"op": "delete", "item_id": gone},
+    ]}
+    resp = await authed_client.post(f"/api/shopping/{list_id}/changes?since=2", json=batch)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["version"] == 3 and body["deleted"] == []
+    assert sorted((i["id"], i["checked"]) for i in body["items"]) == sorted([(eggs["id"], True), (butter, True)])
+
+    # Sending the batch again (say its response was lost) adds nothing twice
+    resp = await authed_client.post(f"/api/shopping/{list_id}/changes?since=3", json=batch)
+    assert resp.json()["version"] == 4
+    items = (await authed_client.get(f"/api/shopping/{list_id}")).json()["items"]
+    assert sorted((i["ingredient_name"], i["checked"]) for i in items) == [("butter", True), ("eggs", True)]
+
+    # ...nor brings back an item deleted since
+    await authed_client.delete(f"/api/shopping/{list_id}/items/{butter}")
+    resp = await authed_client.post(f"/api/shopping/{list_id}/changes?since=5", json=batch)
+    body = resp.json()
+    assert body["version"] == 6 and butter not in {i["id"] for i in body["items"]}
+    assert [i["ingredient_name"] for i in (await authed_client.get(f"/api/shopping/{list_id}")).json()["items"]] == ["eggs"]
+
+    bad = {"ops": [{"op": "rename", "item_id": eggs["id"]}]}
+    assert (await authed_client.post(f"/api/shopping/{list_id}/changes?since=6", json=bad)).status_code == 422
+    not_uuid = {"ops": [{"op": "add", "id": "tmp-1", "ingredient_name": "jam"}]}
+    assert (await authed_client.post(f"/api/shopping/{list_id}/changes?since=6", json=not_uuid)).status_code == 422
+
+async def test_offline_ids_belong_to_one_list(authed_client):
+    a = (await authed_client.post("/api/shopping", json={"name": "A"})).json()["id"]
+    b = (await authed_client.post("/api/shopping", json={"name": "B"})).json()["id"]
+    item_id = str(uuid.uuid4())
+    add = {"ops": [{"op": "add", "id": item_id, "ingredient_name": "jam"}]}
+    assert (await authed_client.post(f"/api/shopping/{a}/changes?since=1", json=add)).status_code == 200
+    # Another list's id is refused rather than silently dropped, and nothing is written
+    resp = await authed_client.post(f"/api/shopping/{b}/changes?since=1", json=add)
+    assert resp.status_code == 409
+    assert (await authed_client.get(f"/api/shopping/{b}")).json()["version"] == 1
+
+    # Tombstones are per list: B's deletion shows up in B's feed only
+    await authed_client.delete(f"/api/shopping/{a}/items/{item_id}")
+    assert (await authed_client.post(f"/api/shopping/{b}/changes?since=1", json=add)).status_code == 200
+    await authed_client.delete(f"/api/shopping/{b}/items/{item_id}")
+    assert (await authed_client.get(f"/api/shopping/{b}/changes?since=0")).json()["deleted"] == [item_id]
+    a_changes = (await authed_client.get(f"/api/shopping/{a}/changes?since=0")).json()
+    assert a_changes["deleted"] == [item_id] and a_changes["version"] == 3
+
+async def test_offline_add_drops_unknown_recipe(authed_client):
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Week"})).json()["id"]
+    deleted = (await authed_client.post("/api/recipes", json={"title": "Soup"})).json()["id"]
+    await authed_client.delete(f"/api/recipes/{deleted}")
+    resp = await authed_client.post("/api/auth/register", json={
+        "household_name": "Other", "name": "Other", "email": "other@example.com", "password": "pw123456",
+    })
+    other = await authed_client.post(
+        "/api/recipes", json={"title": "Theirs"}, headers={"Authorization": f"Bearer {resp.json()['access_token']}"},
+    )
+    kept = (await authed_client.post("/api/recipes", json={"title": "Stew"})).json()["id"]
+
+    resp = await authed_client.post(f"/api/shopping/{list_id}/changes?since=1", json={"ops": [
+        {"op": "add", "id": str(uuid.uuid4()), "ingredient_name": name, "recipe_id": recipe_id}
+        for name, recipe_id in (("leek", deleted), ("rice", other.json()["id"]), ("beef", kept))
+    ]})
+    # The items still arrive, linked only to a recipe of this household that exists
+    assert resp.status_code == 200
+    assert {i["ingredient_name"]: i["recipe_id"] for i in resp.json()["items"]} == {
+        "leek": None, "rice": None, "beef": kept,
+    }
+
+async def test_deleting_recipe_unlinks_items_through_the_changefeed(authed_client):
+    recipe_id = (await authed_client.post("/api/recipes", json={
+        "title": "Pasta", "ingredients": [{"name": "spaghetti"}, {"name": "eggs"}],
+    })).json()["id"]
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Week"})).json()["id"]
+    other_id = (await authed_client.post("/api/shopping", json={"name": "Party"})).json()["id"]
+    await authed_client.post(f"/api/shopping/{list_id}/items", json={"ingredient_name": "milk"})
+    await authed_client.post(f"/api/shopping/{list_id}/add-from-recipe", json={"recipe_id": recipe_id})
+
+    assert (await authed_client.delete(f"/api/recipes/{recipe_id}")).status_code == 204
+    changes = (await authed_client.get(f"/api/shopping/{list_id}/changes?since=3")).json()
+    assert changes["version"] == 4
+    assert sorted((i["ingredient_name"], i["recipe_id"]) for i in changes["items"]) == [("eggs", None), ("spaghetti", None)]
+    assert (await authed_client.get(f"/api/shopping/{other_id}")).json()["version"] == 1
+
 async def test_add_from_recipe(authed_client):
     recipe_resp = await authed_client.post("/api/recipes", json={
         "title": "Pasta",
@@ -111,6 +270,85 @@ async def test_add_from_recipe_combines_same_ingredient(authed_client):
     assert butter_items[0]["unit"] == "cup"
 
 
+async def test_add_from_recipe_combines_within_recipe(authed_client):
+    recipe = await authed_client.post("/api/recipes", json={
+        "title": "Layer Cake",
+        "ingredients": [
+            {"name": "Sugar", "quantity": 1.0, "unit": "cup"},
+            {"name": "sugar", "quantity": 4.0, "unit": "tbsp"},
+            {"name": "sugar", "quantity": 50.0, "unit": "g"},
+            {"name": "saffron", "quantity": 1.0, "unit": "tsp"},
+            {"name": "saffron", "quantity": 0.5, "unit": "g"},
+        ],
+    })
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Bake"})).json()["id"]
+    resp = await authed_client.post(f"/api/shopping/{list_id}/add-from-recipe", json={"recipe_id": recipe.json()["id"]})
+    items = sorted((i["ingredient_name"], i["unit"], i["quantity"]) for i in resp.json()["items"])
+    # Sugar has a known density, so its weight joins the volume; saffron's doesn't
+    assert items == [
+        ("Sugar", "pint", pytest.approx(0.75, rel=1e-2)), ("saffron", "g", 0.5), ("saffron", "tsp", 1.0),
+    ]
+
+async def test_add_from_recipes_meal_plan(authed_client):
+    tacos = (await authed_client.post("/api/recipes", json={
+        "title": "Tacos",
+        "ingredients": [{"name": "onion", "quantity": 1.0}, {"name": "cumin", "quantity": 1.0, "unit": "tsp"}],
+    })).json()
+    chili = (await authed_client.post("/api/recipes", json={
+        "title": "Chili",
+        "ingredients": [{"name": "cumin", "quantity": 1.0, "unit": "tbsp"}, {"name": "beans", "quantity": 2.0, "unit": "can"}],
+    })).json()
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Week"})).json()["id"]
+    await authed_client.post(f"/api/shopping/{list_id}/items", json={"ingredient_name": "Beans", "quantity": 1.0, "unit": "can"})
+
+    resp = await authed_client.post(f"/api/shopping/{list_id}/add-from-recipes", json={"recipes": [
+        {"recipe_id": tacos["id"], "scale": 2},
+        {"recipe_id": chili["id"]},
+        {"recipe_id": tacos["id"], "ingredient_ids": [tacos["ingredients"][1]["id"]]},
+    ]})
+    assert resp.status_code == 200
+    body = resp.json()
+    items = {i["ingredient_name"]: (i["quantity"], i["unit"], i["recipe_id"]) for i in body["items"]}
+    assert items["onion"] == (2.0, None, tacos["id"])
+    # 2 tsp + 1 tbsp + 1 tsp = 2 tbsp = 1 fl oz
+    assert items["cumin"][:2] == (pytest.approx(1.0, rel=1e-2), "fluid_ounce")
+    assert items["Beans"] == (3.0, "can", None)
+    assert len(body["items"]) == 3
+    assert body["version"] == 3
+
+    resp = await authed_client.post(f"/api/shopping/{list_id}/add-from-recipes", json={"recipes": [
+        {"recipe_id": tacos["id"]}, {"recipe_id": "missing"},
+    ]})
+    assert resp.status_code == 404
+    assert len((await authed_client.get(f"/api/shopping/{list_id}")).json()["items"]) == 3
+
+    # A delta carries only the items the add touched
+    resp = await authed_client.post(f"/api/shopping/{list_id}/add-from-recipes?delta=true", json={"recipes": [
+        {"recipe_id": tacos["id"]},
+    ]})
+    body = resp.json()
+    assert body["version"] == 4
+    assert sorted((i["ingredient_name"], i["quantity"]) for i in body["items"]) == [
+        ("cumin", pytest.approx(7 / 6, rel=1e-2)), ("onion", 1.0),  # unitless onions get a line of their own
+    ]
+
+async def test_add_from_recipes_large_plan(authed_client):
+    # 4,000 new items: more rows than fit in one statement's bind parameters
+    recipes = [
+        (await authed_client.post("/api/recipes", json={
+            "title": f"Feast {r}",
+            "ingredients": [{"name": f"item {r}-{i}", "quantity": 1.0, "unit": "g"} for i in range(400)],
+        })).json()["id"]
+        for r in range(10)
+    ]
+    list_id = (await authed_client.post("/api/shopping", json={"name": "Banquet"})).json()["id"]
+    resp = await authed_client.post(
+        f"/api/shopping/{list_id}/add-from-recipes?delta=true",
+        json={"recipes": [{"recipe_id": recipe_id} for recipe_id in recipes]},
+    )
+    assert resp.status_code == 200
+    assert len(resp.json()["items"]) == 4000
+
 async def test_delete_list(authed_client):
     resp = await authed_client.post("/api/shopping", json={"name": "Temp"})
     list_id = resp.json()["id"]
@@ -120,3 +358,113 @@ async def test_delete_list(authed_client):
 
     resp = await authed_client.get(f"/api/shopping/{list_id}")
     assert resp.status_code == 404
+
+
+async def test_list_shopping_lists_cursor_pagination(authed_client):
+    for name in ("A", "B", "C"):
+        await authed_client.post("/api/shopping", json={"name": name})
+
+    first = await authed_client.get("/api/shopping", params={"limit": 2})
+    assert [l["name"] for l in first.json()] == ["C", "B"]
+    second = await authed_client.get("/api/shopping", params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    assert [l["name"] for l in second.json()] == ["A"]
+    assert "X-Next-Cursor" not in second.headers
+
+
+async def test_list_shopping_lists_summary(authed_client):
+    lists = [(await authed_client.post("/api/shopping", json={"name": name})).json() for name in ("Old", "Empty", "New")]
+    for name in ("eggs", "milk", "bread"):
+        await authed_client.post(f"/api/shopping/{lists[2]['id']}/items", json={"ingredient_name": name})
+    items = (await authed_client.post(f"/api/shopping/{lists[0]['id']}/items", json={"ingredient_name": "jam"})).json()["items"]
+    await authed_client.patch(f"/api/shopping/{lists[0]['id']}/items/{items[0]['id']}/check")
+
+    first = await authed_client.get("/api/shopping", params={"view": "summary", "limit": 2})
+    assert [(l["name"], l["item_count"], l["checked_count"], l["version"]) for l in first.json()] == [
+        ("New", 3, 0, 4), ("Empty", 0, 0, 1),
+    ]
+    assert "items" not in first.json()[0]
+    second = await authed_client.get(
+        "/api/shopping", params={"view": "summary", "limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+    )
+    [old] = second.json()
+    assert (old["id"], old["item_count"], old["checked_count"]) == (lists[0]["id"], 1, 1)
+    # Summaries and full lists are cached separately
+    etag = first.headers["ETag"]
+    full = await authed_client.get("/api/shopping", params={"limit": 2}, headers={"If-None-Match": etag})
+    assert full.status_code == 200 and len(full.json()[0]["items"]) == 3
+    # The summary's fields are written exactly as the full list's
+    shared = ("id", "name", "created_at", "version")
+    assert [full.json()[0][key] for key in shared] == [first.json()[0][key] for key in shared]
+
+
+async def test_get_list_etag(authed_client):
+    sl = (await authed_client.post("/api/shopping", json={"name": "Weekly"})).json()
+    assert sl["version"] == 1
+    resp = await authed_client.get(f"/api/shopping/{sl['id']}")
+    etag = resp.headers["ETag"]
+
+    resp = await authed_client.get(f"/api/shopping/{sl['id']}", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+    resp = await authed_client.post(f"/api/shopping/{sl['id']}/items", json={"ingredient_name": "milk"})
+    assert resp.json()["version"] == 2
+    item_id = resp.json()["items"][0]["id"]
+    resp = await authed_client.patch(f"/api/shopping/{sl['id']}/items/{item_id}/check")
+    assert resp.json()["version"] == 3
+
+    resp = await authed_client.get(f"/api/shopping/{sl['id']}", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+
+
+async def test_list_shopping_lists_etag(authed_client):
+    await authed_client.post("/api/shopping", json={"name": "A"})
+    etag = (await authed_client.get("/api/shopping")).headers["ETag"]
+    assert (await authed_client.get("/api/shopping", headers={"If-None-Match": etag})).status_code == 304
+
+    await authed_client.post("/api/shopping", json={"name": "B"})
+    assert (await authed_client.get("/api/shopping", headers={"If-None-Match": etag})).status_code == 200
+
+async def test_recategorized_item_teaches_household(authed_client, setup_db):
+    first = (await authed_client.post("/api/shopping", json={"name": "Week 1"})).json()["id"]
+    items = (await authed_client.post(f"/api/shopping/{first}/items", json={"ingredient_name": "Pepper Jack"})).json()["items"]
+    assert items[0]["category"] == "Produce"  # "pepper"
+
+    resp = await authed_client.patch(
+        f"/api/shopping/{first}/items/{items[0]['id']}/category", json={"category": "Dairy & Eggs"},
+    )
+    assert resp.status_code == 200
+    assert resp.json()["items"][0]["category"] == "Dairy & Eggs"
+
+    second = (await authed_client.post("/api/shopping", json={"name": "Week 2"})).json()["id"]
+    items = (await authed_client.post(f"/api/shopping/{second}/items", json={"ingredient_name": "pepper jack"})).json()["items"]
+    assert items[0]["category"] == "Dairy & Eggs"
+
+    # A 200-ingredient recipe is categorized with a fixed number of queries
+    recipe = await authed_client.post("/api/recipes", json={
+        "title": "Party",
+        "ingredients": [{"name": "Pepper Jack"}] + [{"name": f"item {i}"} for i in range(199)],
+    })
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(setup_db.sync_engine, "before_cursor_execute", listener)
+    try:
+        resp = await authed_client.post(f"/api/shopping/{second}/add-from-recipe", json={"recipe_id": recipe.json()["id"]})
+    finally:
+        event.remove(setup_db.sync_engine, "before_cursor_execute", listener)
+    categories = {i["ingredient_name"]: i["category"] for i in resp.json()["items"]}
+    assert categories["pepper jack"] == "Dairy & Eggs" and categories["item 7"] == "Other"
+    assert len(statements) < 15
+
+async def test_household_overrides_cache_keeps_recent_households(setup_db, monkeypatch):
+    monkeypatch.setattr(categories, "_overrides", OrderedDict())
+    monkeypatch.setattr(categories, "_MAX_HOUSEHOLDS", 2)
+    async with AsyncSession(setup_db) as db:
+        first, second, third = households = [Household(name=f"H{i}") for i in range(3)]
+        db.add_all(households)
+        await db.flush()
+        for household in (first, second, first, third):
+            await categories._household_overrides(db, household.id)
+    # The least recently used household is the one dropped
+    assert list(categories._overrides) == [first.id, third.id]
@@ -34,3 +34,19 @@ async def test_assign_tag_to_recipe(authed_client):
     tags = recipe_resp.json()["tags"]
     assert len(tags) == 1
     assert tags[0]["name"] == "Italian"
+
+
+async def test_list_tags_etag(authed_client):
+    recipe = (await authed_client.post("/api/recipes", json={"title": "Soup"})).json()
+    etag = (await authed_client.get("/api/tags")).headers["ETag"]
+    assert (await authed_client.get("/api/tags", headers={"If-None-Match": etag})).status_code == 304
+
+    await authed_client.put(f"/api/tags/recipes/{recipe['id']}", json=[{"name": "Winter"}])
+    resp = await authed_client.get("/api/tags", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert [t["name"] for t in resp.json()] == ["Winter"]
+
+    # Re-using an existing tag leaves the tag list, and its ETag, unchanged
+    etag = resp.headers["ETag"]
+    await authed_client.put(f"/api/tags/recipes/{recipe['id']}", json=[{"name": "Winter"}])
+    assert (await authed_client.get("/api/tags", headers={"If-None-Match": etag})).status_code == 304
@@ -0,0 +1,21 @@
+from app.utils.terms import ingredient_term
+
+
+def test_ingredient_term_lowercases_and_singularizes():
+    assert ingredient_term("Shallots") == "shallot"
+
+def test_ingredient_term_drops_descriptors_and_notes():
+    assert ingredient_term("Fresh Thyme, chopped") == "thyme"
+
+def test_ingredient_term_drops_parentheticals():
+    assert ingredient_term("tomatoes (canned)") == "tomato"
+
+def test_ingredient_term_y_plural():
+    assert ingredient_term("cherries") == "cherry"
+
+def test_ingredient_term_keeps_non_plural_s():
+    assert ingredient_term("asparagus") == "asparagus"
+
+def test_ingredient_term_empty():
+    assert ingredient_term("") is None
+    assert ingredient_term("to taste") is None
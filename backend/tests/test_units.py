@@ -4,6 +4,10 @@ from app.utils.units import (
     normalize_unit,
     format_quantity,
     try_combine,
+    servings_count,
+    scale_servings,
+    parse_ingredient_line,
+    parse_many,
 )
 
 
@@ -105,6 +109,59 @@ def test_combine_non_convertible_same_unit():
     assert qty == pytest.approx(5.0)
     assert unit == "clove"
 
+def test_combine_volume_and_weight_with_density():
+    # 1 cup flour (236.6 ml) + 200 g flour (377.4 ml at 0.53 g/ml), in the existing volume
+    qty, unit = try_combine(1.0, "cup", 200.0, "g", ingredient="all-purpose flour")
+    assert qty == pytest.approx(1.3, rel=1e-2)
+    assert unit == "pint"
+    qty, unit = try_combine(200.0, "g", 1.0, "cup", ingredient="flour")
+    assert qty == pytest.approx(325.4 / 453.592, rel=1e-2)
+    assert unit == "pound"
+
+def test_combine_volume_and_weight_unknown_density():
+    assert try_combine(1.0, "cup", 200.0, "g", ingredient="mystery spice") is None
+
 def test_combine_non_convertible_different_units():
     # "can" vs "clove" → not combinable
     assert try_combine(1.0, "can", 2.0, "clove") is None
+
+
+# ── servings ──────────────────────────────────────────────────────────────────
+
+def test_scale_servings():
+    assert servings_count("Serves 6-8") == 6
+    assert scale_servings("Serves 4-6", 1.5) == "Serves 6-9"
+    assert scale_servings("4", 0.5) == "2"
+    assert scale_servings(None, 2) is None
+
+
+# ── parse_ingredient_line ─────────────────────────────────────────────────────
+
+def test_parse_ingredient_line_basic():
+    assert parse_ingredient_line("2 cups flour") == ("flour", 2.0, "cups", None)
+
+def test_parse_ingredient_line_unicode_fractions():
+    assert parse_ingredient_line("1½ cups milk")[1] == pytest.approx(1.5)
+    assert parse_ingredient_line("⅓ cup honey")[1] == pytest.approx(1 / 3)
+
+def test_parse_ingredient_line_range_keeps_upper_bound():
+    assert parse_ingredient_line("2-3 cups broth") == ("broth", 3.0, "cups", None)
+    assert parse_ingredient_line("1 to 2 tbsp oil") == ("oil", 2.0, "tbsp", None)
+
+def test_parse_ingredient_line_parenthetical_size_and_notes():
+    assert parse_ingredient_line("1 (14.5 oz) can diced tomatoes, drained") == (
+        "diced tomatoes", 1.0, "can", "14.5 oz; drained",
+    )
+
+def test_parse_ingredient_line_unit_needs_word_boundary():
+    # "l" and "g" are units only on their own
+    assert parse_ingredient_line("2 large eggs") == ("large eggs", 2.0, None, None)
+    assert parse_ingredient_line("3 green onions") == ("green onions", 3.0, None, None)
+
+def test_parse_ingredient_line_without_name_keeps_amount():
+    assert parse_ingredient_line(" 1½ cups ") == ("1½ cups", 1.5, "cups", None)
+    assert parse_ingredient_line("3") == ("3", 3.0, None, None)
+
+def test_parse_many_returns_fresh_objects():
+    first, second = parse_many(["1 egg", "1 egg"])
+    assert first == second and first is not second
@@ -5,10 +5,10 @@ import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import { api } from "@/lib/api";
 
-interface ShoppingList {
+interface ShoppingListSummary {
   id: string;
   name: string;
-  items: unknown[];
+  item_count: number;
 }
 
 interface Props {
@@ -22,9 +22,9 @@ export default function AddToListDialog({ open, onOpenChange, recipeId, ingredie
   const qc = useQueryClient();
   const [newName, setNewName] = useState("");
 
-  const { data: lists } = useQuery<ShoppingList[]>({
+  const { data: lists } = useQuery<ShoppingListSummary[]>({
     queryKey: ["shopping-lists"],
-    queryFn: () => api.get("/shopping").then((r) => r.data),
+    queryFn: () => api.get("/shopping", { params: { view: "summary" } }).then((r) => r.data),
     enabled: open,
   });
 
@@ -76,7 +76,7 @@ export default function AddToListDialog({ open, onOpenChange, recipeId, ingredie
               disabled={addToList.isPending}
             >
               {list.name}
-              <span className="ml-auto text-xs text-zinc-400">{(list.items as unknown[]).length} items</span>
+              <span className="ml-auto text-xs text-zinc-400">{list.item_count} items</span>
             </Button>
           ))}
           {lists?.length === 0 && (
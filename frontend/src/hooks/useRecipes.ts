@@ -118,6 +118,7 @@ export function useRecipe(id: string) {
 }
 
 export interface IngredientIn {
+  id?: string;
   name: string;
   quantity: number | null;
   unit: string | null;
@@ -126,6 +127,7 @@ export interface IngredientIn {
 }
 
 export interface StepIn {
+  id?: string;
   title: string | null;
   description: string;
   order: number;
@@ -19,10 +19,20 @@ export interface ShoppingList {
   items: ShoppingItem[];
 }
 
+// Index-page entry: counts only; the items load when the list is opened
+export interface ShoppingListSummary {
+  id: string;
+  name: string;
+  created_at: string;
+  version: number;
+  item_count: number;
+  checked_count: number;
+}
+
 export function useShoppingLists() {
-  return useQuery<ShoppingList[]>({
+  return useQuery<ShoppingListSummary[]>({
     queryKey: ["shopping-lists"],
-    queryFn: () => api.get("/shopping").then((r) => r.data),
+    queryFn: () => api.get("/shopping", { params: { view: "summary" } }).then((r) => r.data),
   });
 }
 
@@ -14,6 +14,7 @@ import { Skeleton } from "@/components/ui/skeleton";
 
 interface IngRow {
   _key: string;
+  id?: string;
   quantity: string;
   unit: string;
   name: string;
@@ -22,6 +23,7 @@ interface IngRow {
 
 interface StepRow {
   _key: string;
+  id?: string;
   title: string;
   description: string;
   timer_minutes: string;
@@ -54,6 +56,7 @@ function recipeToState(recipe: Recipe) {
       .sort((a, b) => a.order - b.order)
       .map((ing) => ({
         _key: crypto.randomUUID(),
+        id: ing.id,
         quantity: ing.quantity?.toString() ?? "",
         unit: ing.unit ?? "",
         name: ing.name,
@@ -64,6 +67,7 @@ function recipeToState(recipe: Recipe) {
       .sort((a, b) => a.order - b.order)
       .map((step) => ({
         _key: crypto.randomUUID(),
+        id: step.id,
         title: step.title ?? "",
         description: step.description,
         timer_minutes: step.timer_seconds ? String(Math.round(step.timer_seconds / 60)) : "",
@@ -89,6 +93,7 @@ function stateToRecipeIn(state: ReturnType<typeof defaultState>, tag_ids: string
     ingredients: state.ingredients
       .filter((ing) => ing.name.trim())
       .map((ing, i) => ({
+        id: ing.id,
         name: ing.name.trim(),
         quantity: num(ing.quantity),
         unit: ing.unit.trim() || null,
@@ -98,6 +103,7 @@ function stateToRecipeIn(state: ReturnType<typeof defaultState>, tag_ids: string
     steps: state.steps
       .filter((step) => step.description.trim())
       .map((step, i) => ({
+        id: step.id,
         title: step.title.trim() || null,
         description: step.description.trim(),
         timer_seconds: step.timer_minutes ? Math.round(parseFloat(step.timer_minutes) * 60) : null,
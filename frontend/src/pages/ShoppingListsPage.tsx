@@ -55,7 +55,7 @@ export default function ShoppingListsPage() {
       ) : (
         <div className="space-y-3">
           {lists?.map((list) => {
-            const checkedCount = list.items.filter((i) => i.checked).length;
+            const checkedCount = list.checked_count;
             return (
               <Card key={list.id} className="hover:shadow-md transition-shadow">
                 <CardContent className="flex items-center justify-between p-4">
@@ -64,7 +64,7 @@ export default function ShoppingListsPage() {
                     <div className="min-w-0">
                       <p className="font-bold text-zinc-900 truncate">{list.name}</p>
                       <p className="text-xs text-zinc-400">
-                        {list.items.length} items
+                        {list.item_count} items
                         {checkedCount > 0 && ` · ${checkedCount} checked`}
                       </p>
                     </div>